@@ -0,0 +1,51 @@
+lexer grammar ExprLexerTabla;
+
+// Variante del lexer de Expr.g4 sin una regla por palabra clave: cada palabra
+// se reconoce una sola vez como ID y keyword_lexer.py la clasifica buscando su
+// texto en una tabla. Los números de token vienen de Expr.tokens, así que
+// ExprParser acepta los tokens de los dos lexers.
+// Generar junto con la gramática principal:
+//   antlr4 -Dlanguage=Python3 -visitor Expr.g4 ExprLexerTabla.g4
+
+options { tokenVocab = Expr; }
+
+// ==============================================================
+// LEXER REGLAS
+// ==============================================================
+
+// Literales
+NUMERO: [0-9]+ ('.' [0-9]+)?;
+TEXTO: '"' ( ~["\\\r\n] | '\\' . )* '"';
+
+// Identificadores, palabras clave y 'verdad' / 'falso'
+ID: [a-zA-Z][a-zA-Z0-9_]*;
+
+// Operadores y símbolos
+ASIGN: '=';
+POTENCIA: '^';
+IGUAL: '==';
+DIF: '!=';
+MEN_IGUAL: '<=';
+MAY_IGUAL: '>=';
+MENOR: '<';
+MAYOR: '>';
+Y: '&&';
+O: '||';
+NOT: '!';
+SUMA: '+';
+RESTA: '-';
+MULT: '*';
+DIV: '/';
+MOD: '%';
+
+PAR_IZQ: '(';
+PAR_DER: ')';
+LLAVE_IZQ: '{';
+LLAVE_DER: '}';
+PUNTOCOMA: ';';
+COMA: ',';
+
+// Espacios y comentarios
+WS: [ \t\r\n]+ -> skip;
+COMENTARIO: '//' ~[\r\n]* -> skip;
+COMENT_BLOQUE: '/*' .*? '*/' -> skip;
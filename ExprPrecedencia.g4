@@ -0,0 +1,115 @@
+parser grammar ExprPrecedencia;
+
+// Variante del parser de Expr.g4 con las expresiones en una sola regla de
+// precedencia: Expr.g4 pasa cada literal por doce contextos anidados
+// (expr -> asignacion -> logicaOr -> ... -> llamada -> primary), aquí por dos
+// (expr -> operacion). ANTLR reescribe la recursión izquierda de 'operacion' en
+// un bucle de precedencia: la alternativa que aparece primero liga más fuerte.
+// Acepta el mismo lenguaje y precedence_parser.py construye el mismo AST.
+// Las reglas hasta 'sentencia' están en el mismo orden que en Expr.g4 para
+// que los índices de regla (ASTBuilder.visitProg los compara) coincidan.
+// Generar junto con la gramática principal:
+//   antlr4 -Dlanguage=Python3 -visitor Expr.g4 ExprLexerTabla.g4 ExprPrecedencia.g4
+
+options { tokenVocab = Expr; }
+
+// ==============================================================
+// PARSER REGLAS
+// ==============================================================
+
+prog
+    : PROGRAMA ID LLAVE_IZQ 
+        ( 
+            declaracion_global* funciones? bloque_programa 
+            | declaracion_global* bloque_programa funciones? 
+        ) 
+      LLAVE_DER EOF
+    ;
+
+declaracion
+    : tipo ID (ASIGN expr)? PUNTOCOMA       #declaracionSimple
+    | VAR ID (ASIGN expr)? PUNTOCOMA          #declaracionInferida
+    ;
+
+
+declaracion_global
+    : tipo ID (ASIGN expr)? PUNTOCOMA   #declaracionGlobalSimple
+    ;
+
+
+funciones
+    : 'funciones' LLAVE_IZQ funcion* LLAVE_DER
+    ;
+
+bloque_programa
+    : INICIO bloque FIN
+    ;
+
+bloque
+    : LLAVE_IZQ sentencia* LLAVE_DER
+    ;
+
+funcion
+    : (tipo | VOID) ID PAR_IZQ params PAR_DER bloque  #funcionDef
+    ;
+
+params
+    : param (COMA param)*     #parametros
+    | /* vacío */             #sinParametros
+    ;
+
+param
+    : tipo ID                  #paramSimple
+    ;
+
+sentencia
+    : declaracion                                                          #declaracionSentencia
+    | expr PUNTOCOMA                                                       #exprSentencia
+    | bloque                                                               #bloqueSentencia
+    | SI PAR_IZQ expr PAR_DER sentencia (SINO sentencia)?                  #siSentencia
+    | PARA PAR_IZQ (declaracion | expr PUNTOCOMA) expr? PUNTOCOMA expr? PAR_DER sentencia  #paraSentencia
+    | MIENTRAS PAR_IZQ expr PAR_DER sentencia                              #mientrasSentencia
+    | HACER sentencia MIENTRAS PAR_IZQ expr PAR_DER PUNTOCOMA              #hacerMientrasSentencia
+    | RET expr? PUNTOCOMA                                                  #retornarSentencia
+    | PINTAR PAR_IZQ args? PAR_DER PUNTOCOMA                               #pintarSentencia
+    ;
+
+// ---------------------------------------------------------------------
+// Expresiones: una regla de precedencia, de mayor a menor
+// ---------------------------------------------------------------------
+
+// La asignación sólo puede encabezar una expresión (o ir entre paréntesis),
+// como en Expr.g4: 'a + b = 1' sigue siendo un error de sintaxis
+expr
+    : ID ASIGN expr                                                   #asignacionExp
+    | operacion                                                       #soloExp
+    ;
+
+operacion
+    : operacion PAR_IZQ args? PAR_DER                                 #llamadaFuncion
+    | (NOT | SUMA | RESTA) operacion                                  #opUnario
+    | <assoc=right> operacion POTENCIA operacion                      #opPotencia
+    | operacion (MULT | DIV | MOD) operacion                          #opMultDiv
+    | operacion (SUMA | RESTA) operacion                              #opSumaResta
+    | operacion (MENOR | MAYOR | MEN_IGUAL | MAY_IGUAL) operacion     #opComparacion
+    | operacion (IGUAL | DIF) operacion                               #opIgualdadDiferencia
+    | operacion Y operacion                                           #opLogicaAND
+    | operacion O operacion                                           #opLogicaOR
+    | PAR_IZQ expr PAR_DER                                            #parentesis
+    | NUMERO                                                          #numero
+    | BOOL_LIT                                                        #booleano
+    | TEXTO                                                           #texto
+    | ID                                                              #variable
+    ;
+
+args
+    : expr (COMA expr)*            #argumentos
+    ;
+
+tipo
+    : ENTERO    #tipoEntero
+    | DECIMAL   #tipoDecimal
+    | BOOL      #tipoBool
+    | CADENA    #tipoCadena
+    | VOID      #tipoVoid
+    ;
\ No newline at end of file
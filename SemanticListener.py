@@ -1,51 +1,66 @@
 from antlr4 import *
 from ExprParser import ExprParser
 from ExprListener import ExprListener
-from collections import deque
+from symbol_table import SymbolTable
 
 class SemanticError(Exception):
     pass
 
-#TABLA DE SIMBOLOS VARIABLES Y FUNCIONES
-class Scope:
-    def __init__(self):
-        self.variables = {}  # name -> { tipo, "usadas": False}
-        self.functions = {}
-
 #MANEJO DE LA SEMANTICA DE FUNCIONES ERRORES TIPOS FUNCIONES.
 class SemanticListener(ExprListener):
-    def __init__(self):
-        self.scopes = deque([Scope()])
+    def __init__(self, check_unused_functions=True):
+        #TABLA DE SIMBOLOS VARIABLES Y FUNCIONES
+        self.symbols = SymbolTable()  # name -> {"type", "assigned", "read", "ctx"}
+        self.functions = {}           # name -> (tipo_retorno, [(param, tipo)])
+        self.function_lines = {}      # name -> línea de su definición (funciones definidas aquí)
         self.current_function_return_type = None
         self.errors = []
         self.warnings = []
         self.called_functions = set() #name funciones
         self.has_return = True
+        self.expr_types = {}  # contexto -> tipo inferido (memo)
+        self.check_unused_functions = check_unused_functions
+
+    #PREDECLARACION PARA ANALISIS POR PARTES
+    #Firmas y globales definidas fuera del fragmento que se va a recorrer
+    def predeclare(self, functions=None, globals=None):
+        self.functions.update(functions or {})
+        for name, tipo in (globals or {}).items():
+            self.symbols.declare(name, {"type": tipo, "assigned": True, "read": True, "ctx": None})
 
 
     #CONTROL DE AMBITOS MANEJO DE PILA SCOPES
     def enterBloque(self, ctx: ExprParser.BloqueContext):
-        self.scopes.append(Scope())
+        self.symbols.enter_scope()
 
     def exitBloque(self, ctx: ExprParser.BloqueContext):
-        scope = self.scopes.pop()
+        self._exit_scope(ctx)
+
+    def exitFuncionDef(self, ctx: ExprParser.FuncionDefContext):
+        # Cerrar el ámbito de los parámetros abierto en enterFuncionDef
+        self._exit_scope(ctx)
+
+    def exitProg(self, ctx: ExprParser.ProgContext):
+        # Al salir del programa ya se conocen todas las llamadas
+        if self.check_unused_functions:
+            self.warn_unused_functions()
 
+    def warn_unused_functions(self):
+        for name, line in self.function_lines.items():
+            if name not in self.called_functions:
+                self._warn_line(line, f"Función '{name}' fue definida pero nunca llamada.")
 
+    def _exit_scope(self, ctx):
+        scope = self.symbols.exit_scope()
 
         # Advertencia por variables no usadas
-        for name, meta in scope.variables.items():
+        for name, meta in scope.items():
             msg_ctx = meta.get("ctx", ctx)  # usar contexto de declaración si está
             if not meta.get("read", False) and not meta.get("assigned", False):
                 self._warn(msg_ctx, f"Variable '{name}' fue declarada pero nunca utilizada.")
             elif meta.get("assigned", False) and not meta.get("read", False):
                 self._warn(msg_ctx, f"Variable '{name}' fue asignada pero nunca leída.")
 
-        # Si estamos saliendo del bloque global (es el primero en salir)
-        if len(self.scopes) == 0:
-            for name in scope.functions:
-                if name not in self.called_functions:
-                    self._warn(ctx, f"Función '{name}' fue definida pero nunca llamada.")
-    
 
     def _has_guaranteed_return(self, ctx):
         """
@@ -84,13 +99,10 @@ class SemanticListener(ExprListener):
     #LLamar a las funciones
     def _check_function_call(self, ctx, name, args):
         # Verifica si la función existe
-        for scope in reversed(self.scopes):
-            if name in scope.functions:
-                return_type, expected_params = scope.functions[name]
-                break
-        else:
+        if name not in self.functions:
             self._error(ctx, f"Función '{name}' no definida.")
             return "entero"
+        return_type, expected_params = self.functions[name]
 
         # Verifica número de argumentos
         if len(args) != len(expected_params):
@@ -109,11 +121,10 @@ class SemanticListener(ExprListener):
     #declaracion de funciones
     def enterFuncionDef(self, ctx: ExprParser.FuncionDefContext):
         self.has_return = False  # ← asumimos que no hay retorno aún
-        scope = self.scopes[-1]
         name = ctx.ID().getText()
         return_type = ctx.tipo().getText().lower() if ctx.tipo() else "void"
 
-        if name in scope.functions:
+        if name in self.functions:
             self._error(ctx, f"Función '{name}' ya fue definida.")
 
         params = []
@@ -124,9 +135,10 @@ class SemanticListener(ExprListener):
                 ident = p.ID().getText()
                 params.append((ident, tipo))
 
-        scope.functions[name] = (return_type, params)
+        self.functions[name] = (return_type, params)
+        self.function_lines.setdefault(name, ctx.start.line)
         self.current_function_return_type = return_type
-        self.scopes.append(Scope())
+        self.symbols.enter_scope()
         for ident, tipo in params:
             self._declare_variable(ctx, ident, tipo)
 
@@ -138,6 +150,23 @@ class SemanticListener(ExprListener):
         self._declare_variable(ctx, ident, tipo)
 
 
+    #LECTURAS Y LLAMADAS
+    #Sólo declaraciones, asignaciones, pintar, ret y argumentos infieren tipos;
+    #las condiciones, las expresiones sueltas y los inicializadores globales no.
+    #Cada variable y cada llamada se registra al recorrerla, esté donde esté.
+    def exitVariable(self, ctx: ExprParser.VariableContext):
+        llamada = ctx.parentCtx
+        if isinstance(llamada, ExprParser.LlamadaFuncionContext) and llamada.getChildCount() > 1:
+            return  # es el nombre de la función llamada
+        meta = self.symbols.lookup(ctx.ID().getText())
+        if meta is not None:
+            meta["read"] = True
+
+    def exitLlamadaFuncion(self, ctx: ExprParser.LlamadaFuncionContext):
+        if ctx.getChildCount() > 1 and isinstance(ctx.primary(), ExprParser.VariableContext):
+            self.called_functions.add(ctx.primary().ID().getText())
+
+
     #DECLARACION CON TIPO EXPLICITO
     def exitDeclaracionSimple(self, ctx: ExprParser.DeclaracionSimpleContext):
         tipo = ctx.tipo().getText().lower()  # Tipo de la variable
@@ -149,8 +178,7 @@ class SemanticListener(ExprListener):
             self._error(ctx, f"Tipo incompatible en inicialización de '{ident}': declarado '{tipo}', pero la expresión es '{expr_type}'.")
 
         # Verificar si la declaración termina con un punto y coma
-        declaration_text = ctx.getText().strip()  # Obtener el texto completo de la declaración
-        if not declaration_text.endswith(";"):
+        if not self._termina_en_punto_y_coma(ctx):
             self._error(ctx, f"Falta el punto y coma ';' al final de la declaración de '{ident}'.")
 
         # Declarar la variable después de la verificación
@@ -158,10 +186,7 @@ class SemanticListener(ExprListener):
 
         # Si hay inicialización, marcarla como asignada
         if ctx.expr():  # Si hay inicialización
-            for scope in reversed(self.scopes):
-                if ident in scope.variables:
-                    scope.variables[ident]["assigned"] = True
-                    break
+            self.symbols.lookup(ident)["assigned"] = True
 
     def exitDeclaracionInferida(self, ctx: ExprParser.DeclaracionInferidaContext):
         ident = ctx.ID().getText()
@@ -179,10 +204,9 @@ class SemanticListener(ExprListener):
             self._error(ctx, f"Tipo incompatible en asignación a '{name}': esperado '{var_type}', encontrado '{expr_type}'.")
 
         # Marcar que fue asignada (independientemente del tipo)
-        for scope in reversed(self.scopes):
-            if name in scope.variables:
-                scope.variables[name]["assigned"] = True
-                break
+        meta = self.symbols.lookup(name)
+        if meta is not None:
+            meta["assigned"] = True
 
     def exitPintarSentencia(self, ctx: ExprParser.PintarSentenciaContext):
         # Procesar las expresiones dentro de la sentencia
@@ -191,9 +215,7 @@ class SemanticListener(ExprListener):
                 self._infer_expr_type(expr)
 
         # Verificar si la sentencia termina con un punto y coma
-        # Aquí verificamos que la sentencia completa de 'pintar' termine con ';'
-        sentencia_text = ctx.getText().strip()  # Obtener el texto de la sentencia
-        if not sentencia_text.endswith(";"):
+        if not self._termina_en_punto_y_coma(ctx):
             self._error(ctx, "Falta el punto y coma ';' al final de la sentencia 'pintar'.")
 
     #RETORNOS DE FUNCIONES
@@ -215,119 +237,139 @@ class SemanticListener(ExprListener):
     #Declaracion de variables en el scope actual
     #Aqui utilizamos la tabla en las declaraciones
     def _declare_variable(self, ctx, name, tipo):
-        current_scope = self.scopes[-1]
-
         # Error si ya fue declarada en el mismo ámbito
-        if name in current_scope.variables:
+        if self.symbols.lookup_local(name) is not None:
             self._error(ctx, f"Variable '{name}' ya fue declarada en este ámbito.")
 
-        # Advertencia si está declarada en un scope exterior (sombreado)
-        for scope in list(self.scopes)[:-1]:  # revisa scopes exteriores
-            if name in scope.variables:
-                self._warn(ctx, f"Variable '{name}' en este bloque oculta una declaración anterior en un ámbito externo.")
-                break
-
         # Registrar la nueva variable
-        current_scope.variables[name] = {
+        shadowed = self.symbols.declare(name, {
             "type": tipo,
             "assigned": False,
             "read": False,
             "ctx": ctx
-        }
+        })
+
+        # Advertencia si está declarada en un scope exterior (sombreado)
+        if shadowed is not None:
+            self._warn(ctx, f"Variable '{name}' en este bloque oculta una declaración anterior en un ámbito externo.")
 
     #RESOLUCION DE LAS VARIABLES
     #lectura o validacion
     def _resolve_variable_type(self, ctx, name):
-        for scope in reversed(self.scopes):
-            if name in scope.variables:
-                scope.variables[name]["read"] = True
-                return scope.variables[name]["type"]
+        meta = self.symbols.lookup(name)
+        if meta is not None:
+            meta["read"] = True
+            return meta["type"]
         self._error(ctx, f"Variable '{name}' no declarada.")
         return "entero"
 
 
 
+    def _termina_en_punto_y_coma(self, ctx):
+        # El parser inserta un ';' ficticio (tokenIndex -1) al recuperarse de su ausencia
+        token = ctx.PUNTOCOMA()
+        return token is not None and token.getSymbol().tokenIndex >= 0
+
+    #INFERENCIA DE TIPOS
+    #Cada contexto se infiere una sola vez (memo por nodo) y se despacha por su clase
     def _infer_expr_type(self, ctx):
         if ctx is None:
             return "void"
+        tipo = self.expr_types.get(ctx)
+        if tipo is None:
+            inferir = self._inferencias.get(type(ctx), SemanticListener._inferir_por_defecto)
+            tipo = self.expr_types[ctx] = inferir(self, ctx)
+        return tipo
 
-        if hasattr(ctx, "NUMERO") and ctx.NUMERO():
-            text = ctx.NUMERO().getText()
-            return "decimal" if '.' in text else "entero"
+    def _inferir_numero(self, ctx):
+        return "decimal" if '.' in ctx.NUMERO().getText() else "entero"
 
-        if hasattr(ctx, "BOOL_LIT") and ctx.BOOL_LIT():
-            return "bool"
+    def _inferir_booleano(self, ctx):
+        return "bool"
 
-        if hasattr(ctx, "TEXTO") and ctx.TEXTO():
-            return "cadena"
+    def _inferir_texto(self, ctx):
+        return "cadena"
 
-        if hasattr(ctx, "ID") and ctx.ID():
-            return self._resolve_variable_type(ctx, ctx.ID().getText())
+    def _inferir_variable(self, ctx):
+        return self._resolve_variable_type(ctx, ctx.ID().getText())
 
-        if hasattr(ctx, "expr") and callable(ctx.expr):
-            return self._infer_expr_type(ctx.expr())
+    def _inferir_hijo(self, ctx):
+        # Alternativas de un solo hijo (soloExp, soloSuma, llamadaUnaria, ...)
+        return self._infer_expr_type(ctx.getChild(0))
 
-        if hasattr(ctx, "unario"):
-            return self._infer_expr_type(ctx.unario())
+    def _inferir_parentesis(self, ctx):
+        return self._infer_expr_type(ctx.expr())
 
-        if ctx.getChildCount() == 3:
-            op = ctx.getChild(1).getText()
-            tipo_izq = self._infer_expr_type(ctx.getChild(0))
-            tipo_der = self._infer_expr_type(ctx.getChild(2))
+    def _inferir_unario(self, ctx):
+        return self._infer_expr_type(ctx.unario())
 
-            if op in ["==", "!=", "<", ">", "<=", ">="]:
-                return "bool"
-            if op == "+" and tipo_izq == "cadena" and tipo_der == "cadena":
-                return "cadena"
-            if "decimal" in [tipo_izq, tipo_der]:
-                return "decimal"
-            return "entero"
+    def _inferir_binario(self, ctx):
+        op = ctx.getChild(1).getText()
+        tipo_izq = self._infer_expr_type(ctx.getChild(0))
+        tipo_der = self._infer_expr_type(ctx.getChild(2))
 
-        if ctx.getChildCount() == 1:
-            return self._infer_expr_type(ctx.getChild(0))
-        
-        # Si es llamada a función con o sin argumentos
-        if ctx.getChildCount() >= 3 and ctx.getChild(1).getText() == '(':
-            # Obtener nombre de función
-            if hasattr(ctx.getChild(0), "getText"):
-                name = ctx.getChild(0).getText()
-            else:
-                return "entero"  # fallback
-
-            # Obtener lista de argumentos
-            arg_node = ctx.getChild(2)
-            args = arg_node.expr() if hasattr(arg_node, "expr") else []
-            self.called_functions.add(name)
-            return self._check_function_call(ctx, name, args)
-
-
-        # Si es llamada a función sin argumentos
-        if hasattr(ctx, "primary") and ctx.primary().ID():
-            return self._infer_function_return_type(ctx)
-        
+        if op in ("==", "!=", "<", ">", "<=", ">=", "&&", "||"):
+            return "bool"
+        if op == "+" and tipo_izq == "cadena" and tipo_der == "cadena":
+            return "cadena"
+        if "decimal" in (tipo_izq, tipo_der):
+            return "decimal"
         return "entero"
-    
-
 
+    def _inferir_llamada(self, ctx):
+        # Sin paréntesis: es solo la expresión primaria
+        if ctx.getChildCount() == 1:
+            return self._infer_expr_type(ctx.primary())
 
-    def _infer_function_return_type(self, ctx):
-        if hasattr(ctx, "primary") and ctx.primary().ID():
-            name = ctx.primary().ID().getText()
-            self.called_functions.add(name)  # ← marcar como llamada
+        primary = ctx.primary()
+        if not isinstance(primary, ExprParser.VariableContext):
+            return "entero"  # fallback
 
-        else:
-            return "entero"
+        name = primary.ID().getText()
+        self.called_functions.add(name)
+        args_ctx = ctx.args(0)
+        args = args_ctx.expr() if args_ctx else []
+        return self._check_function_call(ctx, name, args)
 
-        for scope in reversed(self.scopes):
-            if name in scope.functions:
-                return scope.functions[name][0]
-        self._error(ctx, f"Función '{name}' no definida.")
+    def _inferir_por_defecto(self, ctx):
         return "entero"
 
+    _inferencias = {
+        ExprParser.NumeroContext: _inferir_numero,
+        ExprParser.BooleanoContext: _inferir_booleano,
+        ExprParser.TextoContext: _inferir_texto,
+        ExprParser.VariableContext: _inferir_variable,
+        ExprParser.AsignacionExpContext: _inferir_variable,
+        ExprParser.ParentesisContext: _inferir_parentesis,
+        ExprParser.ExprContext: _inferir_hijo,
+        ExprParser.SoloExpContext: _inferir_hijo,
+        ExprParser.SoloLogicaAndContext: _inferir_hijo,
+        ExprParser.SoloIgualdadContext: _inferir_hijo,
+        ExprParser.SoloComparacionContext: _inferir_hijo,
+        ExprParser.SoloSumaContext: _inferir_hijo,
+        ExprParser.SoloMultContext: _inferir_hijo,
+        ExprParser.SoloPotenciaContext: _inferir_hijo,
+        ExprParser.SoloUnarioContext: _inferir_hijo,
+        ExprParser.LlamadaUnariaContext: _inferir_hijo,
+        ExprParser.OpUnarioNotContext: _inferir_unario,
+        ExprParser.OpUnarioPositivoContext: _inferir_unario,
+        ExprParser.OpUnarioNegativoContext: _inferir_unario,
+        ExprParser.OpPotenciaContext: _inferir_unario,
+        ExprParser.OpLogicaORContext: _inferir_binario,
+        ExprParser.OpLogicaANDContext: _inferir_binario,
+        ExprParser.OpIgualdadDiferenciaContext: _inferir_binario,
+        ExprParser.OpComparacionContext: _inferir_binario,
+        ExprParser.OpSumaRestaContext: _inferir_binario,
+        ExprParser.OpMultDivContext: _inferir_binario,
+        ExprParser.LlamadaFuncionContext: _inferir_llamada,
+    }
+
     def _error(self, ctx, msg):
         line = ctx.start.line if ctx.start else "desconocida"
         self.errors.append(f"[Línea {line}] Error semántico: {msg}")
 
     def _warn(self, ctx, msg):
-        line = ctx.start.line if ctx.start else "desconocida"
+        self._warn_line(ctx.start.line if ctx.start else "desconocida", msg)
+
+    def _warn_line(self, line, msg):
         self.warnings.append(f"[Línea {line}] Advertencia: {msg}")
\ No newline at end of file
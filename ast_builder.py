@@ -5,7 +5,8 @@ from ExprParser import ExprParser
 
 # Nodo base del AST
 class ASTNode:
-    pass
+    type = None  # Tipo anotado por TypeAnnotator ('entero', 'decimal', 'bool', 'cadena')
+    line = None  # Línea del código fuente donde empieza el nodo
 
 # Nodo para el programa principal
 class ProgramNode(ASTNode):
@@ -182,6 +183,13 @@ class FunctionCallNode(ASTNode):
 
 # Visitor para construir el AST
 class ASTBuilder(ExprVisitor):
+    def visit(self, tree):
+        node = super().visit(tree)
+        # Cada nodo recuerda su línea (la más interna gana: los envoltorios no la pisan)
+        if isinstance(node, ASTNode) and node.line is None and hasattr(tree, "start"):
+            node.line = tree.start.line
+        return node
+
     def visitProg(self, ctx: ExprParser.ProgContext):
         name = ctx.ID().getText()
         globals_list = []
@@ -280,13 +288,21 @@ class ASTBuilder(ExprVisitor):
         return ReturnNode(expr)
 
     def visitParaSentencia(self, ctx: ExprParser.ParaSentenciaContext):
-        init = None
+        # ctx.expr() solo trae las expresiones presentes: condición y actualización
+        # se distinguen por su posición respecto al ';' que las separa
+        exprs = list(ctx.expr())
         if ctx.declaracion():
             init = self.visit(ctx.declaracion())
-        elif ctx.expr(0):
-            init = self.visit(ctx.expr(0))
-        condition = self.visit(ctx.expr(1)) if ctx.expr(1) else None
-        update = self.visit(ctx.expr(2)) if ctx.expr(2) else None
+            separador = ctx.PUNTOCOMA(0).getSymbol().tokenIndex
+        else:
+            init = self.visit(exprs.pop(0))
+            separador = ctx.PUNTOCOMA(1).getSymbol().tokenIndex
+        condition = update = None
+        for expr in exprs:
+            if expr.start.tokenIndex < separador:
+                condition = self.visit(expr)
+            else:
+                update = self.visit(expr)
         body = self.visit(ctx.sentencia())
         return ForNode(init, condition, update, body)
 
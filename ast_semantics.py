@@ -0,0 +1,320 @@
+#ANALISIS SEMANTICO SOBRE EL AST
+#Las mismas verificaciones que SemanticListener, pero recorriendo los nodos de
+#ast_builder.py en lugar del árbol de análisis de ANTLR: lo usa el frontend
+#manual (hand_parser.py), que no construye ese árbol. Los mensajes, su orden y
+#sus líneas son los de SemanticListener; por eso el recorrido reproduce el del
+#ParseTreeWalker:
+#  - las asignaciones se verifican al salir de su nodo (antes que la sentencia
+#    que las contiene), aunque su expresión nunca se infiera,
+#  - sólo declaraciones, asignaciones, 'pintar', 'ret' y los argumentos de las
+#    llamadas inferidas infieren tipos (una expresión suelta o una condición no),
+#    pero toda expresión registra sus lecturas de variables y sus llamadas,
+#  - una función se conoce desde que empieza su definición y el bloque principal
+#    se recorre antes que las funciones si aparece antes en el fuente.
+#El AST no guarda esas diferencias de sintaxis: el parser las entrega aparte
+#(funciones_primero, primer grupo de argumentos de f(a)(b), línea del '(').
+from ast_builder import (
+    DeclarationNode,
+    BlockNode,
+    IfNode,
+    ForNode,
+    WhileNode,
+    DoWhileNode,
+    ReturnNode,
+    PrintNode,
+    BinaryOpNode,
+    UnaryOpNode,
+    NumberNode,
+    BooleanNode,
+    StringNode,
+    VariableNode,
+    AssignmentNode,
+    FunctionCallNode,
+    ASTNode,
+)
+from symbol_table import SymbolTable
+
+
+class ASTSemanticAnalyzer:
+    def __init__(self, check_unused_functions=True):
+        self.symbols = SymbolTable()  # name -> {"type", "assigned", "read", "line"}
+        self.functions = {}           # name -> (tipo_retorno, [(param, tipo)])
+        self.function_lines = {}      # name -> línea de su definición
+        self.current_function_return_type = None
+        self.errors = []
+        self.warnings = []
+        self.called_functions = set()
+        self.has_return = True
+        self.expr_types = {}  # nodo -> tipo inferido (memo)
+        self.check_unused_functions = check_unused_functions
+        self.primer_grupo = {}
+        self.inicios = {}
+
+    def analyze(self, program, funciones_primero=True, primer_grupo=None, inicios=None):
+        """
+        Verifica el programa y deja los diagnósticos en errors y warnings.
+        primer_grupo: llamada encadenada -> cantidad de argumentos de su primer grupo.
+        inicios: expresión entre paréntesis -> línea del '(' (si es otra).
+        """
+        self.primer_grupo = primer_grupo or {}
+        self.inicios = inicios or {}
+        for decl in program.globals:
+            self._global(decl)
+        if funciones_primero:
+            self._funciones(program.functions)
+            self._sentencia(program.block)
+        else:
+            self._sentencia(program.block)
+            self._funciones(program.functions)
+        if self.check_unused_functions:
+            self.warn_unused_functions()
+        return self
+
+    def warn_unused_functions(self):
+        for name, line in self.function_lines.items():
+            if name not in self.called_functions:
+                self._warn(line, f"Función '{name}' fue definida pero nunca llamada.")
+
+    # ========================
+    # DECLARACIONES Y FUNCIONES
+    # ========================
+
+    def _global(self, decl):
+        self._expresion(decl.expr)
+        self._declare_variable(decl.line, decl.identifier, decl.var_type)
+
+    def _funciones(self, functions):
+        for func in functions:
+            self.has_return = False
+            if func.name in self.functions:
+                self._error(func.line, f"Función '{func.name}' ya fue definida.")
+            params = [(p.identifier, p.var_type) for p in func.parameters]
+            self.functions[func.name] = (func.return_type, params)
+            self.function_lines.setdefault(func.name, func.line)
+            self.current_function_return_type = func.return_type
+            self.symbols.enter_scope()
+            for ident, tipo in params:
+                self._declare_variable(func.line, ident, tipo)
+            self._sentencia(func.block)
+            self._exit_scope()
+
+    def _declaracion(self, decl):
+        self._expresion(decl.expr)
+        ident = decl.identifier
+        if decl.var_type == "inferido":
+            self._declare_variable(decl.line, ident, self._infer(decl.expr))
+            return
+
+        expr_type = self._infer(decl.expr) if decl.expr is not None else None
+        if expr_type and decl.var_type != expr_type:
+            self._error(decl.line, f"Tipo incompatible en inicialización de '{ident}': declarado '{decl.var_type}', pero la expresión es '{expr_type}'.")
+        self._declare_variable(decl.line, ident, decl.var_type)
+        if decl.expr is not None:
+            self.symbols.lookup(ident)["assigned"] = True
+
+    # ========================
+    # SENTENCIAS
+    # ========================
+
+    def _sentencia(self, node):
+        if isinstance(node, BlockNode):
+            self.symbols.enter_scope()
+            for stmt in node.statements:
+                self._sentencia(stmt)
+            self._exit_scope()
+        elif isinstance(node, DeclarationNode):
+            self._declaracion(node)
+        elif isinstance(node, IfNode):
+            self._expresion(node.condition)
+            self._sentencia(node.then_stmt)
+            if node.else_stmt is not None:
+                self._sentencia(node.else_stmt)
+        elif isinstance(node, ForNode):
+            if isinstance(node.init, DeclarationNode):
+                self._declaracion(node.init)
+            else:
+                self._expresion(node.init)
+            self._expresion(node.condition)
+            self._expresion(node.update)
+            self._sentencia(node.body)
+        elif isinstance(node, WhileNode):
+            self._expresion(node.condition)
+            self._sentencia(node.body)
+        elif isinstance(node, DoWhileNode):
+            self._sentencia(node.body)
+            self._expresion(node.condition)
+        elif isinstance(node, ReturnNode):
+            self._expresion(node.expr)
+            self._retorno(node)
+        elif isinstance(node, PrintNode):
+            for arg in node.args:
+                self._expresion(arg)
+            for arg in node.args:
+                self._infer(arg)
+        else:
+            self._expresion(node)  # expresión como sentencia: no se infiere
+
+    def _retorno(self, node):
+        self.has_return = True
+        if self.current_function_return_type is None:
+            self._error(node.line, "Sentencia 'ret' fuera de una función.")
+        expr_type = self._infer(node.expr) if node.expr is not None else "void"
+        if expr_type != self.current_function_return_type:
+            self._error(
+                node.line,
+                f"Tipo de retorno incorrecto: se esperaba '{self.current_function_return_type}', pero se retornó '{expr_type}'."
+            )
+
+    def _expresion(self, node):
+        """Registra las lecturas y llamadas de una expresión y verifica sus asignaciones"""
+        self._registrar_usos(node)
+        self._asignaciones(node)
+
+    def _registrar_usos(self, node):
+        if isinstance(node, VariableNode):
+            meta = self.symbols.lookup(node.name)
+            if meta is not None:
+                meta["read"] = True
+        elif isinstance(node, FunctionCallNode) and isinstance(node.name, str):
+            self.called_functions.add(node.name)
+        for value in vars(node).values() if isinstance(node, ASTNode) else ():
+            for item in (value if isinstance(value, list) else [value]):
+                if isinstance(item, ASTNode):
+                    self._registrar_usos(item)
+
+    def _asignaciones(self, node):
+        """Verifica, de adentro hacia afuera, las asignaciones dentro de una expresión"""
+        if node is None:
+            return
+        if isinstance(node, BinaryOpNode):
+            self._asignaciones(node.left)
+            self._asignaciones(node.right)
+        elif isinstance(node, UnaryOpNode):
+            self._asignaciones(node.operand)
+        elif isinstance(node, FunctionCallNode):
+            if isinstance(node.name, ASTNode):
+                self._asignaciones(node.name)
+            for arg in node.args:
+                self._asignaciones(arg)
+        elif isinstance(node, AssignmentNode):
+            self._asignaciones(node.expr)
+            expr_type = self._infer(node.expr)
+            var_type = self._resolve_variable_type(node.line, node.name)
+            if var_type != expr_type:
+                self._error(node.line, f"Tipo incompatible en asignación a '{node.name}': esperado '{var_type}', encontrado '{expr_type}'.")
+            meta = self.symbols.lookup(node.name)
+            if meta is not None:
+                meta["assigned"] = True
+
+    # ========================
+    # MÉTODOS AUXILIARES
+    # ========================
+
+    def _declare_variable(self, line, name, tipo):
+        if self.symbols.lookup_local(name) is not None:
+            self._error(line, f"Variable '{name}' ya fue declarada en este ámbito.")
+        shadowed = self.symbols.declare(name, {"type": tipo, "assigned": False, "read": False, "line": line})
+        if shadowed is not None:
+            self._warn(line, f"Variable '{name}' en este bloque oculta una declaración anterior en un ámbito externo.")
+
+    def _exit_scope(self):
+        for name, meta in self.symbols.exit_scope().items():
+            if not meta["read"] and not meta["assigned"]:
+                self._warn(meta["line"], f"Variable '{name}' fue declarada pero nunca utilizada.")
+            elif meta["assigned"] and not meta["read"]:
+                self._warn(meta["line"], f"Variable '{name}' fue asignada pero nunca leída.")
+
+    def _resolve_variable_type(self, line, name):
+        meta = self.symbols.lookup(name)
+        if meta is not None:
+            meta["read"] = True
+            return meta["type"]
+        self._error(line, f"Variable '{name}' no declarada.")
+        return "entero"
+
+    def _check_function_call(self, node, name, args):
+        if name not in self.functions:
+            self._error(node.line, f"Función '{name}' no definida.")
+            return "entero"
+        return_type, expected_params = self.functions[name]
+
+        if len(args) != len(expected_params):
+            self._error(node.line, f"La función '{name}' espera {len(expected_params)} argumento(s), pero se proporcionaron {len(args)}.")
+            return return_type
+
+        for i, (arg, (param_name, expected_type)) in enumerate(zip(args, expected_params)):
+            actual_type = self._infer(arg)
+            if actual_type != expected_type:
+                self._error(self.inicios.get(arg, arg.line), f"Tipo incorrecto para el argumento {i+1} en llamada a '{name}': se esperaba '{expected_type}', pero se recibió '{actual_type}'.")
+
+        return return_type
+
+    #INFERENCIA DE TIPOS
+    #Cada nodo se infiere una sola vez (memo por nodo) y se despacha por su clase
+    def _infer(self, node):
+        if node is None:
+            return "void"
+        tipo = self.expr_types.get(node)
+        if tipo is None:
+            inferir = self._inferencias.get(type(node), ASTSemanticAnalyzer._inferir_por_defecto)
+            tipo = self.expr_types[node] = inferir(self, node)
+        return tipo
+
+    def _inferir_numero(self, node):
+        return "decimal" if isinstance(node.value, float) else "entero"
+
+    def _inferir_booleano(self, node):
+        return "bool"
+
+    def _inferir_texto(self, node):
+        return "cadena"
+
+    def _inferir_variable(self, node):
+        return self._resolve_variable_type(node.line, node.name)
+
+    def _inferir_unario(self, node):
+        return self._infer(node.operand)
+
+    def _inferir_binario(self, node):
+        # 'a ^ b' tiene el tipo de 'a': SemanticListener sólo mira la base
+        if node.op == "^":
+            return self._infer(node.left)
+        tipo_izq = self._infer(node.left)
+        tipo_der = self._infer(node.right)
+
+        if node.op in ("==", "!=", "<", ">", "<=", ">=", "&&", "||"):
+            return "bool"
+        if node.op == "+" and tipo_izq == "cadena" and tipo_der == "cadena":
+            return "cadena"
+        if "decimal" in (tipo_izq, tipo_der):
+            return "decimal"
+        return "entero"
+
+    def _inferir_llamada(self, node):
+        if not isinstance(node.name, str):
+            return "entero"  # fallback
+
+        self.called_functions.add(node.name)
+        # En f(a)(b) sólo se verifica el primer grupo de argumentos
+        args = node.args[:self.primer_grupo.get(node, len(node.args))]
+        return self._check_function_call(node, node.name, args)
+
+    def _inferir_por_defecto(self, node):
+        return "entero"
+
+    _inferencias = {
+        NumberNode: _inferir_numero,
+        BooleanNode: _inferir_booleano,
+        StringNode: _inferir_texto,
+        VariableNode: _inferir_variable,
+        AssignmentNode: _inferir_variable,
+        UnaryOpNode: _inferir_unario,
+        BinaryOpNode: _inferir_binario,
+        FunctionCallNode: _inferir_llamada,
+    }
+
+    def _error(self, line, msg):
+        self.errors.append(f"[Línea {line}] Error semántico: {msg}")
+
+    def _warn(self, line, msg):
+        self.warnings.append(f"[Línea {line}] Advertencia: {msg}")
@@ -0,0 +1,93 @@
+#BENCHMARK DE ARRANQUE E IMPORTS
+#Cada escenario corre en un proceso nuevo con -X importtime. Reporta el tiempo
+#de pared, el tiempo total de imports y los módulos más pesados, y verifica que
+#el escenario no cargue lo que no necesita (por ejemplo, validar un programa no
+#debe importar llvmlite.binding ni inicializar LLVM). Si algún escenario carga
+#un módulo prohibido, termina con código 1.
+#Uso: python benchmarks/bench_arranque.py [repeticiones] [--detalle]
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+PROGRAMA = str(RAIZ / "a.txt")
+
+# (nombre, código del escenario, módulos que no debe cargar)
+ESCENARIOS = [
+    ("menú de test.py", "import test", ["antlr4", "llvmlite", "ExprParser"]),
+    ("menú de main.py", "import main", ["antlr4", "llvmlite", "ExprParser"]),
+    ("cliente del servidor", "import compile_client", ["antlr4", "llvmlite"]),
+    ("validar (semántica)",
+     f"from pipeline import parsear, analizar_semantica\n"
+     f"from antlr4 import FileStream\n"
+     f"analizar_semantica(parsear(FileStream({PROGRAMA!r}, encoding='utf-8')))",
+     ["llvmlite"]),
+    ("generar IR",
+     f"from pipeline import construir_ast\n"
+     f"from ir_generator import LLVMGenerator\n"
+     f"str(LLVMGenerator().generate(construir_ast(open({PROGRAMA!r}, encoding='utf-8').read())[0]))",
+     []),  # necesita llvmlite.binding: el data layout sale de la TargetMachine del destino
+    ("sesión JIT", "from jit_session import JITSession\nJITSession(cache=False)", []),
+]
+
+REPORTE = "\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))"
+
+
+def _leer_importtime(stderr):
+    """Retorna [(módulo, propio_us, acumulado_us)] de la salida de -X importtime"""
+    filas = []
+    for linea in stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, acumulado, modulo = linea[len("import time:"):].split("|")
+        filas.append((modulo.strip(), int(propio), int(acumulado)))
+    return filas
+
+
+def medir(codigo):
+    inicio = time.perf_counter()
+    proceso = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo + REPORTE], cwd=RAIZ,
+                             capture_output=True, text=True, check=True)
+    pared = time.perf_counter() - inicio
+    modulos = json.loads(proceso.stdout.strip().splitlines()[-1])
+    return pared, _leer_importtime(proceso.stderr), modulos
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    argumentos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    repeticiones = int(argumentos[0]) if argumentos else 3
+    detalle = "--detalle" in sys.argv
+
+    fallos = []
+    print(f"{'escenario':>22} {'pared (ms)':>11} {'imports (ms)':>13} {'módulos':>8}  más pesados (propio)")
+    for nombre, codigo, prohibidos in ESCENARIOS:
+        mejor = None
+        for _ in range(repeticiones):
+            resultado = medir(codigo)
+            if mejor is None or resultado[0] < mejor[0]:
+                mejor = resultado
+        pared, filas, modulos = mejor
+        imports = sum(propio for _, propio, _ in filas) / 1000
+        pesados = sorted(filas, key=lambda f: f[1], reverse=True)[:3 if not detalle else 10]
+        resumen = ", ".join(f"{m.strip()} {p / 1000:.0f}" for m, p, _ in pesados)
+        print(f"{nombre:>22} {pared * 1000:>11.1f} {imports:>13.1f} {len(modulos):>8}  {resumen}")
+
+        cargados = [p for p in prohibidos if any(m == p or m.startswith(p + ".") for m in modulos)]
+        if cargados:
+            fallos.append(f"{nombre}: carga {', '.join(cargados)}")
+
+    if fallos:
+        print("\n[REGRESION] Imports innecesarios en el arranque:")
+        for fallo in fallos:
+            print("  -", fallo)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#BENCHMARK DE ATRIBUTOS DE FUNCION Y ENLACE INTERNO
+#Compila el mismo programa dos veces: como lo genera LLVMGenerator (funciones
+#internas con los atributos de function_attrs.py) y con las funciones externas y
+#sin atributos, como antes. Ambos pasan por opt -O2 y se ejecutan con lli.
+#Mide el tiempo de ejecución, cuántas funciones quedan en el IR optimizado y su
+#tamaño, y verifica que la salida sea la misma.
+#Uso: python benchmarks/bench_atributos.py [iteraciones] [repeticiones]
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.setrecursionlimit(100000)
+
+from ir_generator import LLVMGenerator
+from pipeline import construir_ast
+
+
+def programa(iteraciones):
+    return f"""Programa Atributos {{
+    entero semilla = 7;
+    funciones {{
+        entero sumaRecursiva(entero n, entero paso) {{
+            si (n <= 0) {{ ret 0; }}
+            ret n * paso + sumaRecursiva(n - paso, paso);
+        }}
+        entero mezcla(entero x, entero factor) {{
+            entero r = x;
+            entero i = 0;
+            mientras (i < 8) {{ r = (r * factor + i) % 1000003; i = i + 1; }}
+            ret r;
+        }}
+        entero acotar(entero x) {{ si (x < 0) {{ ret -x; }} ret x % 1000; }}
+        entero conSemilla(entero x) {{ ret (x + semilla) % 97; }}
+    }}
+    Inicio {{
+        entero s = 0;
+        entero i = 0;
+        mientras (i < {iteraciones}) {{
+            s = s + sumaRecursiva(40, 1) % 13;
+            s = s + mezcla(i, 31) + mezcla(i + 1, 31);
+            s = (s + acotar(s - i) + conSemilla(i)) % 1000000007;
+            i = i + 1;
+        }}
+        pintar(s);
+    }} Fin
+}}
+"""
+
+
+def sin_atributos(module, ast):
+    """Las funciones del usuario como antes: enlace externo y sin atributos"""
+    for func in ast.functions:
+        function = module.get_global(func.name)
+        function.linkage = ''
+        function.attributes.clear()
+    module.get_global("main").attributes.clear()
+    return module
+
+
+def ejecutar(comando, repeticiones):
+    mejor, salida = float("inf"), None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        salida = subprocess.run(comando, capture_output=True, text=True, check=True).stdout
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, salida
+
+
+def main():
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else 20000000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'variante':>22} {'funciones':>10} {'IR -O2 (KiB)':>13} {'opt -O2 + lli (s)':>18}")
+        referencia = None
+        for variante in ("externas sin atributos", "internas con atributos"):
+            ast, _ = construir_ast(programa(iteraciones))
+            module = LLVMGenerator().generate(ast)
+            if variante.startswith("externas"):
+                module = sin_atributos(module, ast)
+
+            ruta = os.path.join(tmp, "programa.ll")
+            optimizado = os.path.join(tmp, "programa.opt.ll")
+            with open(ruta, "w") as f:
+                f.write(str(module))
+            subprocess.run(["opt", "-O2", "-S", ruta, "-o", optimizado], check=True)
+            with open(optimizado) as f:
+                texto = f.read()
+            funciones = sum(1 for linea in texto.splitlines() if linea.startswith("define "))
+
+            tiempo, salida = ejecutar(["lli", "-O2", optimizado], repeticiones)
+            referencia = referencia or salida
+            if salida != referencia:
+                raise RuntimeError(f"Salida distinta: {salida!r} != {referencia!r}")
+            print(f"{variante:>22} {funciones:>10} {len(texto) / 1024:>13.1f} {tiempo:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#BENCHMARK DEL BACKEND PARALELO (OPTIMIZACION + EMISION DE OBJETOS)
+#Genera el IR de programas sintéticos y mide el tiempo de pared de optimizar y
+#emitir objetos con un solo módulo monolítico y con particiones en 1..N hilos.
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_paralelo import programa_sintetico
+from parallel_compiler import _compilar_secuencial
+from parallel_backend import compilar_objetos, enlazar_ejecutable
+
+
+def comprobar(objetos, esperado):
+    """Enlaza los objetos y verifica que el ejecutable imprima lo mismo que el monolítico"""
+    with tempfile.TemporaryDirectory() as tmp:
+        salida = enlazar_ejecutable(objetos, os.path.join(tmp, "prog"))
+        obtenido = subprocess.run([salida], capture_output=True, text=True).stdout
+    if esperado is not None and obtenido != esperado:
+        raise RuntimeError("La salida del ejecutable particionado no coincide")
+    return obtenido
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    tamanos = [int(t) for t in sys.argv[1:]] or [200, 800]
+    nucleos = os.cpu_count() or 1
+    hilos = sorted({1, 2, 4, 8, nucleos} & set(range(1, nucleos + 1)))
+
+    for funciones in tamanos:
+        module, errors, _ = _compilar_secuencial(programa_sintetico(funciones))
+        if errors:
+            raise RuntimeError("\n".join(errors))
+
+        objetos, base = compilar_objetos(module, workers=1, particiones=1)
+        esperado = comprobar(objetos, None)
+        print(f"\n== {funciones} funciones ==")
+        print(f"{'modo':>12} {'objetos':>8} {'tiempo (s)':>11} {'aceleración':>12}")
+        print(f"{'monolítico':>12} {1:>8} {base:>11.2f} {1.0:>11.2f}x")
+        for n in hilos:
+            objetos, segundos = compilar_objetos(module, workers=n)
+            comprobar(objetos, esperado)
+            print(f"{f'{n} hilos':>12} {len(objetos):>8} {segundos:>11.2f} {base / segundos:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
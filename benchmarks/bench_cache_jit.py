@@ -0,0 +1,55 @@
+#BENCHMARK DE LA CACHE DE OBJETOS DEL JIT
+#Ejecuta el mismo programa en dos procesos nuevos sobre una caché vacía:
+#el primero genera y guarda el código máquina (frío), el segundo lo carga de
+#disco (caliente). Reporta tasa de aciertos y tiempo de arranque ahorrado.
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_paralelo import programa_sintetico
+
+
+def hijo(ruta):
+    """Corre en un proceso nuevo: compila y ejecuta con JITSession y reporta en JSON"""
+    from jit_session import JITSession
+    with open(ruta, encoding="utf-8") as f:
+        codigo = f.read()
+    sesion = JITSession()
+    resumen = sesion.ejecutar(codigo)
+    print(json.dumps({"tiempo_compilacion": resumen["tiempo_compilacion"], **resumen["cache"]}))
+
+
+def corrida(ruta, cache):
+    entorno = dict(os.environ, COMPILADOR_CACHE=cache)
+    salida = subprocess.run([sys.executable, __file__, "--hijo", ruta], env=entorno,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(salida.strip().splitlines()[-1])
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    tamanos = [int(t) for t in sys.argv[1:]] or [50, 200]
+    print(f"{'funciones':>10} {'corrida':>9} {'aciertos':>9} {'compilación (ms)':>17} {'codegen evitado (ms)':>21}")
+    for funciones in tamanos:
+        with tempfile.TemporaryDirectory() as tmp:
+            ruta = os.path.join(tmp, "programa.txt")
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(programa_sintetico(funciones))
+            cache = os.path.join(tmp, "cache")
+            for nombre in ("fría", "caliente"):
+                r = corrida(ruta, cache)
+                print(f"{funciones:>10} {nombre:>9} {r['tasa_aciertos']:>8.0%} "
+                      f"{r['tiempo_compilacion'] * 1000:>17.1f} {r['tiempo_ahorrado'] * 1000:>21.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--hijo":
+        sys.setrecursionlimit(10000)
+        hijo(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,76 @@
+#BENCHMARK DE ELIMINACION DE CODIGO MUERTO
+#Compara, sin y con dead_code.py, el tamaño del IR y el tiempo de generar IR y
+#optimizarlo (O2) sobre programas generados y sobre un programa "con biblioteca":
+#muchas funciones declaradas de las que Inicio sólo usa unas pocas. El tiempo con
+#eliminación incluye la pasada misma.
+#Uso: python benchmarks/bench_codigo_muerto.py [repeticiones]
+import copy
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.setrecursionlimit(100000)
+
+import llvmlite.binding as llvm
+
+from dead_code import eliminar_codigo_muerto
+from generador import generar_programa
+from ir_generator import LLVMGenerator
+from llvm_init import inicializar_llvm
+from pipeline import construir_ast
+
+
+def programa_biblioteca(funciones, usadas=3):
+    """Programa generado al que se agregan 'funciones' de biblioteca; Inicio llama 'usadas'"""
+    codigo = generar_programa(funciones=4, semilla=1)
+    biblioteca = "\n".join(
+        f"        entero lib{i}(entero a, entero b) {{ entero t = a * {i} + b; entero sin_uso = t - 1; "
+        f"si (t > {i}) {{ ret t % 97; }} ret lib{max(0, i - 1)}(a, b - 1); }}"
+        for i in range(funciones))
+    codigo = codigo.replace("    funciones {\n", "    funciones {\n" + biblioteca + "\n", 1)
+    llamadas = ", ".join(f"lib{i}(1, 2)" for i in range(usadas))
+    return codigo.replace("    } Fin", f"        pintar({llamadas});\n    }} Fin", 1)
+
+
+def compilar(ast, eliminar):
+    """(bytes de IR, tiempo de generar+optimizar, eliminaciones)"""
+    inicio = time.perf_counter()
+    eliminado = eliminar_codigo_muerto(ast) if eliminar else []
+    ir = str(LLVMGenerator().generate(ast))
+    module = llvm.parse_assembly(ir)
+    builder = llvm.create_pass_manager_builder()
+    builder.opt_level = 2
+    pass_manager = llvm.create_module_pass_manager()
+    builder.populate(pass_manager)
+    pass_manager.run(module)
+    return len(ir), time.perf_counter() - inicio, len(eliminado)
+
+
+def medir(codigo, eliminar, repeticiones):
+    ast, _ = construir_ast(codigo)
+    mejor = None
+    for _ in range(repeticiones):
+        resultado = compilar(copy.deepcopy(ast), eliminar)
+        if mejor is None or resultado[1] < mejor[1]:
+            mejor = resultado
+    return mejor
+
+
+def main():
+    inicializar_llvm()
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    programas = [(f"generado {n} funciones", generar_programa(funciones=n, semilla=n)) for n in (10, 40)]
+    programas += [(f"biblioteca {n} funciones", programa_biblioteca(n)) for n in (50, 200)]
+
+    print(f"{'programa':>24} {'IR (KiB)':>9} {'IR sin muerto':>14} {'tiempo (ms)':>12} "
+          f"{'sin muerto (ms)':>16} {'eliminados':>11}")
+    for nombre, codigo in programas:
+        tamano, tiempo, _ = medir(codigo, False, repeticiones)
+        tamano_dce, tiempo_dce, eliminados = medir(codigo, True, repeticiones)
+        print(f"{nombre:>24} {tamano / 1024:>9.1f} {tamano_dce / 1024:>14.1f} {tiempo * 1000:>12.1f} "
+              f"{tiempo_dce * 1000:>16.1f} {eliminados:>11}")
+
+
+if __name__ == "__main__":
+    main()
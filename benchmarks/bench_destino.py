@@ -0,0 +1,44 @@
+#BENCHMARK DE CODIGO AJUSTADO AL DESTINO
+#Compila los mismos programas a ejecutable nativo (-O2, backend paralelo) para
+#x86-64 genérico (sin CPU ni features) y para la CPU detectada con todas sus
+#features, y compara el mejor tiempo de ejecución de cada uno.
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_pgo import cronometrar, muestras
+from ir_generator import LLVMGenerator
+from parallel_backend import compilar_objetos, enlazar_ejecutable
+from pipeline import construir_ast
+from target_config import TargetConfig
+
+
+def ejecutable(codigo, salida, target):
+    ast, _ = construir_ast(codigo)
+    module = LLVMGenerator(target=target).generate(ast)
+    objetos, _ = compilar_objetos(module, workers=1, particiones=1, opt_level=2, target=target)
+    return enlazar_ejecutable(objetos, salida)
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    host = TargetConfig.host()
+    generico = TargetConfig(host.triple, cpu="", features="")
+    print(f"[INFO] Host: {host.triple}, CPU {host.cpu}")
+    print(f"{'programa':>26} {'genérico (s)':>13} {'host (s)':>10} {'aceleración':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for nombre, codigo in muestras():
+            t_generico, salida_generico = cronometrar(ejecutable(codigo, os.path.join(tmp, "generico"), generico),
+                                                      repeticiones)
+            t_host, salida_host = cronometrar(ejecutable(codigo, os.path.join(tmp, "host"), host), repeticiones)
+            if salida_generico != salida_host:
+                raise RuntimeError(f"{nombre}: la salida cambia según el destino")
+            print(f"{nombre:>26} {t_generico:>13.3f} {t_host:>10.3f} {t_generico / t_host:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
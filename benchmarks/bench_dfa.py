@@ -0,0 +1,80 @@
+#BENCHMARK DEL PRIMER ANALISIS: DFA FRIO CONTRA DFA PERSISTIDO
+#Cada medición corre en un proceso nuevo, que es el caso de una compilación corta.
+#Frío: caché vacía, el runtime de ANTLR construye el DFA durante el análisis.
+#Caliente: caché entrenada con otros programas (generados con otra semilla y a.txt),
+#así el programa medido no es parte del corpus de entrenamiento.
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from generador import generar_programa
+
+HIJO = """
+import json, sys, time
+sys.setrecursionlimit(10000)
+from antlr4 import FileStream
+import dfa_cache
+inicio = time.perf_counter()
+cargado = dfa_cache.cargar_dfa()
+carga = time.perf_counter() - inicio
+dfa_cache.precargar = lambda: None  # ya se intentó arriba
+from pipeline import parsear
+tiempos = []
+for _ in range(2):
+    inicio = time.perf_counter()
+    parsear(FileStream(sys.argv[1], encoding="utf-8"))
+    tiempos.append(time.perf_counter() - inicio)
+print(json.dumps({"cargado": cargado, "carga": carga, "primero": tiempos[0], "segundo": tiempos[1]}))
+"""
+
+
+def medir(ruta, cache, repeticiones):
+    entorno = dict(os.environ, COMPILADOR_CACHE=cache)
+    mejor = None
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", HIJO, ruta], cwd=RAIZ, env=entorno,
+                                capture_output=True, text=True, check=True).stdout
+        r = json.loads(salida.strip().splitlines()[-1])
+        if mejor is None or r["carga"] + r["primero"] < mejor["carga"] + mejor["primero"]:
+            mejor = r
+    return mejor
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    with tempfile.TemporaryDirectory() as tmp:
+        def escribir(nombre, codigo):
+            ruta = os.path.join(tmp, nombre)
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(codigo)
+            return ruta
+
+        corpus = [str(RAIZ / "a.txt")] + [escribir(f"corpus{i}.txt", generar_programa(funciones=20, semilla=100 + i))
+                                          for i in range(3)]
+        caliente = os.path.join(tmp, "caliente")
+        subprocess.run([sys.executable, str(RAIZ / "dfa_cache.py"), "entrenar", *corpus], cwd=RAIZ,
+                       env=dict(os.environ, COMPILADOR_CACHE=caliente), check=True, stdout=subprocess.DEVNULL)
+
+        muestras = [("a.txt", str(RAIZ / "a.txt"))] + [
+            (f"generado {n} funciones", escribir(f"muestra{n}.txt", generar_programa(funciones=n, semilla=n)))
+            for n in (5, 50)]
+
+        print(f"{'programa':>22} {'caché':>8} {'carga (ms)':>11} {'1er análisis (ms)':>18} "
+              f"{'carga+1ro (ms)':>15} {'2do análisis (ms)':>18}")
+        for nombre, ruta in muestras:
+            for etiqueta, cache in (("fría", os.path.join(tmp, "vacia")), ("caliente", caliente)):
+                r = medir(ruta, cache, repeticiones)
+                if etiqueta == "caliente" and not r["cargado"]:
+                    raise RuntimeError("La caché entrenada no se pudo cargar")
+                print(f"{nombre:>22} {etiqueta:>8} {r['carga'] * 1000:>11.1f} {r['primero'] * 1000:>18.1f} "
+                      f"{(r['carga'] + r['primero']) * 1000:>15.1f} {r['segundo'] * 1000:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
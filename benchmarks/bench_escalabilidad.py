@@ -0,0 +1,192 @@
+#SUITE DE ESCALABILIDAD DEL COMPILADOR POR ETAPA
+#Genera programas sintéticos (benchmarks/generador.py) haciendo crecer un parámetro
+#a la vez y mide tiempo y memoria pico de cada etapa: lexer, parser,
+#SemanticListener, ASTBuilder, anotación de tipos, LLVMGenerator y optimización.
+#Para cada etapa estima el exponente de crecimiento respecto al número de tokens
+#(pendiente log-log) y marca como SUPERLINEAL las que crecen más rápido que n^1.3.
+#La memoria es la pico de Python (tracemalloc): lo que LLVM reserva en C++ no se ve.
+#Uso: python benchmarks/bench_escalabilidad.py [--rapido] [parametro ...]
+import gc
+import math
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.setrecursionlimit(100000)
+
+import llvmlite.binding as llvm
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+
+from ExprLexer import ExprLexer
+from ExprParser import ExprParser
+from ast_builder import ASTBuilder
+from ir_generator import LLVMGenerator
+from llvm_init import inicializar_llvm
+from target_config import configuracion_por_defecto
+from SemanticListener import SemanticListener
+from type_annotator import TypeAnnotator
+from generador import generar_programa
+
+UMBRAL_EXPONENTE = 1.3
+
+BASE = dict(funciones=10, sentencias=20, anidamiento=2, profundidad_expr=3, cadenas=0.2)
+BARRIDOS = {
+    "funciones": [10, 20, 40, 80],
+    "sentencias": [10, 20, 40, 80],
+    "anidamiento": [1, 2, 4, 8],
+    "profundidad_expr": [2, 4, 8, 16],
+    "cadenas": [0.0, 0.25, 0.5, 1.0],
+}
+
+
+# ========================
+# ETAPAS
+# ========================
+#Cada etapa recibe el estado de las anteriores y retorna el suyo
+
+def _lexer(estado):
+    stream = CommonTokenStream(ExprLexer(InputStream(estado["codigo"])))
+    stream.fill()
+    return stream
+
+
+def _parser(estado):
+    stream = estado["lexer"]
+    stream.seek(0)
+    return ExprParser(stream).prog()
+
+
+def _semantica(estado):
+    listener = SemanticListener()
+    ParseTreeWalker().walk(listener, estado["parser"])
+    if listener.errors:
+        raise RuntimeError("\n".join(listener.errors))
+    return listener
+
+
+def _ast(estado):
+    return ASTBuilder().visit(estado["parser"])
+
+
+def _tipos(estado):
+    return TypeAnnotator().annotate(ASTBuilder().visit(estado["parser"]))
+
+
+def _llvm(estado):
+    return LLVMGenerator().generate(estado["tipos"])
+
+
+def _optimizacion(estado):
+    module = llvm.parse_assembly(str(estado["llvm"]))
+    builder = llvm.create_pass_manager_builder()
+    builder.opt_level = 2
+    pass_manager = llvm.create_module_pass_manager()
+    configuracion_por_defecto().target_machine().add_analysis_passes(pass_manager)
+    builder.populate(pass_manager)
+    pass_manager.run(module)
+    return module
+
+
+ETAPAS = [
+    ("lexer", _lexer),
+    ("parser", _parser),
+    ("semantica", _semantica),
+    ("ast", _ast),
+    ("tipos", _tipos),
+    ("llvm", _llvm),
+    ("optimizacion", _optimizacion),
+]
+
+
+# ========================
+# MEDICION
+# ========================
+
+def medir_programa(codigo, repeticiones):
+    """Retorna (tokens, {etapa: (segundos, bytes_pico)})"""
+    estado = {"codigo": codigo}
+    resultados = {}
+    for nombre, etapa in ETAPAS:
+        mejor = float("inf")
+        for _ in range(repeticiones):
+            gc.collect()
+            gc.disable()  # las pausas del recolector enmascaran el crecimiento real
+            try:
+                inicio = time.perf_counter()
+                salida = etapa(estado)
+                mejor = min(mejor, time.perf_counter() - inicio)
+            finally:
+                gc.enable()
+
+        # Memoria en una corrida aparte: tracemalloc distorsiona los tiempos
+        tracemalloc.start()
+        etapa(estado)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        estado[nombre] = salida
+        resultados[nombre] = (mejor, pico)
+    return len(estado["lexer"].tokens), resultados
+
+
+def exponente(tamanos, valores):
+    """
+    Pendiente log-log por mínimos cuadrados sobre todos los puntos.
+    None si el tamaño apenas cambia en el barrido (p. ej. al variar 'cadenas').
+    """
+    if max(tamanos) < min(tamanos) * 1.5 or min(valores) <= 0:
+        return None
+    xs = [math.log(t) for t in tamanos]
+    ys = [math.log(v) for v in valores]
+    media_x, media_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    covarianza = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+    return covarianza / sum((x - media_x) ** 2 for x in xs)
+
+
+def barrido(parametro, valores, repeticiones):
+    print(f"\n== {parametro}: {valores} ==")
+    tokens, medidas = [], []
+    for valor in valores:
+        codigo = generar_programa(**dict(BASE, **{parametro: valor}))
+        n, resultados = medir_programa(codigo, repeticiones)
+        tokens.append(n)
+        medidas.append(resultados)
+
+    print(f"{'etapa':>13} " + " ".join(f"{f'{n} tok':>16}" for n in tokens) + f" {'exp. t':>7} {'exp. mem':>8}")
+    superlineales = []
+    for nombre, _ in ETAPAS:
+        tiempos = [m[nombre][0] for m in medidas]
+        picos = [m[nombre][1] for m in medidas]
+        celdas = " ".join(f"{t * 1000:>8.1f}ms {p / 1024:>5.0f}K" for t, p in zip(tiempos, picos))
+        exp_t, exp_m = exponente(tokens, tiempos), exponente(tokens, picos)
+        marca = ""
+        if any(e is not None and e > UMBRAL_EXPONENTE for e in (exp_t, exp_m)):
+            marca = "  <- SUPERLINEAL"
+            superlineales.append(nombre)
+        texto = lambda e: f"{e:.2f}" if e is not None else "n/a"
+        print(f"{nombre:>13} {celdas} {texto(exp_t):>7} {texto(exp_m):>8}{marca}")
+    return superlineales
+
+
+def main():
+    argumentos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    rapido = "--rapido" in sys.argv
+    repeticiones = 1 if rapido else 3
+
+    inicializar_llvm()
+
+    resumen = {}
+    for parametro in argumentos or BARRIDOS:
+        valores = BARRIDOS[parametro][:3] if rapido else BARRIDOS[parametro]
+        resumen[parametro] = barrido(parametro, valores, repeticiones)
+
+    print("\n== Resumen ==")
+    for parametro, etapas in resumen.items():
+        print(f"{parametro:>17}: {', '.join(etapas) if etapas else 'todas lineales'}")
+    return 1 if any(resumen.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
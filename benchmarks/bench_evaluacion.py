@@ -0,0 +1,90 @@
+#BENCHMARK DE EVALUACION EN TIEMPO DE COMPILACION
+#Programa que llama funciones puras con argumentos constantes (fibonacci
+#recursivo, potencia con un bucle) dentro de un bucle, compilado con y sin
+#const_eval. Mide lo que cuesta la evaluación al compilar y el tiempo de
+#ejecución con lli -O2 y con opt -O2 antes de lli (opt no evalúa la recursión
+#de fibonacci). Verifica que la salida sea la misma en ambos casos.
+#Uso: python benchmarks/bench_evaluacion.py [n de fibonacci] [repeticiones]
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from const_eval import evaluar_en_compilacion
+from dead_code import eliminar_codigo_muerto
+from inliner import expandir_en_linea
+from ir_generator import LLVMGenerator
+from pipeline import construir_ast
+
+
+def programa(n):
+    return f"""Programa Constantes {{
+    funciones {{
+        entero fibonacci(entero n) {{
+            si (n < 2) {{ ret n; }}
+            ret fibonacci(n - 1) + fibonacci(n - 2);
+        }}
+        entero potencia(entero base, entero exp) {{
+            entero r = 1;
+            para (entero i = 0; i < exp; i = i + 1) {{ r = r * base; }}
+            ret r;
+        }}
+    }}
+    Inicio {{
+        entero s = 0;
+        para (entero i = 0; i < 20; i = i + 1) {{
+            s = s + fibonacci({n}) % 1000 + potencia(2, 16) + potencia(3, 20) % 7;
+        }}
+        pintar(s);
+    }} Fin
+}}
+"""
+
+
+def ejecutar(comando, repeticiones):
+    mejor, salida = float("inf"), None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        salida = subprocess.run(comando, capture_output=True, text=True, check=True).stdout
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, salida
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'evaluación':>10} {'evaluadas':>10} {'compilar (ms)':>14} {'lli -O2 (s)':>12} {'opt -O2 + lli (s)':>18}")
+        referencia = None
+        for evaluar in (False, True):
+            ast, _ = construir_ast(programa(n))
+            inicio = time.perf_counter()
+            evaluadas = evaluar_en_compilacion(ast) if evaluar else []
+            compilar = time.perf_counter() - inicio
+            expandir_en_linea(ast)
+            eliminar_codigo_muerto(ast)
+
+            ruta = os.path.join(tmp, f"evaluar{int(evaluar)}.ll")
+            optimizado = os.path.join(tmp, f"evaluar{int(evaluar)}.opt.ll")
+            with open(ruta, "w") as f:
+                f.write(str(LLVMGenerator().generate(ast)))
+            subprocess.run(["opt", "-O2", "-S", ruta, "-o", optimizado], check=True)
+
+            tiempos = []
+            for comando in (["lli", "-O2", ruta], ["lli", "-O2", optimizado]):
+                tiempo, salida = ejecutar(comando, repeticiones)
+                referencia = referencia or salida
+                if salida != referencia:
+                    raise RuntimeError(f"Salida distinta: {salida!r} != {referencia!r}")
+                tiempos.append(tiempo)
+            print(f"{'sí' if evaluar else 'no':>10} {len(evaluadas):>10} {compilar * 1000:>14.2f} "
+                  f"{tiempos[0]:>12.3f} {tiempos[1]:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
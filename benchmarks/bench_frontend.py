@@ -0,0 +1,84 @@
+#BENCHMARK DEL FRONTEND: ANTLR CONTRA hand_parser.py
+#Genera programas sintéticos grandes (benchmarks/generador.py) y mide el
+#frontend completo hasta el AST sin anotar: lexer, parser, semántica y AST.
+#  - antlr: parsear + analizar_semantica + ASTBuilder (pipeline.py),
+#  - manual: analizar_manual (tokenizar + HandParser + ASTSemanticAnalyzer).
+#Cada frontend corre en un proceso nuevo: la primera pasada incluye construir
+#el DFA de predicción de ANTLR y compilar la expresión regular (en frío) y las
+#siguientes los reusan (en caliente). Reporta líneas por segundo y verifica que
+#los AST, los errores y las advertencias sean idénticos.
+#Uso: python benchmarks/bench_frontend.py [funciones ...]
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.setrecursionlimit(100000)
+
+from generador import generar_programa
+
+PASADAS = 3
+
+
+def analizar(frontend, ruta):
+    """Se ejecuta en el proceso hijo: retorna ([segundos por pasada], resultado comparable)"""
+    from antlr4 import InputStream
+    from ast_builder import ASTBuilder
+    from bench_gramatica import estructura
+    from hand_parser import analizar_manual
+    from pipeline import analizar_semantica, parsear
+
+    with open(ruta, encoding="utf-8") as f:
+        codigo = f.read()
+    tiempos = []
+    for _ in range(PASADAS):
+        inicio = time.perf_counter()
+        if frontend == "manual":
+            ast, analizador = analizar_manual(codigo)
+        else:
+            tree = parsear(InputStream(codigo))
+            analizador = analizar_semantica(tree)
+            ast = ASTBuilder().visit(tree)
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos, (estructura(ast), analizador.errors, analizador.warnings)
+
+
+def en_proceso_nuevo(frontend, ruta):
+    salida = subprocess.run([sys.executable, __file__, "--analizar", frontend, ruta],
+                            capture_output=True, check=True).stdout
+    return pickle.loads(salida)
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or [100, 400]
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'funciones':>10} {'líneas':>8} {'frontend':>9} "
+              f"{'frío (lín/s)':>13} {'caliente (lín/s)':>17} {'aceleración':>12}")
+        for funciones in tamanos:
+            codigo = generar_programa(funciones=funciones, sentencias=20, semilla=funciones)
+            lineas = codigo.count("\n") + 1
+            ruta = os.path.join(tmp, f"programa{funciones}.txt")
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(codigo)
+
+            referencia = base = None
+            for frontend in ("antlr", "manual"):
+                tiempos, resultado = en_proceso_nuevo(frontend, ruta)
+                referencia = referencia or resultado
+                if resultado != referencia:
+                    raise RuntimeError(f"El frontend '{frontend}' difiere del de ANTLR")
+                caliente = min(tiempos[1:])
+                base = base or caliente
+                print(f"{funciones:>10} {lineas:>8} {frontend:>9} "
+                      f"{lineas / tiempos[0]:>13.0f} {lineas / caliente:>17.0f} {base / caliente:>11.1f}x")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--analizar"]:
+        sys.stdout.buffer.write(pickle.dumps(analizar(sys.argv[2], sys.argv[3])))
+    else:
+        main()
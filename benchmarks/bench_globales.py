@@ -0,0 +1,106 @@
+#BENCHMARK DE GLOBALES CONSTANTES
+#Compila el mismo programa dos veces: como lo genera LLVMGenerator (las globales
+#que nunca se asignan quedan como constantes, ver global_analysis.py) y con todas
+#las globales modificables y de enlace externo, como antes. Ambos pasan por
+#opt -O2 y se ejecutan con lli. Mide el tiempo de ejecución y cuántas lecturas
+#de globales quedan en el IR optimizado, y verifica que la salida sea la misma.
+#Uso: python benchmarks/bench_globales.py [iteraciones] [repeticiones]
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ir_generator import LLVMGenerator
+from pipeline import construir_ast
+
+
+def programa(iteraciones):
+    return f"""Programa Globales {{
+    entero modulo = 1000003;
+    entero factor = 31;
+    entero vueltas = {iteraciones};
+    entero pasos = 8;
+    decimal escala = 1.0 / factor;
+    entero acumulado = 0;
+    funciones {{
+        entero mezcla(entero x) {{
+            entero r = x;
+            entero i = 0;
+            mientras (i < pasos) {{
+                r = (r * factor + i) % modulo;
+                i = i + 1;
+            }}
+            ret r;
+        }}
+        void acumular(entero x) {{
+            acumulado = (acumulado + x) % modulo;
+        }}
+    }}
+    Inicio {{
+        entero i = 0;
+        mientras (i < vueltas) {{
+            acumular(mezcla(i));
+            i = i + 1;
+        }}
+        pintar(acumulado, acumulado * escala);
+    }}
+    Fin
+}}
+"""
+
+
+def modificables(module, ast):
+    """Las globales como antes: enlace externo y ninguna constante"""
+    for decl in ast.globals:
+        global_var = module.get_global(decl.identifier)
+        global_var.linkage = ''
+        global_var.global_constant = False
+    return module
+
+
+def ejecutar(comando, repeticiones):
+    mejor, salida = float("inf"), None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        salida = subprocess.run(comando, capture_output=True, text=True, check=True).stdout
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, salida
+
+
+def main():
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else 30000000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'globales':>14} {'constantes':>11} {'lecturas -O2':>13} {'opt -O2 + lli (s)':>18}")
+        referencia = None
+        for variante in ("modificables", "constantes"):
+            ast, _ = construir_ast(programa(iteraciones))
+            module = LLVMGenerator().generate(ast)
+            if variante == "modificables":
+                module = modificables(module, ast)
+            constantes = sum(1 for decl in ast.globals
+                             if module.get_global(decl.identifier).global_constant)
+
+            ruta = os.path.join(tmp, "programa.ll")
+            optimizado = os.path.join(tmp, "programa.opt.ll")
+            with open(ruta, "w") as f:
+                f.write(str(module))
+            subprocess.run(["opt", "-O2", "-S", ruta, "-o", optimizado], check=True)
+            with open(optimizado) as f:
+                texto = f.read()
+            lecturas = sum(1 for linea in texto.splitlines() if " = load " in linea and "* @" in linea)
+
+            tiempo, salida = ejecutar(["lli", "-O2", optimizado], repeticiones)
+            referencia = referencia or salida
+            if salida != referencia:
+                raise RuntimeError(f"Salida distinta: {salida!r} != {referencia!r}")
+            print(f"{variante:>14} {constantes:>11} {lecturas:>13} {tiempo:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
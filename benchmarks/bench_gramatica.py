@@ -0,0 +1,106 @@
+#BENCHMARK DE LA GRAMATICA: Expr.g4 CONTRA ExprPrecedencia.g4
+#Genera programas sintéticos grandes (benchmarks/generador.py) y los analiza con
+#ExprParser + ASTBuilder y con ExprPrecedencia + PrecedenceASTBuilder
+#(precedence_parser.py). Cada gramática corre en un proceso nuevo: la primera
+#pasada incluye construir el DFA de predicción (en frío) y las siguientes lo
+#reusan (en caliente). Reporta los nodos del árbol de análisis (contextos de
+#regla y terminales), el tiempo del parser y el de construir el AST, y verifica
+#que los dos AST sean idénticos (clases, campos y líneas).
+#Uso: python benchmarks/bench_gramatica.py [funciones ...]
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.setrecursionlimit(100000)
+
+from generador import generar_programa
+
+PASADAS = 3
+
+
+def estructura(node):
+    """AST como tuplas comparables: clase, línea y campos de cada nodo"""
+    from ast_builder import ASTNode
+    if isinstance(node, ASTNode):
+        campos = tuple((k, estructura(v)) for k, v in sorted(vars(node).items()) if k != "line")
+        return type(node).__name__, node.line, campos
+    if isinstance(node, list):
+        return tuple(estructura(item) for item in node)
+    return type(node).__name__, node
+
+
+def contar_nodos(tree):
+    """(contextos de regla, terminales) del árbol de análisis, sin recursión"""
+    from antlr4 import ParserRuleContext
+    reglas = terminales = 0
+    pendientes = [tree]
+    while pendientes:
+        node = pendientes.pop()
+        if isinstance(node, ParserRuleContext):
+            reglas += 1
+            pendientes.extend(node.children or ())
+        else:
+            terminales += 1
+    return reglas, terminales
+
+
+def analizar(gramatica, ruta):
+    """Se ejecuta en el proceso hijo: retorna ([(s. parser, s. AST) por pasada], nodos, AST)"""
+    from antlr4 import FileStream, CommonTokenStream
+    from keyword_lexer import crear_lexer
+    if gramatica == "expr":
+        from ExprParser import ExprParser as Parser
+        from ast_builder import ASTBuilder as Builder
+    else:
+        from ExprPrecedencia import ExprPrecedencia as Parser
+        from precedence_parser import PrecedenceASTBuilder as Builder
+
+    tiempos = []
+    for _ in range(PASADAS):
+        tokens = CommonTokenStream(crear_lexer(FileStream(ruta, encoding="utf-8")))
+        tokens.fill()  # el lexer queda fuera de la medición
+        inicio = time.perf_counter()
+        tree = Parser(tokens).prog()
+        medio = time.perf_counter()
+        ast = Builder().visit(tree)
+        tiempos.append((medio - inicio, time.perf_counter() - medio))
+    return tiempos, contar_nodos(tree), estructura(ast)
+
+
+def en_proceso_nuevo(gramatica, ruta):
+    salida = subprocess.run([sys.executable, __file__, "--analizar", gramatica, ruta],
+                            capture_output=True, check=True).stdout
+    return pickle.loads(salida)
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or [100, 400]
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'funciones':>10} {'gramática':>11} {'contextos':>10} {'terminales':>11} "
+              f"{'parser frío (s)':>16} {'parser (s)':>11} {'AST (s)':>8}")
+        for funciones in tamanos:
+            ruta = os.path.join(tmp, f"programa{funciones}.txt")
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(generar_programa(funciones=funciones, sentencias=20, semilla=funciones))
+
+            referencia = None
+            for gramatica in ("expr", "precedencia"):
+                tiempos, (reglas, terminales), ast = en_proceso_nuevo(gramatica, ruta)
+                referencia = referencia or ast
+                if ast != referencia:
+                    raise RuntimeError(f"El AST de '{gramatica}' difiere del de Expr.g4")
+                caliente = min(tiempos[1:])
+                print(f"{funciones:>10} {gramatica:>11} {reglas:>10} {terminales:>11} "
+                      f"{tiempos[0][0]:>16.2f} {caliente[0]:>11.2f} {caliente[1]:>8.2f}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--analizar"]:
+        sys.stdout.buffer.write(pickle.dumps(analizar(sys.argv[2], sys.argv[3])))
+    else:
+        main()
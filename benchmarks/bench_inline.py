@@ -0,0 +1,92 @@
+#BENCHMARK DE EXPANSION EN LINEA
+#Programa con funciones auxiliares pequeñas llamadas en un bucle caliente,
+#compilado sin expansión (umbral 0) y con varios umbrales. Mide el tamaño del IR
+#y el tiempo de ejecución con lli -O0 y lli -O2 (lli sólo optimiza el código
+#máquina: no expande llamadas) y con opt -O2 antes de lli. Verifica que la
+#salida sea la misma en todos los casos.
+#Uso: python benchmarks/bench_inline.py [iteraciones] [repeticiones]
+import copy
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dead_code import eliminar_codigo_muerto
+from inliner import expandir_en_linea
+from ir_generator import LLVMGenerator
+from pipeline import construir_ast
+
+UMBRALES = (0, 20, 40, 80)
+
+
+def programa(iteraciones):
+    return f"""Programa Auxiliares {{
+    funciones {{
+        entero cuadrado(entero x) {{ ret x * x; }}
+        entero absoluto(entero x) {{ si (x < 0) {{ ret -x; }} ret x; }}
+        entero mayor(entero a, entero b) {{ si (a > b) {{ ret a; }} sino {{ ret b; }} }}
+        decimal promedio(entero a, entero b) {{ ret (a + b) / 2.0; }}
+        entero acotar(entero x, entero tope) {{ entero r = absoluto(x) % tope; ret mayor(r, 1); }}
+    }}
+    Inicio {{
+        entero i = 0;
+        entero s = 0;
+        decimal d = 0.0;
+        mientras (i < {iteraciones}) {{
+            s = s + cuadrado(i % 100) + absoluto(50 - i % 100);
+            s = acotar(s, 100000) + mayor(i % 7, 3);
+            d = d + promedio(i, s);
+            i = i + 1;
+        }}
+        pintar(s, d);
+    }} Fin
+}}
+"""
+
+
+def ejecutar(comando, repeticiones):
+    mejor, salida = float("inf"), None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        salida = subprocess.run(comando, capture_output=True, text=True, check=True).stdout
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, salida
+
+
+def main():
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else 30000000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    ast, _ = construir_ast(programa(iteraciones))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'umbral':>7} {'expandidas':>11} {'IR (KiB)':>9} {'lli -O0 (s)':>12} {'lli -O2 (s)':>12} "
+              f"{'opt -O2 + lli (s)':>18}")
+        referencia = None
+        for umbral in UMBRALES:
+            copia = copy.deepcopy(ast)
+            expandidas = expandir_en_linea(copia, umbral)
+            eliminar_codigo_muerto(copia)
+            ir = str(LLVMGenerator().generate(copia))
+            ruta = os.path.join(tmp, f"umbral{umbral}.ll")
+            optimizado = os.path.join(tmp, f"umbral{umbral}.opt.ll")
+            with open(ruta, "w") as f:
+                f.write(ir)
+            subprocess.run(["opt", "-O2", "-S", ruta, "-o", optimizado], check=True)
+
+            tiempos = []
+            for comando in (["lli", "-O0", ruta], ["lli", "-O2", ruta], ["lli", "-O2", optimizado]):
+                tiempo, salida = ejecutar(comando, repeticiones)
+                referencia = referencia or salida
+                if salida != referencia:
+                    raise RuntimeError(f"Salida distinta con umbral {umbral}: {salida!r} != {referencia!r}")
+                tiempos.append(tiempo)
+            print(f"{umbral:>7} {len(expandidas):>11} {len(ir) / 1024:>9.1f} {tiempos[0]:>12.3f} "
+                  f"{tiempos[1]:>12.3f} {tiempos[2]:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
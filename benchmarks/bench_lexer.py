@@ -0,0 +1,74 @@
+#BENCHMARK DEL LEXER: ExprLexer CONTRA KeywordTableLexer
+#Genera programas sintéticos grandes (benchmarks/generador.py) y los pasa por
+#los dos lexers de keyword_lexer.py. Cada lexer corre en un proceso nuevo: la
+#primera pasada incluye construir su DFA (en frío) y las siguientes lo reusan
+#(en caliente). Reporta tokens por segundo, los estados del DFA del lexer y
+#verifica que los tokens (tipo, texto, línea, columna, posición) sean idénticos.
+#Uso: python benchmarks/bench_lexer.py [funciones ...]
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.setrecursionlimit(100000)
+
+from generador import generar_programa
+
+PASADAS = 3
+
+
+def lexear(tipo, ruta):
+    """Se ejecuta en el proceso hijo: retorna ([segundos por pasada], estados del DFA, tokens)"""
+    from antlr4 import FileStream, Token
+    from keyword_lexer import crear_lexer
+
+    tiempos = []
+    for _ in range(PASADAS):
+        lexer = crear_lexer(FileStream(ruta, encoding="utf-8"), tipo)
+        tokens = []
+        inicio = time.perf_counter()
+        while True:
+            token = lexer.nextToken()
+            tokens.append(token)
+            if token.type == Token.EOF:
+                break
+        tiempos.append(time.perf_counter() - inicio)
+    estados = sum(len(dfa.states) for dfa in type(lexer).decisionsToDFA)
+    return tiempos, estados, [(t.type, t.text, t.line, t.column, t.start, t.stop) for t in tokens]
+
+
+def en_proceso_nuevo(tipo, ruta):
+    salida = subprocess.run([sys.executable, __file__, "--lexear", tipo, ruta],
+                            capture_output=True, check=True).stdout
+    return pickle.loads(salida)
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or [200, 800]
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'funciones':>10} {'tokens':>9} {'lexer':>6} {'estados DFA':>12} "
+              f"{'frío (tok/s)':>13} {'caliente (tok/s)':>17}")
+        for funciones in tamanos:
+            ruta = os.path.join(tmp, f"programa{funciones}.txt")
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(generar_programa(funciones=funciones, sentencias=20, semilla=funciones))
+
+            referencia = None
+            for tipo in ("antlr", "tabla"):
+                tiempos, estados, tokens = en_proceso_nuevo(tipo, ruta)
+                referencia = referencia or tokens
+                if tokens != referencia:
+                    raise RuntimeError(f"Los tokens de '{tipo}' difieren de los de ExprLexer")
+                print(f"{funciones:>10} {len(tokens):>9} {tipo:>6} {estados:>12} "
+                      f"{len(tokens) / tiempos[0]:>13.0f} {len(tokens) / min(tiempos[1:]):>17.0f}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--lexear"]:
+        sys.stdout.buffer.write(pickle.dumps(lexear(sys.argv[2], sys.argv[3])))
+    else:
+        main()
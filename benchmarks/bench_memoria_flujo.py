@@ -0,0 +1,68 @@
+#BENCHMARK DE MEMORIA PICO: FLUJO NORMAL CONTRA COMPILACION EN FLUJO
+#Genera programas sintéticos (benchmarks/generador.py) de tamaño creciente y
+#compila cada uno hasta un módulo de LLVM de dos formas: el flujo normal
+#(construir_ast + LLVMGenerator sobre el programa entero) y
+#streaming_compiler.compilar_en_flujo. Cada compilación corre en un proceso
+#nuevo para medir su RSS pico (ru_maxrss), que incluye lo que reserva LLVM.
+#Uso: python benchmarks/bench_memoria_flujo.py [funciones ...]
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.setrecursionlimit(100000)
+
+from generador import generar_programa
+
+
+def medir(modo, ruta):
+    """Se ejecuta en el proceso hijo: compila 'ruta' e imprime segundos y RSS pico (KiB)"""
+    inicio = time.perf_counter()
+    if modo == "normal":
+        from ir_generator import LLVMGenerator
+        from module_io import modulo_binario
+        from pipeline import construir_ast
+        with open(ruta, encoding="utf-8") as f:
+            ast, _ = construir_ast(f.read())
+        module = modulo_binario(LLVMGenerator().generate(ast))
+    else:
+        from streaming_compiler import compilar_en_flujo
+        module, errores, _ = compilar_en_flujo(ruta)
+        if errores:
+            raise RuntimeError("\n".join(errores))
+    segundos = time.perf_counter() - inicio
+    print(segundos, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def en_proceso_nuevo(modo, ruta):
+    salida = subprocess.run([sys.executable, __file__, "--medir", modo, ruta],
+                            capture_output=True, text=True, check=True).stdout
+    segundos, rss = salida.split()
+    return float(segundos), int(rss) / 1024
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or [100, 400, 1600]
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'funciones':>10} {'fuente (MiB)':>13} {'normal (MiB)':>13} {'flujo (MiB)':>12} "
+              f"{'normal (s)':>11} {'flujo (s)':>10}")
+        for funciones in tamanos:
+            ruta = os.path.join(tmp, f"programa{funciones}.txt")
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(generar_programa(funciones=funciones, sentencias=20, semilla=funciones))
+            fuente = os.path.getsize(ruta) / 2 ** 20
+            t_normal, rss_normal = en_proceso_nuevo("normal", ruta)
+            t_flujo, rss_flujo = en_proceso_nuevo("flujo", ruta)
+            print(f"{funciones:>10} {fuente:>13.1f} {rss_normal:>13.1f} {rss_flujo:>12.1f} "
+                  f"{t_normal:>11.2f} {t_flujo:>10.2f}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--medir"]:
+        medir(sys.argv[2], sys.argv[3])
+    else:
+        main()
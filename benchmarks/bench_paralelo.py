@@ -0,0 +1,63 @@
+#BENCHMARK DE COMPILACION PARALELA POR FUNCION
+#Compila programas sintéticos con muchas funciones en modo secuencial y con
+#1..N procesos, y reporta el tiempo de pared y la aceleración obtenida.
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parallel_compiler import compilar_paralelo, _compilar_secuencial
+
+
+def programa_sintetico(funciones):
+    cuerpos = []
+    for i in range(funciones):
+        llamada = f"f{i - 1}(n - 1)" if i else "n"
+        cuerpos.append(f"""        entero f{i}(entero n) {{
+            entero total = 0;
+            entero j = 0;
+            para (j = 0; j < n; j = j + 1) {{
+                si (j % 2 == 0) {{ total = total + j * {i + 1}; }} sino {{ total = total - 1; }}
+            }}
+            mientras (total > 1000) {{ total = total / 2; }}
+            ret total + {llamada};
+        }}""")
+    return f"""Programa Sintetico {{
+    funciones {{
+{chr(10).join(cuerpos)}
+    }}
+    Inicio {{
+        pintar(f{funciones - 1}(10));
+    }} Fin
+}}"""
+
+
+def medir(funcion, *args):
+    inicio = time.perf_counter()
+    module, errors, _ = funcion(*args)
+    if errors or module is None:
+        raise RuntimeError("\n".join(errors))
+    return time.perf_counter() - inicio
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    tamanos = [int(t) for t in sys.argv[1:]] or [200, 800]
+    nucleos = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, 8, nucleos} & set(range(1, nucleos + 1)))
+
+    for funciones in tamanos:
+        codigo = programa_sintetico(funciones)
+        base = medir(_compilar_secuencial, codigo)
+        print(f"\n== {funciones} funciones ({len(codigo.splitlines())} líneas) ==")
+        print(f"{'modo':>12} {'tiempo (s)':>11} {'aceleración':>12}")
+        print(f"{'secuencial':>12} {base:>11.2f} {1.0:>11.2f}x")
+        for n in workers:
+            segundos = medir(compilar_paralelo, codigo, n)
+            print(f"{f'{n} proc.':>12} {segundos:>11.2f} {base / segundos:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
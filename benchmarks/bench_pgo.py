@@ -0,0 +1,116 @@
+#BENCHMARK DE OPTIMIZACION GUIADA POR PERFIL (PGO)
+#Para cada programa de muestra:
+#1. Compila con contadores (LLVMGenerator(profile_path=...)), lo ejecuta y guarda el perfil.
+#2. Compila a ejecutable nativo con -O2 sin perfil y con el perfil aplicado.
+#3. Ejecuta ambos varias veces y compara el mejor tiempo.
+#4. Verifica que el ejecutable con PGO dé la misma salida partido en varias
+#   particiones del backend paralelo (parallel_backend.py).
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from ir_generator import LLVMGenerator
+from parallel_backend import compilar_objetos, enlazar_ejecutable
+from pipeline import construir_ast
+from profile_report import leer_perfil
+
+PRIMOS = """Programa Primos {
+    funciones {
+        bool es_primo(entero n) {
+            si (n < 2) { ret falso; }
+            entero d = 2;
+            mientras (d * d <= n) {
+                si (n % d == 0) { ret falso; }
+                d = d + 1;
+            }
+            ret verdad;
+        }
+    }
+    Inicio {
+        entero total = 0;
+        entero i = 0;
+        para (i = 0; i < 300000; i = i + 1) {
+            si (es_primo(i)) { total = total + 1; }
+        }
+        pintar("primos:", total);
+    } Fin
+}
+"""
+
+COLLATZ = """Programa Collatz {
+    funciones {
+        entero pasos(entero n) {
+            entero p = 0;
+            mientras (n != 1) {
+                si (n % 2 == 0) { n = n / 2; } sino { n = 3 * n + 1; }
+                p = p + 1;
+            }
+            ret p;
+        }
+        entero raro(entero n) {
+            ret n * n - 1;
+        }
+    }
+    Inicio {
+        entero suma = 0;
+        entero i = 1;
+        para (i = 1; i < 100000; i = i + 1) {
+            si (i == 7) { suma = suma + raro(i); } sino { suma = suma + pasos(i); }
+        }
+        pintar("pasos:", suma);
+    } Fin
+}
+"""
+
+
+def muestras():
+    # a.txt calcula fibonacci(0..59) de forma recursiva: se acota para que termine
+    fibonacci = (RAIZ / "a.txt").read_text(encoding="utf-8").replace("i < 60", "i < 35")
+    return [("fibonacci (a.txt, n<35)", fibonacci), ("primos", PRIMOS), ("collatz", COLLATZ)]
+
+
+def ejecutable(codigo, salida, particiones=1, **opciones):
+    ast, _ = construir_ast(codigo)
+    module = LLVMGenerator(**opciones).generate(ast)
+    objetos, _ = compilar_objetos(module, workers=min(particiones, 2), particiones=particiones, opt_level=2)
+    return enlazar_ejecutable(objetos, salida)
+
+
+def cronometrar(programa, repeticiones):
+    mejor, salida = float("inf"), None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        salida = subprocess.run([programa], capture_output=True, text=True, check=True).stdout
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, salida
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'programa':>26} {'sin PGO (s)':>12} {'con PGO (s)':>12} {'aceleración':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for nombre, codigo in muestras():
+            perfil = os.path.join(tmp, "programa.perfil")
+            subprocess.run([ejecutable(codigo, os.path.join(tmp, "instrumentado"), profile_path=perfil)],
+                           capture_output=True, check=True)
+
+            base = ejecutable(codigo, os.path.join(tmp, "base"))
+            pgo = ejecutable(codigo, os.path.join(tmp, "pgo"), pgo_profile=leer_perfil(perfil))
+            t_base, salida_base = cronometrar(base, repeticiones)
+            t_pgo, salida_pgo = cronometrar(pgo, repeticiones)
+            if salida_base != salida_pgo:
+                raise RuntimeError(f"{nombre}: la salida con PGO no coincide")
+            particionado = ejecutable(codigo, os.path.join(tmp, "pgo3"), particiones=3, pgo_profile=leer_perfil(perfil))
+            if subprocess.run([particionado], capture_output=True, text=True, check=True).stdout != salida_base:
+                raise RuntimeError(f"{nombre}: la salida con PGO en 3 particiones no coincide")
+            print(f"{nombre:>26} {t_base:>12.3f} {t_pgo:>12.3f} {t_base / t_pgo:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
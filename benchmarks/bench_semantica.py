@@ -0,0 +1,89 @@
+#BENCHMARK DE ESCALABILIDAD DEL ANALISIS SEMANTICO
+#Genera programas con expresiones y asignaciones profundamente anidadas, y con
+#bloques anidados llenos de variables locales, y mide el tiempo de
+#SemanticListener por nodo del árbol. Si el análisis es lineal,
+#el tiempo por nodo se mantiene aproximadamente constante al crecer la profundidad.
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.setrecursionlimit(100000)
+
+from antlr4 import InputStream
+from pipeline import parsear, analizar_semantica
+
+
+def programa_anidado(profundidad):
+    """Programa con paréntesis, sumas y una cadena de asignaciones de 'profundidad' niveles"""
+    variables = [f"v{i}" for i in range(profundidad)]
+    declaraciones = "\n".join(f"        entero {v} = {i};" for i, v in enumerate(variables))
+    expresion = "1"
+    for v in variables:
+        expresion = f"({expresion} + {v} * 2)"
+    cadena = " = ".join(variables) + f" = {expresion};"
+    return f"""Programa Anidado {{
+    Inicio {{
+{declaraciones}
+        {cadena}
+        pintar({variables[0]});
+    }} Fin
+}}"""
+
+
+def programa_bloques(profundidad, locales=5):
+    """Programa con 'profundidad' bloques anidados, cada uno con varias locales"""
+    cuerpo = "pintar(x0_0);"
+    for nivel in reversed(range(profundidad)):
+        decls = " ".join(f"entero x{nivel}_{i} = {i};" for i in range(locales))
+        usos = " + ".join(f"x{nivel}_{i}" for i in range(locales))
+        cuerpo = f"si (verdad) {{ {decls} pintar({usos}); {cuerpo} }}"
+    return f"""Programa Bloques {{
+    Inicio {{
+        {cuerpo}
+    }} Fin
+}}"""
+
+
+def contar_nodos(tree):
+    total, pendientes = 0, [tree]
+    while pendientes:
+        nodo = pendientes.pop()
+        total += 1
+        pendientes.extend(getattr(nodo, "children", None) or [])
+    return total
+
+
+def medir(generador, profundidad, repeticiones=3):
+    tree = parsear(InputStream(generador(profundidad)))
+    nodos = contar_nodos(tree)
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        analizar_semantica(tree)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return nodos, mejor
+
+
+def escenario(titulo, generador, profundidades):
+    print(f"\n== {titulo} ==")
+    print(f"{'profundidad':>12} {'nodos':>8} {'tiempo (ms)':>12} {'µs/nodo':>10}")
+    por_nodo = []
+    for profundidad in profundidades:
+        nodos, segundos = medir(generador, profundidad)
+        por_nodo.append(segundos * 1e6 / nodos)
+        print(f"{profundidad:>12} {nodos:>8} {segundos * 1000:>12.2f} {por_nodo[-1]:>10.2f}")
+
+    crecimiento = por_nodo[-1] / por_nodo[0]
+    estado = "lineal" if crecimiento < 2 else "SUPERLINEAL"
+    print(f"Costo por nodo (mayor/menor): {crecimiento:.2f}x -> {estado}")
+
+
+def main():
+    profundidades = [int(p) for p in sys.argv[1:]] or [10, 20, 40, 80, 160]
+    escenario("Expresiones y asignaciones anidadas", programa_anidado, profundidades)
+    escenario("Bloques anidados con locales", programa_bloques, profundidades)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#BENCHMARK DE SERIALIZACION DEL IR: TEXTO (.ll) CONTRA BITCODE (.bc) Y MEMORIA
+#Para programas generados de distinto tamaño mide:
+#  - escribir y leer el módulo como texto y como bitcode (llvmlite.binding),
+#  - el tamaño de cada archivo,
+#  - cuánto tarda opt -O2 sólo en leer cada formato (sin pases, -o /dev/null),
+#  - el flujo completo hasta un archivo optimizado: el anterior de test.py
+#    (texto -> .ll -> opt -O2 -> .ll), el actual (un solo análisis -> .bc ->
+#    opt -O2 -> .bc) y todo dentro del proceso (un solo análisis -> -O2 con
+#    llvmlite -> .bc), que es lo que usan el servidor y el JIT.
+#Los tres flujos imprimen una vez el texto de llvmlite.ir: llvmlite no tiene
+#otra forma de pasar el módulo a LLVM.
+#Uso: python benchmarks/bench_serializacion.py [repeticiones]
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.setrecursionlimit(100000)
+
+import llvmlite.binding as llvm
+
+from generador import generar_programa
+from ir_generator import LLVMGenerator
+from module_io import guardar_bitcode, modulo_binario, optimizar
+from pipeline import construir_ast
+
+
+def mejor_de(repeticiones, funcion):
+    mejor, resultado = float("inf"), None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def flujo_texto(module, tmp):
+    ll = os.path.join(tmp, "texto.ll")
+    with open(ll, "w") as f:
+        f.write(str(module))
+    subprocess.run(["opt", "-O2", "-S", ll, "-o", os.path.join(tmp, "texto_opt.ll")], check=True)
+
+
+def flujo_bitcode(module, tmp):
+    bc = os.path.join(tmp, "bitcode.bc")
+    guardar_bitcode(module, bc)
+    subprocess.run(["opt", "-O2", bc, "-o", os.path.join(tmp, "bitcode_opt.bc")], check=True)
+
+
+def flujo_memoria(module, tmp):
+    guardar_bitcode(optimizar(module, 2), os.path.join(tmp, "memoria_opt.bc"))
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'funciones':>9} {'.ll (KiB)':>10} {'.bc (KiB)':>10} {'escribir ll':>12} {'escribir bc':>12} "
+              f"{'leer ll':>9} {'leer bc':>9} {'opt lee ll':>11} {'opt lee bc':>11} "
+              f"{'flujo texto':>12} {'flujo bitcode':>14} {'flujo memoria':>14}   (tiempos en ms)")
+        for funciones in (20, 100, 400):
+            ast, _ = construir_ast(generar_programa(funciones=funciones, semilla=funciones))
+            module = LLVMGenerator().generate(ast)
+            binario = modulo_binario(module)
+
+            escribir_ll, texto = mejor_de(repeticiones, lambda: str(binario))
+            escribir_bc, bitcode = mejor_de(repeticiones, binario.as_bitcode)
+            leer_ll, _ = mejor_de(repeticiones, lambda: llvm.parse_assembly(texto))
+            leer_bc, _ = mejor_de(repeticiones, lambda: llvm.parse_bitcode(bitcode))
+
+            ll, bc = os.path.join(tmp, "modulo.ll"), os.path.join(tmp, "modulo.bc")
+            with open(ll, "w") as f:
+                f.write(texto)
+            with open(bc, "wb") as f:
+                f.write(bitcode)
+            opt_ll, _ = mejor_de(repeticiones, lambda: subprocess.run(["opt", ll, "-o", os.devnull], check=True))
+            opt_bc, _ = mejor_de(repeticiones, lambda: subprocess.run(["opt", bc, "-o", os.devnull], check=True))
+
+            texto_total, _ = mejor_de(repeticiones, lambda: flujo_texto(module, tmp))
+            bitcode_total, _ = mejor_de(repeticiones, lambda: flujo_bitcode(module, tmp))
+            memoria_total, _ = mejor_de(repeticiones, lambda: flujo_memoria(module, tmp))
+
+            print(f"{funciones:>9} {len(texto) / 1024:>10.0f} {len(bitcode) / 1024:>10.0f} "
+                  f"{escribir_ll * 1000:>12.1f} {escribir_bc * 1000:>12.1f} {leer_ll * 1000:>9.1f} "
+                  f"{leer_bc * 1000:>9.1f} {opt_ll * 1000:>11.1f} {opt_bc * 1000:>11.1f} "
+                  f"{texto_total * 1000:>12.1f} {bitcode_total * 1000:>14.1f} {memoria_total * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#BENCHMARK DEL SERVIDOR DE COMPILACION
+#Compara la latencia de compilar un programa a IR en un proceso nuevo (paga
+#imports, llvm.initialize() y la caché DFA vacía cada vez) contra pedírselo al
+#servidor residente con el cliente liviano: fuente nuevo y fuente repetido (caché).
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from compile_client import enviar
+from generador import generar_programa
+
+PROCESO_NUEVO = """
+import sys
+from ir_generator import LLVMGenerator
+from pipeline import construir_ast
+sys.setrecursionlimit(10000)
+ast, _ = construir_ast(open(sys.argv[1], encoding="utf-8").read())
+str(LLVMGenerator().generate(ast))
+"""
+
+
+def cronometrar(comando, repeticiones, **kwargs):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run(comando, check=True, capture_output=True, **kwargs)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_ = os.path.join(tmp, "servidor.sock")
+        entorno = dict(os.environ, COMPILADOR_SOCKET=socket_)
+        servidor = subprocess.Popen([sys.executable, str(RAIZ / "compile_server.py")], cwd=RAIZ, env=entorno,
+                                    stdout=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(socket_):
+                time.sleep(0.05)
+            cliente = [sys.executable, str(RAIZ / "compile_client.py"), "compilar"]
+
+            print(f"{'funciones':>10} {'proceso nuevo (ms)':>19} {'servidor, nuevo (ms)':>21} {'repetido, en caché (ms)':>24}")
+            for funciones in (5, 50):
+                ruta = os.path.join(tmp, f"programa{funciones}.txt")
+                with open(ruta, "w", encoding="utf-8") as f:
+                    f.write(generar_programa(funciones=funciones, semilla=funciones))
+
+                nuevo = cronometrar([sys.executable, "-c", PROCESO_NUEVO, ruta], repeticiones, cwd=RAIZ)
+                frio = cronometrar(cliente + [ruta], 1, env=entorno)
+                caliente = cronometrar(cliente + [ruta], repeticiones, env=entorno)
+                print(f"{funciones:>10} {nuevo * 1000:>19.1f} {frio * 1000:>21.1f} {caliente * 1000:>24.1f}")
+        finally:
+            enviar({"accion": "detener"}, socket_)
+            servidor.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#VERIFICACION DE ELIMINACION DE CODIGO MUERTO
+#Programas de regresión para dead_code.py: cada uno se compila sin y con la
+#pasada y se ejecuta con lli; la salida tiene que ser la misma. Cubren variables
+#que nunca se leen pero tienen alguna asignación que no se puede quitar (una
+#llamada detrás de && o ||, dos llamadas en la cláusula de un 'para'): la
+#declaración tiene que quedarse, si no TypeAnnotator falla con "no definida".
+#Termina con código 1 si algún programa falla o difiere.
+#Uso: python benchmarks/check_codigo_muerto.py
+import copy
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dead_code import eliminar_codigo_muerto
+from ir_generator import LLVMGenerator
+from pipeline import construir_ast
+
+FUNCIONES = """    funciones {
+        bool efecto() { pintar("efecto"); ret verdad; }
+        entero cuenta(entero x) { pintar("cuenta", x); ret x; }
+    }"""
+
+PROGRAMAS = {
+    "local con &&": """
+        bool b = falso;
+        b = verdad && efecto();
+        pintar("fin");""",
+    "local con ||": """
+        bool b = verdad;
+        b = falso || efecto();
+        b = falso;
+        pintar("fin");""",
+    "global con &&": """
+        g = verdad && efecto();
+        pintar("fin");""",
+    "para con dos llamadas": """
+        entero i = 0;
+        entero basura = 0;
+        para (i = 0; i < 2; basura = cuenta(i) + cuenta(i + 10)) {
+            i = i + 1;
+        }
+        pintar("fin", i);""",
+    "sin llamadas condicionales": """
+        entero x = cuenta(1);
+        x = cuenta(2) + 3;
+        pintar("fin");""",
+}
+
+
+def fuente(cuerpo):
+    return f"Programa Regresion {{\n    bool g = falso;\n{FUNCIONES}\n    Inicio {{{cuerpo}\n    }} Fin\n}}\n"
+
+
+def ejecutar(ast, eliminar, tmp):
+    ast = copy.deepcopy(ast)
+    if eliminar:
+        eliminar_codigo_muerto(ast)
+    ruta = os.path.join(tmp, "programa.ll")
+    with open(ruta, "w") as f:
+        f.write(str(LLVMGenerator().generate(ast)))
+    return subprocess.run(["lli", ruta], capture_output=True, text=True, check=True).stdout
+
+
+def main():
+    fallos = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for nombre, cuerpo in PROGRAMAS.items():
+            ast, _ = construir_ast(fuente(cuerpo))
+            try:
+                esperado, obtenido = ejecutar(ast, False, tmp), ejecutar(ast, True, tmp)
+                estado = "idéntico" if obtenido == esperado else f"DIFIERE: {esperado!r} != {obtenido!r}"
+            except Exception as e:
+                estado = f"FALLA: {type(e).__name__}: {e}"
+            print(f"{nombre:>28}  {estado}")
+            fallos += estado != "idéntico"
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
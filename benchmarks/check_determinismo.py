@@ -0,0 +1,72 @@
+#VERIFICACION DE EMISION DETERMINISTA
+#Compila el mismo fuente en procesos separados, cada uno con otra semilla de
+#hash de Python (PYTHONHASHSEED), y exige resultados idénticos byte a byte:
+#el IR de test.generar_llvm, el IR enlazado de la compilación paralela y los
+#objetos del backend particionado. Sin esto, las cachés por contenido (objetos
+#del JIT, servidor) fallan entre ejecuciones y los diffs de IR no sirven.
+#Termina con código 1 si alguna salida difiere.
+#Uso: python benchmarks/check_determinismo.py [procesos] [programa.txt ...]
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from generador import generar_programa
+
+HIJO = """
+import contextlib, hashlib, io, json, sys
+sys.setrecursionlimit(100000)
+import test
+from parallel_backend import compilar_objetos
+from parallel_compiler import compilar_paralelo
+ruta = sys.argv[1]
+with contextlib.redirect_stdout(io.StringIO()):
+    module = test.generar_llvm(ruta, nivel_ast=2)  # con todas las pasadas sobre el AST
+    paralelo, _, _ = compilar_paralelo(open(ruta, encoding="utf-8").read(), 2)
+    objetos, _ = compilar_objetos(paralelo, workers=2, particiones=4)
+resumen = lambda datos: hashlib.sha256(datos).hexdigest()
+print(json.dumps({
+    "ir": resumen(str(module).encode()),
+    "ir paralelo": resumen(str(paralelo).encode()),
+    "objetos": [resumen(objeto) for objeto in objetos],
+}))
+"""
+
+
+def compilar(ruta, semilla):
+    entorno = dict(os.environ, PYTHONHASHSEED=str(semilla))
+    salida = subprocess.run([sys.executable, "-c", HIJO, ruta], cwd=RAIZ, env=entorno,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(salida.strip().splitlines()[-1])
+
+
+def main():
+    argumentos = sys.argv[1:]
+    procesos = int(argumentos.pop(0)) if argumentos and argumentos[0].isdigit() else 3
+    with tempfile.TemporaryDirectory() as tmp:
+        programas = argumentos
+        if not programas:
+            programas = [str(RAIZ / "a.txt")]
+            for n in (5, 30):
+                ruta = os.path.join(tmp, f"generado{n}.txt")
+                with open(ruta, "w", encoding="utf-8") as f:
+                    f.write(generar_programa(funciones=n, cadenas=0.5, semilla=n))
+                programas.append(ruta)
+
+        fallos = 0
+        for ruta in programas:
+            resultados = [compilar(ruta, semilla) for semilla in range(procesos)]
+            distintos = [clave for clave in resultados[0] if any(r[clave] != resultados[0][clave] for r in resultados)]
+            estado = "idéntico" if not distintos else "DIFIERE: " + ", ".join(distintos)
+            print(f"{os.path.basename(ruta):>16}  {procesos} procesos  {estado}")
+            fallos += bool(distintos)
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#VERIFICACION DE LAS PASADAS SOBRE EL AST (EXPANSION EN LINEA)
+#Programas de regresión para inliner.py: cada uno se compila con el nivel 0 y el
+#nivel 2 de pipeline.optimizar_ast (evaluación, expansión en línea y código
+#muerto) y se ejecuta con lli; la salida tiene que ser la misma. Cubren el orden
+#de evaluación al subir una llamada antes de su sentencia (un operando anterior
+#lee lo que escriben la función o sus argumentos) y locales del cuerpo que tapan
+#una global del mismo nombre.
+#Termina con código 1 si algún programa falla o difiere.
+#Uso: python benchmarks/check_en_linea.py
+import copy
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ir_generator import LLVMGenerator
+from pipeline import construir_ast, optimizar_ast
+
+PROGRAMAS = {
+    "global escrita en el argumento": """Programa P {
+    entero g = 1;
+    funciones {
+        entero h() { g = 100; ret 0; }
+        entero f(entero x) { ret x + 2; }
+    }
+    Inicio {
+        pintar(g, f(h()));
+    } Fin
+}""",
+    "local asignada en el argumento": """Programa P {
+    funciones {
+        entero f(entero x) { ret x + 1; }
+    }
+    Inicio {
+        entero x = 5;
+        pintar(x, f(x = 3));
+        pintar(x);
+    } Fin
+}""",
+    "global escrita por la función": """Programa P {
+    entero g = 1;
+    funciones {
+        entero f(entero x) { g = g + x; ret g; }
+    }
+    Inicio {
+        entero y = 2;
+        pintar(g, f(y), g);
+    } Fin
+}""",
+    "local que tapa una global": """Programa P {
+    entero g = 10;
+    funciones {
+        entero f(bool c) { { entero g = 1; si (c) { ret g; } } ret g; }
+    }
+    Inicio {
+        bool c = falso;
+        pintar(f(c), f(!c));
+    } Fin
+}""",
+    "argumentos sin efectos": """Programa P {
+    entero g = 1;
+    funciones {
+        entero f(entero x) { ret x * 2; }
+    }
+    Inicio {
+        entero y = 4;
+        pintar(y, g, f(y + g));
+    } Fin
+}""",
+}
+
+
+def ejecutar(ast, nivel, tmp):
+    ast = copy.deepcopy(ast)
+    expandidas = len(optimizar_ast(ast, nivel).get("en_linea", []))
+    ruta = os.path.join(tmp, "programa.ll")
+    with open(ruta, "w") as f:
+        f.write(str(LLVMGenerator().generate(ast)))
+    return subprocess.run(["lli", ruta], capture_output=True, text=True, check=True).stdout, expandidas
+
+
+def main():
+    fallos = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for nombre, codigo in PROGRAMAS.items():
+            ast, _ = construir_ast(codigo)
+            try:
+                (esperado, _), (obtenido, expandidas) = ejecutar(ast, 0, tmp), ejecutar(ast, 2, tmp)
+                estado = "idéntico" if obtenido == esperado else f"DIFIERE: {esperado!r} != {obtenido!r}"
+            except Exception as e:
+                estado, expandidas = f"FALLA: {type(e).__name__}: {e}", 0
+            print(f"{nombre:>32}  {expandidas} expandidas  {estado}")
+            fallos += not estado.startswith("idéntico")
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+#VERIFICACION DIFERENCIAL: FRONTEND DE ANTLR CONTRA FRONTEND MANUAL
+#Pasa cada programa por los dos frontends y exige:
+#  - si ANTLR no informa errores de sintaxis: el mismo AST (clases, campos y
+#    líneas, ver bench_gramatica.estructura) y los mismos errores y advertencias
+#    de SemanticListener y de ast_semantics.ASTSemanticAnalyzer, en el mismo orden,
+#  - si ANTLR informa errores: que hand_parser también rechace el programa y que
+#    se detenga en el mismo lugar: el primer error del parser de ANTLR o el
+#    primero de su lexer, el que esté antes en el fuente (la predicción lee
+#    tokens por adelantado, así que un error léxico posterior puede informarse
+#    antes, y la recuperación puede informar después errores en tokens previos).
+#Programas: a.txt, los de benchmarks/generador.py, programas aleatorios con
+#errores semánticos (tipos, aridad, nombres no declarados, funciones después del
+#bloque, f(a)(b), ...) y mutaciones de todos ellos a nivel de token y de carácter.
+#Termina con código 1 si algún programa difiere.
+#Uso: python benchmarks/check_frontend.py [programas aleatorios] [mutaciones por programa]
+import random
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+sys.setrecursionlimit(100000)
+
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+from antlr4.error.ErrorListener import ErrorListener
+
+from ExprParser import ExprParser
+from ast_builder import ASTBuilder
+from bench_gramatica import estructura
+from generador import generar_programa
+from hand_parser import ParseError, analizar_manual, tokenizar
+from keyword_lexer import crear_lexer
+from SemanticListener import SemanticListener
+
+
+class Recolector(ErrorListener):
+    def __init__(self):
+        self.primero = None  # (línea, columna) del primer error informado
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.primero = self.primero or (line, column)
+
+
+def con_antlr(codigo):
+    del_lexer, del_parser = Recolector(), Recolector()
+    lexer = crear_lexer(InputStream(codigo))
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(del_lexer)
+    parser = ExprParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(del_parser)
+    tree = parser.prog()
+    errores = [r.primero for r in (del_lexer, del_parser) if r.primero]
+    if errores:
+        return "sintaxis", min(errores)
+    listener = SemanticListener()
+    ParseTreeWalker().walk(listener, tree)
+    return "válido", (estructura(ASTBuilder().visit(tree)), listener.errors, listener.warnings)
+
+
+def con_manual(codigo):
+    try:
+        ast, analizador = analizar_manual(codigo)
+    except ParseError as e:
+        return "sintaxis", (e.line, e.column)
+    return "válido", (estructura(ast), analizador.errors, analizador.warnings)
+
+
+# ========================
+# PROGRAMAS ALEATORIOS
+# ========================
+
+TIPOS = ["entero", "decimal", "bool", "cadena"]
+NOMBRES = ["a", "b", "c", "x", "n", "s", "zz"]
+FUNCIONES = ["f", "g", "h", "k"]
+OPERADORES = ["+", "-", "*", "/", "%", "^", "<", ">", "<=", ">=", "==", "!=", "&&", "||"]
+
+
+def expresion(rng, profundidad, superior=False):
+    r = rng.random()
+    if profundidad <= 0 or r < 0.3:
+        return rng.choice(["1", "2.5", "verdad", "falso", '"t"'] + NOMBRES)
+    if r < 0.55:
+        return f"{expresion(rng, profundidad - 1)} {rng.choice(OPERADORES)} {expresion(rng, profundidad - 1)}"
+    if r < 0.65:
+        return rng.choice(["-", "!", "+"]) + expresion(rng, profundidad - 1)
+    if r < 0.75:
+        # El '(' a veces en otra línea que su contenido
+        return "(" + rng.choice(["", "\n"]) + expresion(rng, profundidad - 1) + ")"
+    if r < 0.82:
+        # La asignación sólo encabeza una expresión: adentro va entre paréntesis
+        asignacion = f"{rng.choice(NOMBRES)} = {expresion(rng, profundidad - 1, True)}"
+        return asignacion if superior else f"({asignacion})"
+    if r < 0.95:
+        grupos = "".join("(" + ", ".join(expresion(rng, profundidad - 1, True) for _ in range(rng.randint(0, 3))) + ")"
+                         for _ in range(rng.choice([1, 1, 1, 2])))
+        return rng.choice(FUNCIONES) + grupos
+    return f"({rng.choice(FUNCIONES)})({expresion(rng, profundidad - 1)})"
+
+
+def sentencias(rng, cantidad, profundidad):
+    lineas = []
+    for _ in range(cantidad):
+        r = rng.random()
+        e = lambda: expresion(rng, 2, True)
+        if r < 0.25:
+            valor = f" = {e()}" if rng.random() < 0.8 else ""
+            lineas.append(f"{rng.choice(TIPOS + ['var'])} {rng.choice(NOMBRES)}{valor};")
+        elif r < 0.4:
+            lineas.append(f"{e()};")
+        elif r < 0.5:
+            lineas.append(f"pintar({', '.join(e() for _ in range(rng.randint(0, 2)))});")
+        elif r < 0.58:
+            lineas.append(f"ret {e() if rng.random() < 0.8 else ''};")
+        elif profundidad > 0 and r < 0.7:
+            cuerpo = sentencias(rng, rng.randint(0, 3), profundidad - 1)
+            lineas.append(f"si ({e()}) {{ {cuerpo} }}" + (f" sino {{ {cuerpo} }}" if rng.random() < 0.5 else ""))
+        elif profundidad > 0 and r < 0.78:
+            inicio = rng.choice([f"entero {rng.choice(NOMBRES)} = 0;", f"{rng.choice(NOMBRES)} = 0;"])
+            lineas.append(f"para ({inicio} {e()}; {e()}) {{ {sentencias(rng, 2, profundidad - 1)} }}")
+        elif profundidad > 0 and r < 0.86:
+            lineas.append(f"mientras ({e()}) {{ {sentencias(rng, 2, profundidad - 1)} }}")
+        elif profundidad > 0 and r < 0.92:
+            lineas.append(f"hacer {{ {sentencias(rng, 2, profundidad - 1)} }} mientras ({e()});")
+        else:
+            lineas.append(f"{{ {sentencias(rng, 2, profundidad - 1)} }}")
+    return "\n".join(lineas)
+
+
+def programa_aleatorio(rng):
+    globales = "\n".join(f"{rng.choice(TIPOS)} {rng.choice(NOMBRES)} = {expresion(rng, 1)};"
+                         for _ in range(rng.randint(0, 2)))
+    funciones = []
+    for _ in range(rng.randint(0, 3)):
+        params = ", ".join(f"{rng.choice(TIPOS)} {rng.choice(NOMBRES)}" for _ in range(rng.randint(0, 2)))
+        funciones.append(f"{rng.choice(TIPOS + ['void'])} {rng.choice(FUNCIONES)}({params}) {{\n"
+                         f"{sentencias(rng, rng.randint(1, 5), 2)}\n}}")
+    seccion = "funciones {\n" + "\n".join(funciones) + "\n}" if funciones or rng.random() < 0.3 else ""
+    bloque = f"inicio {{\n{sentencias(rng, rng.randint(1, 6), 2)}\n}} fin"
+    cuerpo = [seccion, bloque] if rng.random() < 0.6 else [bloque, seccion]
+    return f"programa P {{\n{globales}\n" + "\n".join(cuerpo) + "\n}\n"
+
+
+# ========================
+# MUTACIONES
+# ========================
+
+SUELTOS = ["@", "&", "|", ".", '"', "/*", ";", "(", ")", "{", "}", ",", "=", "+", "ret", "si", "funciones", "1.", "x"]
+
+
+def mutar(rng, codigo):
+    tokens = [t for t in tokenizar(codigo) if t[0] >= 0]
+    if not tokens:
+        return codigo
+    r = rng.random()
+    # Posición del token elegido en el texto
+    lineas = codigo.split("\n")
+    _, texto, linea, columna = rng.choice(tokens)
+    inicio = sum(len(l) + 1 for l in lineas[:linea - 1]) + columna
+    fin = inicio + len(texto)
+    if r < 0.35:
+        return codigo[:inicio] + codigo[fin:]                                  # borrar un token
+    if r < 0.55:
+        return codigo[:inicio] + texto + " " + codigo[inicio:]                 # duplicarlo
+    if r < 0.85:
+        return codigo[:inicio] + rng.choice(SUELTOS) + " " + codigo[inicio:]   # insertar otro
+    return codigo[:inicio] + codigo[inicio + 1:]                               # borrar un carácter
+
+
+def main():
+    argumentos = [int(a) for a in sys.argv[1:]]
+    cantidad = argumentos[0] if argumentos else 300
+    mutaciones = argumentos[1] if len(argumentos) > 1 else 3
+    rng = random.Random(0)
+
+    programas = [(RAIZ / "a.txt").read_text(encoding="utf-8")]
+    programas += [generar_programa(funciones=n, sentencias=8, cadenas=0.5, semilla=n) for n in range(1, 9)]
+    programas += [programa_aleatorio(rng) for _ in range(cantidad)]
+    programas += [mutar(rng, p) for p in programas for _ in range(mutaciones)]
+
+    conteo = {"válido": 0, "sintaxis": 0}
+    con_errores = fallos = 0
+    for indice, codigo in enumerate(programas):
+        esperado, manual = con_antlr(codigo), con_manual(codigo)
+        conteo[esperado[0]] += 1
+        if esperado[0] == "válido" and esperado[1][1]:
+            con_errores += 1
+        if esperado != manual:
+            fallos += 1
+            if fallos <= 5:
+                print(f"--- programa {indice} ---\n{codigo}\nANTLR:  {esperado}\nmanual: {manual}\n")
+    print(f"{len(programas)} programas: {conteo['válido']} sin errores de sintaxis "
+          f"({con_errores} con errores semánticos), {conteo['sintaxis']} rechazados; "
+          + (f"{fallos} DIFIEREN" if fallos else "frontends idénticos"))
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#GENERADOR DE PROGRAMAS SINTETICOS VALIDOS PARA Expr.g4
+#Produce programas deterministas (según la semilla) sin errores semánticos para
+#medir cómo escala el compilador. Parámetros:
+#  funciones         número de funciones en la sección 'funciones'
+#  sentencias        sentencias por función y en el bloque Inicio
+#  anidamiento       profundidad máxima de si/para/mientras anidados
+#  profundidad_expr  niveles de anidamiento de cada expresión
+#  cadenas           fracción (0..1) de sentencias simples que usan cadenas
+#Uso: python benchmarks/generador.py [funciones] [sentencias] [anidamiento] [profundidad_expr] [cadenas]
+import random
+import sys
+
+
+class GeneradorProgramas:
+    def __init__(self, funciones=10, sentencias=20, anidamiento=2, profundidad_expr=3,
+                 cadenas=0.2, semilla=0):
+        self.funciones = funciones
+        self.sentencias = sentencias
+        self.anidamiento = anidamiento
+        self.profundidad_expr = profundidad_expr
+        self.cadenas = cadenas
+        self.rng = random.Random(semilla)
+
+    def generar(self):
+        partes = ["Programa Sintetico {",
+                  "    entero semilla = 7;",
+                  "    funciones {"]
+        for i in range(self.funciones):
+            partes.append(self._funcion(i))
+        partes.append("    }")
+        partes.append("    Inicio {")
+        partes.append(self._cuerpo(self.funciones, ["semilla"], ["saludo"], 2))
+        llamadas = [f"f{i}({i}, semilla)" for i in range(max(0, self.funciones - 4), self.funciones)]
+        if llamadas:
+            partes.append(f"        pintar({', '.join(llamadas)});")
+        partes.append("    } Fin")
+        partes.append("}")
+        return "\n".join(partes) + "\n"
+
+    # ========================
+    # FUNCIONES Y SENTENCIAS
+    # ========================
+
+    def _funcion(self, indice):
+        cuerpo = self._cuerpo(indice, ["a", "b", "semilla"], ["saludo"], 3)
+        resultado = self._expr_entero(self.profundidad_expr)
+        return (f"        entero f{indice}(entero a, entero b) {{\n"
+                f"{cuerpo}\n"
+                f"            ret {resultado};\n"
+                f"        }}")
+
+    def _cuerpo(self, llamables, enteros, textos, sangria):
+        # Estado de la función actual: funciones que puede llamar y variables visibles
+        self._llamables = llamables
+        self._contador = 0
+        self._ambitos = [(list(enteros), list(textos))]
+        # Las globales 'cadena' con valor inicial no están soportadas: va como local
+        lineas = ["    " * sangria + 'cadena saludo = "hola";']
+        return "\n".join(lineas + self._sentencias(self.sentencias, 0, sangria))
+
+    def _sentencias(self, presupuesto, nivel, sangria):
+        lineas = []
+        primera = True
+        while presupuesto > 0:
+            # La primera sentencia de cada bloque baja un nivel mientras se pueda,
+            # así la profundidad pedida se alcanza siempre
+            anidar = nivel < self.anidamiento and presupuesto >= 2 and (primera or self.rng.random() < 0.2)
+            if anidar:
+                interno = max(1, min(presupuesto - 1, presupuesto // 3))
+                lineas += self._compuesta(interno, nivel, sangria)
+                presupuesto -= interno + 1
+            else:
+                lineas.append("    " * sangria + self._simple())
+                presupuesto -= 1
+            primera = False
+        return lineas
+
+    def _compuesta(self, interno, nivel, sangria):
+        margen = "    " * sangria
+        self._ambitos.append(([], []))
+        cuerpo = self._sentencias(interno, nivel + 1, sangria + 1)
+        self._ambitos.pop()
+        tipo = self.rng.choice(("si", "para", "mientras"))
+
+        if tipo == "si":
+            return ([f"{margen}si ({self._expr_bool(self.profundidad_expr)}) {{"] + cuerpo +
+                    [f"{margen}}} sino {{", f"{margen}    pintar({self._expr_entero(1)});", f"{margen}}}"])
+        contador = self._nuevo_nombre("k")
+        if tipo == "para":
+            return ([f"{margen}para (entero {contador} = 0; {contador} < 3; {contador} = {contador} + 1) {{"] +
+                    cuerpo + [f"{margen}}}"])
+        return ([f"{margen}entero {contador} = 0;",
+                 f"{margen}mientras ({contador} < 3) {{",
+                 f"{margen}    {contador} = {contador} + 1;"] + cuerpo + [f"{margen}}}"])
+
+    def _simple(self):
+        if self.rng.random() < self.cadenas:
+            return self._simple_cadena()
+        opcion = self.rng.random()
+        if opcion < 0.45:
+            nombre = self._nuevo_nombre("v")
+            linea = f"entero {nombre} = {self._expr_entero(self.profundidad_expr)};"
+            self._ambitos[-1][0].append(nombre)
+            return linea
+        if opcion < 0.8:
+            destino = self.rng.choice(self._visibles(0))
+            return f"{destino} = {self._expr_entero(self.profundidad_expr)};"
+        return f"pintar({self._expr_entero(self.profundidad_expr)}, {self._expr_bool(1)});"
+
+    def _simple_cadena(self):
+        textos = self._visibles(1)
+        if self.rng.random() < 0.6:
+            nombre = self._nuevo_nombre("s")
+            linea = f'cadena {nombre} = {self.rng.choice(textos)} + "{nombre}";'
+            self._ambitos[-1][1].append(nombre)
+            return linea
+        return f'pintar({self.rng.choice(textos)}, " ", {self._expr_entero(1)});'
+
+    # ========================
+    # EXPRESIONES
+    # ========================
+
+    def _expr_entero(self, profundidad):
+        # Cada nivel agrega un operador; el tamaño crece linealmente con la profundidad
+        if profundidad <= 0:
+            if self.rng.random() < 0.5:
+                return self.rng.choice(self._visibles(0))
+            return str(self.rng.randint(0, 99))
+        interna = self._expr_entero(profundidad - 1)
+        hoja = self._expr_entero(0)
+        if self._llamables and self.rng.random() < 0.15:
+            funcion = self.rng.randrange(self._llamables)
+            return f"f{funcion}({interna}, {hoja})"
+        op = self.rng.choice(("+", "-", "*"))
+        if self.rng.random() < 0.5:
+            return f"({interna} {op} {hoja})"
+        return f"{hoja} {op} ({interna})"
+
+    def _expr_bool(self, profundidad):
+        comparacion = f"{self._expr_entero(max(0, profundidad - 1))} {self.rng.choice(('<', '>', '<=', '>=', '==', '!='))} {self._expr_entero(0)}"
+        if profundidad > 1 and self.rng.random() < 0.5:
+            return f"{comparacion} {self.rng.choice(('&&', '||'))} !({self._expr_bool(profundidad - 1)})"
+        return comparacion
+
+    # ========================
+    # AUXILIARES
+    # ========================
+
+    def _visibles(self, indice):
+        return [nombre for ambito in self._ambitos for nombre in ambito[indice]]
+
+    def _nuevo_nombre(self, prefijo):
+        self._contador += 1
+        return f"{prefijo}{self._contador}"
+
+
+def generar_programa(funciones=10, sentencias=20, anidamiento=2, profundidad_expr=3, cadenas=0.2, semilla=0):
+    """Atajo: código fuente de un programa sintético con los parámetros dados"""
+    return GeneradorProgramas(funciones, sentencias, anidamiento, profundidad_expr, cadenas, semilla).generar()
+
+
+if __name__ == "__main__":
+    valores = [float(v) if "." in v else int(v) for v in sys.argv[1:]]
+    sys.stdout.write(generar_programa(*valores))
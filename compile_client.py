@@ -0,0 +1,96 @@
+#CLIENTE LIVIANO DEL SERVIDOR DE COMPILACION
+#Sólo usa la biblioteca estándar (no importa antlr4 ni llvmlite): arranca en
+#milisegundos y reenvía la petición a compile_server.py por el socket Unix.
+#Uso: python compile_client.py compilar|ejecutar|validar programa.txt [-O0..-O3] [--ast=0..2] [-o salida.ll] [--tiempos]
+#     python compile_client.py estado|detener
+import json
+import os
+import socket
+import sys
+
+
+def ruta_socket_por_defecto():
+    base = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.environ.get("COMPILADOR_SOCKET") or os.path.join(base, f"compilador_cesar-{os.getuid()}.sock")
+
+
+def enviar(peticion, ruta=None):
+    """Envía una petición (dict) al servidor y retorna su respuesta (dict)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexion:
+        conexion.connect(ruta or ruta_socket_por_defecto())
+        conexion.sendall(json.dumps(peticion).encode() + b"\n")
+        datos = b""
+        while not datos.endswith(b"\n"):
+            bloque = conexion.recv(65536)
+            if not bloque:
+                break
+            datos += bloque
+    return json.loads(datos)
+
+
+def _mostrar_tiempos(tiempos):
+    print("\n=== TIEMPOS EN EL SERVIDOR ===", file=sys.stderr)
+    for etapa, segundos in tiempos.items():
+        print(f"{etapa:>16}: {segundos * 1000:8.2f} ms", file=sys.stderr)
+
+
+def main():
+    argumentos = [a for a in sys.argv[1:] if not a.startswith("-")]
+    opciones = [a for a in sys.argv[1:] if a.startswith("-")]
+    if not argumentos:
+        print("Uso: python compile_client.py compilar|ejecutar|validar programa.txt [-O2] [--ast=2] [-o salida.ll] [--tiempos]")
+        print("     python compile_client.py estado|detener")
+        return 1
+
+    accion = argumentos[0]
+    peticion = {"accion": accion}
+    salida_ir = None
+    if accion in ("compilar", "ejecutar", "validar"):
+        if len(argumentos) < 2:
+            print(f"[ERROR] Falta el archivo fuente para '{accion}'")
+            return 1
+        with open(argumentos[1], encoding="utf-8") as f:
+            peticion["codigo"] = f.read()
+        for opcion in opciones:
+            if opcion[:2] == "-O" and opcion[2:].isdigit():
+                peticion["opt"] = int(opcion[2:])
+            elif opcion.startswith("--ast="):
+                peticion["opt_ast"] = int(opcion[6:])  # pasadas sobre el AST (pipeline.optimizar_ast)
+        if "-o" in sys.argv:
+            salida_ir = sys.argv[sys.argv.index("-o") + 1]
+
+    try:
+        respuesta = enviar(peticion)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("[ERROR] No hay servidor escuchando. Inícielo con: python compile_server.py")
+        return 1
+
+    for advertencia in respuesta.get("advertencias", []):
+        print(advertencia, file=sys.stderr)
+    for error in respuesta.get("errores", []):
+        print(error, file=sys.stderr)
+    for evaluado in respuesta.get("evaluado", []):
+        print("[EVALUADO]", evaluado, file=sys.stderr)
+    for eliminado in respuesta.get("eliminado", []):
+        print("[CÓDIGO MUERTO]", eliminado, file=sys.stderr)
+
+    if "ir" in respuesta:
+        if salida_ir:
+            with open(salida_ir, "w", encoding="utf-8") as f:
+                f.write(respuesta["ir"])
+        else:
+            print(respuesta["ir"])
+    if "salida" in respuesta:
+        print(respuesta["salida"], end="")
+    if accion == "estado":
+        print(f"Peticiones atendidas: {respuesta['atendidas']}, resultados en caché: {respuesta['en_cache']}")
+    if "--tiempos" in opciones:
+        _mostrar_tiempos(respuesta.get("tiempos", {}))
+
+    if not respuesta.get("ok"):
+        return 1
+    return respuesta.get("codigo_salida", 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
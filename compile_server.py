@@ -0,0 +1,223 @@
+#SERVIDOR DE COMPILACION RESIDENTE (SOCKET UNIX)
+#Mantiene caliente todo lo que cada ejecución de test.py o main.py paga de nuevo:
+#imports de antlr4 y llvmlite, llvm.initialize(), la caché DFA del parser de
+#ANTLR (se llena con el primer análisis y se comparte entre instancias) y una
+#caché de compilación: el mismo fuente con el mismo nivel de optimización no se
+#vuelve a compilar ni a enlazar mientras el servidor siga vivo. Al detenerse
+#guarda el DFA acumulado (dfa_cache.py) para el próximo arranque. Las peticiones llegan por un socket Unix como una línea JSON
+#y se atienden en paralelo con un pool de hilos; la respuesta incluye el tiempo
+#de cada etapa. El cliente liviano está en compile_client.py.
+#Uso: python compile_server.py [--socket RUTA] [--workers N]
+import hashlib
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from antlr4 import InputStream
+
+from ast_builder import ASTBuilder
+from ir_generator import LLVMGenerator
+from module_io import optimizar
+from target_config import configuracion_por_defecto
+from parallel_backend import compilar_objetos, enlazar_ejecutable
+from pipeline import analizar_semantica, nivel_ast_por_defecto, optimizar_ast, parsear
+from type_annotator import TypeAnnotator
+from compile_client import ruta_socket_por_defecto
+from dfa_cache import guardar_dfa
+
+PROGRAMA_CALENTAMIENTO = """Programa Calentar {
+    entero g = 1;
+    funciones {
+        entero f(entero n, decimal d) {
+            si (n < 2 && !(d > 1.5) || n == 3) { ret n; } sino { ret f(n - 1, d) * 2 % 7; }
+        }
+    }
+    Inicio {
+        var x = 2.5 ^ 2;
+        cadena s = "a" + "b";
+        para (entero i = 0; i < 3; i = i + 1) { mientras (g != 0) { g = g - 1; } }
+        hacer { g = g + 1; } mientras (g <= 2);
+        pintar(s, f(g, x), -x, verdad);
+    } Fin
+}
+"""
+
+
+class CompileServer:
+    def __init__(self, ruta=None, workers=None):
+        self.ruta = ruta or ruta_socket_por_defecto()
+        self.pool = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        # El runtime de ANTLR comparte su caché DFA entre parsers y no está pensado
+        # para mutarla desde varios hilos: el frontend (que además necesita el GIL)
+        # va serializado; optimización, codegen, enlace y ejecución corren en paralelo
+        self._frontend = threading.Lock()
+        self._detener = threading.Event()
+        self.atendidas = 0
+        self.inicio = time.time()
+        # clave del fuente -> (IR o ruta del ejecutable enlazado, advertencias)
+        self._ir = {}
+        self._ejecutables = {}
+        self._directorio = tempfile.mkdtemp(prefix="compilador_servidor_")
+
+        configuracion_por_defecto()  # inicializa LLVM y detecta el destino una sola vez
+
+    def calentar(self):
+        """Llena la caché DFA del parser con un programa que usa toda la gramática"""
+        inicio = time.perf_counter()
+        self.procesar({"accion": "compilar", "codigo": PROGRAMA_CALENTAMIENTO})
+        return time.perf_counter() - inicio
+
+    # ========================
+    # SOCKET
+    # ========================
+
+    def servir(self):
+        if os.path.exists(self.ruta):
+            os.remove(self.ruta)  # socket huérfano de una ejecución anterior
+        servidor = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        servidor.bind(self.ruta)
+        servidor.listen()
+        servidor.settimeout(0.5)  # para revisar periódicamente si hay que detenerse
+        try:
+            while not self._detener.is_set():
+                try:
+                    conexion, _ = servidor.accept()
+                except socket.timeout:
+                    continue
+                self.pool.submit(self._atender, conexion, time.perf_counter())
+        finally:
+            servidor.close()
+            os.remove(self.ruta)
+            self.pool.shutdown(wait=True)
+            # El DFA acumulado con todas las peticiones queda para el próximo arranque
+            with self._frontend:
+                guardar_dfa()
+            shutil.rmtree(self._directorio, ignore_errors=True)
+
+    def _atender(self, conexion, llegada):
+        with conexion:
+            try:
+                datos = b""
+                while not datos.endswith(b"\n"):
+                    bloque = conexion.recv(65536)
+                    if not bloque:
+                        break
+                    datos += bloque
+                peticion = json.loads(datos)
+                respuesta = self.procesar(peticion, llegada)
+            except Exception as e:
+                respuesta = {"ok": False, "errores": [f"{type(e).__name__}: {e}"]}
+            self.atendidas += 1
+            conexion.sendall(json.dumps(respuesta).encode() + b"\n")
+
+    # ========================
+    # PETICIONES
+    # ========================
+
+    def procesar(self, peticion, llegada=None):
+        """
+        Atiende una petición {'accion': ..., 'codigo': ..., 'opt': 0-3, 'timeout': s}.
+        Acciones: validar, compilar (retorna el IR), ejecutar, estado, detener.
+        """
+        tiempos = {"cola": time.perf_counter() - llegada} if llegada else {}
+        inicio = time.perf_counter()
+        accion = peticion.get("accion")
+
+        if accion == "estado":
+            respuesta = {"ok": True, "atendidas": self.atendidas, "activo_desde": self.inicio,
+                         "en_cache": len(self._ir) + len(self._ejecutables)}
+        elif accion == "detener":
+            self._detener.set()
+            respuesta = {"ok": True}
+        elif accion in ("validar", "compilar", "ejecutar"):
+            respuesta = self._compilar(peticion, accion, tiempos)
+        else:
+            respuesta = {"ok": False, "errores": [f"Acción desconocida: {accion}"]}
+
+        tiempos["total"] = time.perf_counter() - inicio
+        respuesta["tiempos"] = tiempos
+        return respuesta
+
+    def _compilar(self, peticion, accion, tiempos):
+        def medir(etapa, funcion, *args, **kwargs):
+            t = time.perf_counter()
+            resultado = funcion(*args, **kwargs)
+            tiempos[etapa] = time.perf_counter() - t
+            return resultado
+
+        codigo = peticion["codigo"]
+        opt = int(peticion.get("opt", 0))
+        nivel_ast = int(peticion.get("opt_ast", nivel_ast_por_defecto()))
+        clave = hashlib.sha256(f"{opt}\n{nivel_ast}\n{codigo}".encode()).hexdigest()
+        respuesta = {"ok": True, "errores": [], "advertencias": [], "cache": False}
+
+        if accion == "compilar" and clave in self._ir:
+            ir, advertencias, evaluado, eliminado = self._ir[clave]
+            respuesta.update(ir=ir, advertencias=advertencias, evaluado=evaluado, eliminado=eliminado, cache=True)
+            return respuesta
+        if accion == "ejecutar" and clave in self._ejecutables:
+            programa, advertencias, evaluado, eliminado = self._ejecutables[clave]
+            respuesta.update(advertencias=advertencias, evaluado=evaluado, eliminado=eliminado, cache=True)
+            return self._ejecutar(programa, peticion, respuesta, medir)
+
+        t = time.perf_counter()
+        with self._frontend:
+            tiempos["espera_frontend"] = time.perf_counter() - t
+            tree = medir("parser", parsear, InputStream(codigo))
+            listener = medir("semantica", analizar_semantica, tree)
+            respuesta.update(ok=not listener.errors, errores=listener.errors, advertencias=listener.warnings)
+            if listener.errors or accion == "validar":
+                return respuesta
+            ast = medir("ast", lambda: TypeAnnotator().annotate(ASTBuilder().visit(tree)))
+        reportes = optimizar_ast(ast, nivel_ast, tiempos=tiempos)
+        respuesta["evaluado"] = reportes.get("evaluacion", [])
+        respuesta["eliminado"] = reportes.get("codigo_muerto", [])
+
+        module = medir("llvm", LLVMGenerator().generate, ast)
+
+        if accion == "compilar":
+            ir = str(medir("optimizacion", optimizar, module, opt)) if opt else str(module)
+            self._ir[clave] = (ir, listener.warnings, respuesta["evaluado"], respuesta["eliminado"])
+            respuesta["ir"] = ir
+            return respuesta
+
+        objetos, _ = medir("codegen", compilar_objetos, module, workers=1, particiones=1, opt_level=opt)
+        # Dos peticiones iguales pueden compilar a la vez: se enlaza a un nombre propio del
+        # hilo y se mueve de forma atómica, así nunca se ejecuta un binario a medio escribir
+        programa = os.path.join(self._directorio, clave)
+        temporal = medir("enlace", enlazar_ejecutable, objetos, f"{programa}.{threading.get_ident()}")
+        os.replace(temporal, programa)
+        self._ejecutables[clave] = (programa, listener.warnings, respuesta["evaluado"], respuesta["eliminado"])
+        return self._ejecutar(programa, peticion, respuesta, medir)
+
+    def _ejecutar(self, programa, peticion, respuesta, medir):
+        resultado = medir("ejecucion", subprocess.run, [programa], capture_output=True, text=True,
+                          timeout=peticion.get("timeout", 60))
+        respuesta.update(salida=resultado.stdout, codigo_salida=resultado.returncode)
+        return respuesta
+
+
+def main():
+    argumentos = sys.argv[1:]
+    ruta = argumentos[argumentos.index("--socket") + 1] if "--socket" in argumentos else None
+    workers = int(argumentos[argumentos.index("--workers") + 1]) if "--workers" in argumentos else None
+
+    servidor = CompileServer(ruta, workers)
+    print(f"[INFO] Calentando el parser y LLVM... {servidor.calentar() * 1000:.0f} ms")
+    print(f"[INFO] Escuchando en {servidor.ruta} (Ctrl+C o 'python compile_client.py detener' para salir)")
+    try:
+        servidor.servir()
+    except KeyboardInterrupt:
+        print("\n[INFO] Servidor detenido.")
+
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(10000)
+    main()
@@ -0,0 +1,486 @@
+#EVALUACION EN TIEMPO DE COMPILACION DE LLAMADAS PURAS
+#Una llamada a una función pura con todos sus argumentos constantes da siempre
+#el mismo resultado: se ejecuta aquí, sobre el AST, y se reemplaza por un
+#literal ('fibonacci(30)' pasa a ser '832040'). Pura quiere decir que ni la
+#función ni nada de lo que llama pinta, lee o asigna variables globales, o llama
+#a funciones que no están definidas (la recursión sí se permite).
+#El intérprete sigue la semántica del IR que genera LLVMGenerator: enteros de 32
+#bits con desborde circular, división y resto truncados hacia cero, las mismas
+#conversiones entre 'entero', 'decimal' y 'bool' y && / || sin cortocircuito.
+#Cuando el resultado en ejecución no estaría definido o no es representable como
+#literal (división entera por cero, un decimal infinito o NaN, una cadena) la
+#llamada se deja como está.
+#Cada evaluación tiene un presupuesto de pasos (nodos del AST visitados), que se
+#configura con el parámetro 'presupuesto' o la variable de entorno
+#COMPILADOR_PASOS_EVALUACION; si se agota, la llamada queda para la ejecución.
+#Se cuentan pasos y no tiempo para que el resultado de compilar no dependa de la
+#carga de la máquina. Los resultados se recuerdan por función y argumentos, así
+#una recursión como fibonacci se evalúa una vez por cada valor.
+import math
+import os
+
+from ast_builder import (
+    ASTNode,
+    DeclarationNode,
+    BlockNode,
+    IfNode,
+    ForNode,
+    WhileNode,
+    DoWhileNode,
+    ReturnNode,
+    PrintNode,
+    BinaryOpNode,
+    UnaryOpNode,
+    NumberNode,
+    BooleanNode,
+    VariableNode,
+    AssignmentNode,
+    FunctionCallNode,
+)
+from type_annotator import ARITHMETIC_OPS, COMPARISON_OPS, LOGICAL_OPS, promote
+
+PRESUPUESTO_POR_DEFECTO = 100000  # pasos por llamada evaluada
+PROFUNDIDAD_MAXIMA = 60           # llamadas anidadas durante una evaluación
+
+
+def presupuesto_por_defecto():
+    return int(os.environ.get("COMPILADOR_PASOS_EVALUACION", PRESUPUESTO_POR_DEFECTO))
+
+
+def evaluar_en_compilacion(program_node, presupuesto=None):
+    """Aplica ConstEvaluator al programa; retorna la lista de evaluaciones"""
+    return ConstEvaluator(presupuesto).evaluate(program_node)
+
+
+def valor_constante(expr, tipo, program_node=None, variables=None, presupuesto=None):
+    """
+    Valor de 'expr' convertido a 'tipo' si se puede calcular al compilar: literales,
+    operaciones, las 'variables' de valor conocido ({nombre: [tipo, valor]}) y
+    llamadas a funciones puras de 'program_node'. None si no se puede.
+    """
+    return ConstEvaluator(presupuesto).value(expr, tipo, program_node, variables)
+
+
+def _hijos(node):
+    for value in vars(node).values():
+        if isinstance(value, ASTNode):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ASTNode):
+                    yield item
+
+
+# ========================
+# ANALISIS DE PUREZA
+# ========================
+
+class _LocalmentePura:
+    """Revisa el cuerpo de una función sin mirar a quién llama (eso lo resuelve funciones_puras)"""
+
+    def __init__(self, func):
+        self.pura = True
+        self.llamadas = set()
+        self.scopes = [{p.identifier for p in func.parameters}]
+        self._node(func.block)
+
+    def _declarada(self, name):
+        return any(name in scope for scope in self.scopes)
+
+    def _node(self, node):
+        if isinstance(node, PrintNode):
+            self.pura = False
+            return
+        if isinstance(node, FunctionCallNode):
+            self.llamadas.add(node.name)
+        if isinstance(node, DeclarationNode):
+            if node.expr is not None:
+                self._node(node.expr)
+            self.scopes[-1].add(node.identifier)
+            return
+        if isinstance(node, (AssignmentNode, VariableNode)) and not self._declarada(node.name):
+            self.pura = False  # variable global
+        if isinstance(node, BlockNode):
+            self.scopes.append(set())
+        for child in _hijos(node):
+            self._node(child)
+        if isinstance(node, BlockNode):
+            self.scopes.pop()
+
+
+def funciones_puras(program_node):
+    """Nombres de las funciones puras del programa"""
+    locales = {func.name: _LocalmentePura(func) for func in program_node.functions}
+    puras = {name for name, analisis in locales.items() if analisis.pura}
+    # Se descartan las que llaman a algo no puro hasta que no cambie nada
+    cambio = True
+    while cambio:
+        impuras = {name for name in puras if not locales[name].llamadas <= puras}
+        puras -= impuras
+        cambio = bool(impuras)
+    return puras
+
+
+# ========================
+# VALORES
+# ========================
+
+class _NoEvaluable(Exception):
+    """La llamada se deja para la ejecución; el mensaje dice por qué"""
+
+    def __init__(self, motivo, limite=False):
+        super().__init__(motivo)
+        self.limite = limite  # presupuesto o profundidad: con otros límites podría terminar
+
+
+class _Retorno(Exception):
+    def __init__(self, valor):
+        self.valor = valor
+
+
+def _tipo(valor):
+    if isinstance(valor, bool):
+        return 'bool'
+    if isinstance(valor, int):
+        return 'entero'
+    return 'decimal'
+
+
+def _entero(valor):
+    """Entero de 32 bits con desborde circular, como add/sub/mul de LLVM"""
+    return (valor + 2 ** 31) % 2 ** 32 - 2 ** 31
+
+
+def _decimal(valor):
+    if not math.isfinite(valor):
+        raise _NoEvaluable("el resultado decimal no es finito")
+    return valor
+
+
+def _convertir(valor, destino):
+    """Mismas conversiones que LLVMGenerator._convert"""
+    if destino == 'bool':
+        return bool(valor)
+    if destino == 'decimal':
+        return float(valor)
+    if destino == 'entero':
+        if isinstance(valor, float):
+            if not -2 ** 31 <= valor < 2 ** 31:
+                raise _NoEvaluable(f"{valor!r} no cabe en un entero")
+            return int(valor)  # fptosi trunca hacia cero
+        return int(valor)
+    raise _NoEvaluable(f"no se evalúan valores de tipo '{destino}'")
+
+
+def _literal(valor):
+    node = BooleanNode(valor) if isinstance(valor, bool) else NumberNode(valor)
+    node.type = _tipo(valor)
+    return node
+
+
+def _texto(valor):
+    if isinstance(valor, bool):
+        return "verdad" if valor else "falso"
+    return repr(valor)
+
+
+def _aritmetica(op, a, b, tipo):
+    if tipo == 'decimal':
+        if op == '/' and b == 0:
+            raise _NoEvaluable("división decimal por cero")
+        if op == '%':
+            if b == 0:
+                raise _NoEvaluable("resto decimal por cero")
+            return _decimal(math.fmod(a, b))
+        return _decimal({'+': a + b, '-': a - b, '*': a * b}[op] if op != '/' else a / b)
+    if tipo != 'entero':
+        raise _NoEvaluable(f"operación '{op}' sobre '{tipo}'")
+    if op in ('/', '%'):
+        if b == 0 or (a == -2 ** 31 and b == -1):
+            raise _NoEvaluable("división entera no definida")
+        cociente = abs(a) // abs(b)  # sdiv/srem truncan hacia cero
+        if (a < 0) != (b < 0):
+            cociente = -cociente
+        return cociente if op == '/' else a - b * cociente
+    return _entero({'+': a + b, '-': a - b, '*': a * b}[op])
+
+
+def _comparacion(op, a, b, tipo):
+    if tipo == 'bool' and op not in ('==', '!='):
+        raise _NoEvaluable("comparación de orden entre booleanos")
+    return {'<': a < b, '>': a > b, '<=': a <= b, '>=': a >= b, '==': a == b, '!=': a != b}[op]
+
+
+# ========================
+# EVALUADOR
+# ========================
+
+class ConstEvaluator:
+    def __init__(self, presupuesto=None):
+        self.presupuesto = presupuesto_por_defecto() if presupuesto is None else presupuesto
+
+    def evaluate(self, program_node):
+        """Reemplaza en sitio las llamadas evaluables; retorna la lista de evaluaciones"""
+        self.evaluated = []
+        self.functions = {func.name: func for func in program_node.functions}
+        self.puras = funciones_puras(program_node)
+        self._memo = {}  # (función, argumentos) -> valor, o _NoEvaluable si no se pudo
+        if self.presupuesto > 0:
+            self._plegar(program_node)
+        return self.evaluated
+
+    def value(self, expr, tipo, program_node=None, variables=None):
+        """Valor de una expresión suelta (el inicializador de una global), o None"""
+        self.functions = {func.name: func for func in program_node.functions} if program_node else {}
+        self.puras = funciones_puras(program_node) if program_node else set()
+        self._memo = {}
+        self.pasos, self.profundidad = 0, 0
+        self.scopes = [{name: list(variable) for name, variable in (variables or {}).items()}]
+        try:
+            return _convertir(self._expression(expr), tipo)
+        except (_NoEvaluable, RecursionError):
+            return None
+
+    def _report(self, node, message):
+        self.evaluated.append(f"[Línea {node.line}] {message}" if node.line is not None else message)
+
+    # ========================
+    # LLAMADAS DEL PROGRAMA
+    # ========================
+
+    def _plegar(self, node):
+        """Recorre el subárbol de abajo hacia arriba; retorna el nodo o el literal que lo reemplaza"""
+        for key, value in vars(node).items():
+            if isinstance(value, ASTNode):
+                setattr(node, key, self._plegar(value))
+            elif isinstance(value, list):
+                setattr(node, key, [self._plegar(item) if isinstance(item, ASTNode) else item
+                                    for item in value])
+        if isinstance(node, FunctionCallNode):
+            return self._plegar_llamada(node)
+        return node
+
+    def _plegar_llamada(self, call):
+        func = self.functions.get(call.name)
+        if (call.name not in self.puras or func.return_type == 'void'
+                or len(call.args) != len(func.parameters) or not all(map(_es_constante, call.args))):
+            return call
+
+        self.pasos, self.profundidad, self.scopes = 0, 0, []
+        try:
+            args = [self._argumento(arg, param) for arg, param in zip(call.args, func.parameters)]
+        except _NoEvaluable:
+            return call  # el argumento mismo falla en ejecución (p. ej. 1 / 0)
+        firma = f"{call.name}({', '.join(_texto(arg) for arg in args)})"
+        try:
+            valor = _convertir(self._llamar(call.name, args, 0), func.return_type)
+        except _NoEvaluable as motivo:
+            self._report(call, f"Llamada a '{firma}' no evaluada en compilación: {motivo}")
+            return call
+        except RecursionError:
+            self._report(call, f"Llamada a '{firma}' no evaluada en compilación: recursión demasiado profunda")
+            return call
+
+        self._report(call, f"Llamada a '{firma}' evaluada en compilación: {_texto(valor)} ({self.pasos} pasos)")
+        literal = _literal(valor)
+        literal.line = call.line
+        return literal
+
+    def _argumento(self, arg, param):
+        return _convertir(self._expression(arg), param.var_type)
+
+    def _llamar(self, name, args, profundidad):
+        clave = (name, tuple(repr(arg) for arg in args))
+        if clave in self._memo:
+            resultado = self._memo[clave]
+            if isinstance(resultado, _NoEvaluable):
+                raise resultado
+            return resultado
+        if profundidad >= PROFUNDIDAD_MAXIMA:
+            raise _NoEvaluable(f"más de {PROFUNDIDAD_MAXIMA} llamadas anidadas", limite=True)
+
+        func = self.functions[name]
+        anteriores = self.scopes
+        self.scopes = [{param.identifier: [param.var_type, arg] for param, arg in zip(func.parameters, args)}]
+        self.profundidad = profundidad + 1
+        try:
+            self._statement(func.block)
+            raise _NoEvaluable(f"'{name}' termina sin 'ret'")
+        except _Retorno as retorno:
+            resultado = _convertir(retorno.valor, func.return_type) if func.return_type != 'void' else None
+        except _NoEvaluable as motivo:
+            if not motivo.limite:
+                self._memo[clave] = motivo
+            raise
+        finally:
+            self.scopes = anteriores
+            self.profundidad = profundidad
+        self._memo[clave] = resultado
+        return resultado
+
+    def _paso(self):
+        self.pasos += 1
+        if self.pasos > self.presupuesto:
+            raise _NoEvaluable(f"se agotó el presupuesto de {self.presupuesto} pasos", limite=True)
+
+    # ========================
+    # SENTENCIAS
+    # ========================
+
+    def _statement(self, node):
+        if node is None:
+            return
+        self._paso()
+        handler = self._statement_handlers.get(type(node))
+        if handler:
+            handler(self, node)
+        else:
+            self._expression(node)  # sentencia de expresión
+
+    def _declaration(self, node):
+        valor = self._expression(node.expr) if node.expr is not None else None
+        tipo = _tipo(valor) if node.var_type in ("inferido", "auto") else node.var_type
+        valor = _convertir(0 if valor is None else valor, tipo)
+        self.scopes[-1][node.identifier] = [tipo, valor]
+
+    def _block(self, node):
+        self.scopes.append({})
+        try:
+            for stmt in node.statements:
+                self._statement(stmt)
+        finally:
+            self.scopes.pop()
+
+    def _if(self, node):
+        if self._condicion(node.condition):
+            self._statement(node.then_stmt)
+        else:
+            self._statement(node.else_stmt)
+
+    def _for(self, node):
+        self._statement(node.init)
+        while node.condition is None or self._condicion(node.condition):
+            self._statement(node.body)
+            self._expression(node.update)
+
+    def _while(self, node):
+        while self._condicion(node.condition):
+            self._statement(node.body)
+
+    def _do_while(self, node):
+        self._statement(node.body)
+        while self._condicion(node.condition):
+            self._statement(node.body)
+
+    def _return(self, node):
+        raise _Retorno(self._expression(node.expr) if node.expr is not None else None)
+
+    def _print(self, node):
+        raise _NoEvaluable("pintar no se evalúa en compilación")
+
+    _statement_handlers = {
+        DeclarationNode: _declaration,
+        BlockNode: _block,
+        IfNode: _if,
+        ForNode: _for,
+        WhileNode: _while,
+        DoWhileNode: _do_while,
+        ReturnNode: _return,
+        PrintNode: _print,
+    }
+
+    # ========================
+    # EXPRESIONES
+    # ========================
+
+    def _condicion(self, expr):
+        return _convertir(self._expression(expr), 'bool')
+
+    def _expression(self, node):
+        if node is None:
+            return None
+        self._paso()
+        handler = self._expression_handlers.get(type(node))
+        if handler is None:
+            raise _NoEvaluable(f"expresión no evaluable ({type(node).__name__})")
+        return handler(self, node)
+
+    def _number(self, node):
+        return node.value
+
+    def _boolean(self, node):
+        return node.value
+
+    def _variable(self, node):
+        return self._lookup(node.name)[1]
+
+    def _assignment(self, node):
+        variable = self._lookup(node.name)
+        variable[1] = _convertir(self._expression(node.expr), variable[0])
+        return variable[1]
+
+    def _binary(self, node):
+        a = self._expression(node.left)
+        b = self._expression(node.right)
+        op = node.op
+
+        if op in LOGICAL_OPS:
+            a, b = _convertir(a, 'bool'), _convertir(b, 'bool')
+            return (a and b) if op == '&&' else (a or b)
+        if op == '^':
+            try:
+                return _decimal(math.pow(float(a), float(b)))
+            except (ValueError, OverflowError):
+                raise _NoEvaluable("potencia fuera de dominio") from None
+
+        tipo = promote(_tipo(a), _tipo(b), op)
+        a, b = _convertir(a, tipo), _convertir(b, tipo)
+        if op in COMPARISON_OPS:
+            return _comparacion(op, a, b, tipo)
+        if op in ARITHMETIC_OPS:
+            return _aritmetica(op, a, b, tipo)
+        raise _NoEvaluable(f"operador '{op}'")
+
+    def _unary(self, node):
+        valor = self._expression(node.operand)
+        if node.op == '!':
+            return not _convertir(valor, 'bool')
+        if node.op == '+':
+            return valor
+        if isinstance(valor, bool):
+            raise _NoEvaluable("negación aritmética de un booleano")
+        return _entero(-valor) if isinstance(valor, int) else -valor
+
+    def _call(self, node):
+        func = self.functions.get(node.name)
+        if node.name not in self.puras or len(node.args) != len(func.parameters):
+            raise _NoEvaluable(f"'{node.name}' no es pura")
+        args = [_convertir(self._expression(arg), param.var_type) for arg, param in zip(node.args, func.parameters)]
+        return self._llamar(node.name, args, self.profundidad)
+
+    def _lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        raise _NoEvaluable(f"la variable '{name}' no es local")
+
+    _expression_handlers = {
+        NumberNode: _number,
+        BooleanNode: _boolean,
+        VariableNode: _variable,
+        AssignmentNode: _assignment,
+        BinaryOpNode: _binary,
+        UnaryOpNode: _unary,
+        FunctionCallNode: _call,
+    }
+
+
+def _es_constante(expr):
+    """Literales y operaciones entre literales (lo que queda después de plegar los argumentos)"""
+    if isinstance(expr, (NumberNode, BooleanNode)):
+        return True
+    if isinstance(expr, UnaryOpNode):
+        return _es_constante(expr.operand)
+    if isinstance(expr, BinaryOpNode):
+        return _es_constante(expr.left) and _es_constante(expr.right)
+    return False
@@ -0,0 +1,295 @@
+#ELIMINACION DE CODIGO MUERTO SOBRE EL AST
+#Se ejecuta antes de generar IR. Parte del bloque principal (Inicio) y de los
+#inicializadores globales y sigue las llamadas: las funciones que nunca se
+#alcanzan no se generan. Después resuelve cada uso de variable contra su
+#declaración (mismos ámbitos que TypeAnnotator) y quita las variables globales
+#y locales que nunca se leen, junto con sus asignaciones. Si el valor asignado
+#tiene llamadas, éstas se conservan como sentencias (pueden pintar o modificar
+#globales); si alguna llamada depende de un && o || se deja todo como está:
+#esa asignación y la variable entera (declaración y demás asignaciones).
+#Se repite hasta que no hay cambios: quitar una asignación puede dejar sin uso
+#a otra variable o función.
+from ast_builder import (
+    ASTNode,
+    DeclarationNode,
+    BlockNode,
+    IfNode,
+    ForNode,
+    WhileNode,
+    DoWhileNode,
+    ReturnNode,
+    PrintNode,
+    BinaryOpNode,
+    UnaryOpNode,
+    VariableNode,
+    AssignmentNode,
+    FunctionCallNode,
+)
+from type_annotator import LOGICAL_OPS
+
+
+def eliminar_codigo_muerto(program_node):
+    """Aplica DeadCodeEliminator al programa; retorna la lista de eliminaciones"""
+    return DeadCodeEliminator().eliminate(program_node)
+
+
+def _hijos(node):
+    """Nodos hijos en el orden de sus atributos (sirve para cualquier nodo del AST)"""
+    for value in vars(node).values():
+        if isinstance(value, ASTNode):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ASTNode):
+                    yield item
+
+
+def _llamadas(node, names):
+    """Agrega a 'names' las funciones llamadas en el subárbol"""
+    if isinstance(node, FunctionCallNode):
+        names.add(node.name)
+    for child in _hijos(node):
+        _llamadas(child, names)
+    return names
+
+
+def _llamadas_conservables(expr):
+    """
+    Llamadas que hay que mantener si se descarta el valor de 'expr', en orden de
+    evaluación. None si no se puede descartar sin cambiar el programa: tiene una
+    asignación o una llamada que sólo se evalúa según un && / ||.
+    """
+    if expr is None:
+        return []
+    if isinstance(expr, FunctionCallNode):
+        return [expr]
+    if isinstance(expr, AssignmentNode):
+        return None
+    if isinstance(expr, BinaryOpNode):
+        left = _llamadas_conservables(expr.left)
+        right = _llamadas_conservables(expr.right)
+        if left is None or right is None or (expr.op in LOGICAL_OPS and right):
+            return None
+        return left + right
+    if isinstance(expr, UnaryOpNode):
+        return _llamadas_conservables(expr.operand)
+    return []
+
+
+class DeadCodeEliminator:
+    def eliminate(self, program_node):
+        """Modifica el programa en sitio; retorna la lista de eliminaciones"""
+        self.removed = []
+        while self._remove_unreachable_functions(program_node) | self._remove_dead_variables(program_node):
+            pass
+        return self.removed
+
+    def _report(self, node, message):
+        self.removed.append(f"[Línea {node.line}] {message}" if node.line is not None else message)
+
+    # ========================
+    # FUNCIONES
+    # ========================
+
+    def _remove_unreachable_functions(self, program):
+        by_name = {func.name: func for func in program.functions}
+        pending = _llamadas(program.block, set())
+        for decl in program.globals:
+            _llamadas(decl, pending)
+
+        reachable = set()
+        while pending:
+            name = pending.pop()
+            if name in reachable or name not in by_name:
+                continue
+            reachable.add(name)
+            _llamadas(by_name[name].block, pending)
+
+        kept = []
+        for func in program.functions:
+            if func.name in reachable:
+                kept.append(func)
+            else:
+                self._report(func, f"Función '{func.name}' eliminada: no se llama desde Inicio")
+        changed = len(kept) != len(program.functions)
+        program.functions = kept
+        return changed
+
+    # ========================
+    # VARIABLES
+    # ========================
+
+    def _remove_dead_variables(self, program):
+        """Una pasada de análisis (lecturas por declaración) y una de reescritura"""
+        self.reads = set()         # id de declaraciones que se leen
+        self.value_stores = set()  # id de declaraciones asignadas dentro de una expresión
+        self.kept_stores = set()   # id de declaraciones con alguna asignación que no se puede quitar
+        self.targets = {}          # id de nodo de asignación/declaración -> declaración
+        self._walk(program)
+
+        self.changed = False
+        kept = []
+        for decl in program.globals:
+            # Un inicializador con llamadas se ejecuta al empezar main: la global se queda
+            if self._is_dead(decl) and _llamadas_conservables(decl.expr) == []:
+                self._report(decl, f"Variable global '{decl.identifier}' eliminada: nunca se lee")
+                self.changed = True
+            else:
+                kept.append(decl)
+        program.globals = kept
+        for func in program.functions:
+            self._rewrite(func.block)
+        self._rewrite(program.block)
+        return self.changed
+
+    def _is_dead(self, decl):
+        return (isinstance(decl, DeclarationNode) and id(decl) not in self.reads
+                and id(decl) not in self.value_stores and id(decl) not in self.kept_stores)
+
+    # ------------------------
+    # Recorrido con ámbitos
+    # ------------------------
+
+    def _walk(self, program):
+        """Recorre el programa con la pila de ámbitos que usan TypeAnnotator y LLVMGenerator"""
+        self.scopes = [{}]
+        for decl in program.globals:
+            self._statement(decl)
+        for func in program.functions:
+            self.scopes.append({param.identifier: param for param in func.parameters})
+            self._statement(func.block)
+            self.scopes.pop()
+        self._statement(program.block)
+
+    def _lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def _statement(self, node, clausula=False):
+        if node is None:
+            return
+        if isinstance(node, DeclarationNode):
+            self._expression(node.expr)
+            self.scopes[-1][node.identifier] = node
+            self._store(node, node, clausula)
+        elif isinstance(node, AssignmentNode):
+            # Asignación como sentencia: su valor no se usa
+            self._expression(node.expr)
+            self._store(node, self._lookup(node.name), clausula)
+        elif isinstance(node, BlockNode):
+            self.scopes.append({})
+            for stmt in node.statements:
+                self._statement(stmt)
+            self.scopes.pop()
+        elif isinstance(node, IfNode):
+            self._expression(node.condition)
+            self._statement(node.then_stmt)
+            self._statement(node.else_stmt)
+        elif isinstance(node, ForNode):
+            self._statement(node.init, clausula=True)
+            self._expression(node.condition)
+            self._statement(node.update, clausula=True)
+            self._statement(node.body)
+        elif isinstance(node, (WhileNode, DoWhileNode)):
+            self._expression(node.condition)
+            self._statement(node.body)
+        elif isinstance(node, ReturnNode):
+            self._expression(node.expr)
+        elif isinstance(node, PrintNode):
+            for arg in node.args:
+                self._expression(arg)
+        else:
+            self._expression(node)  # sentencia de expresión (llamada)
+
+    def _store(self, node, decl, clausula):
+        """
+        Registra la declaración que recibe la asignación 'node'. Si la asignación no
+        se puede quitar (ver _llamadas_conservables; en un 'para' cabe una sola
+        llamada), la variable se conserva: quitar sólo su declaración rompería el AST.
+        """
+        self.targets[id(node)] = decl
+        calls = _llamadas_conservables(node.expr)
+        if decl is not None and (calls is None or (clausula and len(calls) > 1)):
+            self.kept_stores.add(id(decl))
+
+    def _expression(self, node):
+        if node is None:
+            return
+        if isinstance(node, VariableNode):
+            decl = self._lookup(node.name)
+            if decl is not None:
+                self.reads.add(id(decl))
+        elif isinstance(node, AssignmentNode):
+            # El valor de la asignación se usa: la variable no se puede quitar
+            decl = self._lookup(node.name)
+            if decl is not None:
+                self.value_stores.add(id(decl))
+        for child in _hijos(node):
+            self._expression(child)
+
+    # ------------------------
+    # Reescritura
+    # ------------------------
+
+    def _dead_store(self, node):
+        """
+        Para una declaración o asignación a una variable que nunca se lee, retorna
+        las sentencias que la reemplazan (sus llamadas); None si hay que conservarla.
+        """
+        if not isinstance(node, (DeclarationNode, AssignmentNode)):
+            return None
+        decl = self.targets.get(id(node))
+        if decl is None or not self._is_dead(decl):
+            return None
+        calls = _llamadas_conservables(node.expr)
+        if calls is None:
+            return None
+        if isinstance(node, DeclarationNode):
+            self._report(node, f"Variable '{node.identifier}' eliminada: nunca se lee")
+        else:
+            self._report(node, f"Asignación a '{node.name}' eliminada: la variable nunca se lee")
+        self.changed = True
+        return calls
+
+    def _rewrite(self, node):
+        """Quita las asignaciones muertas de las sentencias bajo 'node'"""
+        if isinstance(node, BlockNode):
+            statements = []
+            for stmt in node.statements:
+                replacement = self._dead_store(stmt)
+                if replacement is None:
+                    self._rewrite(stmt)
+                    statements.append(stmt)
+                else:
+                    statements.extend(replacement)
+            node.statements = statements
+        elif isinstance(node, IfNode):
+            node.then_stmt = self._rewrite_single(node.then_stmt)
+            node.else_stmt = self._rewrite_single(node.else_stmt)
+        elif isinstance(node, ForNode):
+            node.init = self._rewrite_clause(node.init)
+            node.update = self._rewrite_clause(node.update)
+            node.body = self._rewrite_single(node.body)
+        elif isinstance(node, (WhileNode, DoWhileNode)):
+            node.body = self._rewrite_single(node.body)
+
+    def _rewrite_single(self, stmt):
+        """Cuerpo de una sola sentencia (si/para/mientras sin llaves)"""
+        if stmt is None:
+            return None
+        replacement = self._dead_store(stmt)
+        if replacement is None:
+            self._rewrite(stmt)
+            return stmt
+        return BlockNode(replacement)
+
+    def _rewrite_clause(self, stmt):
+        """Inicialización o actualización de un 'para': admite una sola sentencia o ninguna"""
+        if stmt is None or len(_llamadas_conservables(getattr(stmt, "expr", None)) or []) > 1:
+            return stmt
+        replacement = self._dead_store(stmt)
+        if replacement is None:
+            return stmt
+        return replacement[0] if replacement else None
@@ -0,0 +1,234 @@
+#CACHE PERSISTENTE DEL DFA DE PREDICCION DE ANTLR
+#El runtime de Python construye el DFA de predicción del lexer y del parser a
+#medida que analiza: el primer programa de cada proceso paga casi todo el costo.
+#Este módulo guarda en disco los DFA ya construidos (ExprLexer.decisionsToDFA,
+#ExprParser.decisionsToDFA y, si está generado, ExprLexerTabla.decisionsToDFA,
+#la base de keyword_lexer.KeywordTableLexer) tras analizar un corpus de
+#entrenamiento, y los vuelve a instalar al arrancar. Los estados del ATN y los
+#singletons del runtime (SemanticContext.NONE, PredictionContext.EMPTY, acciones
+#del lexer) no se serializan: se guardan como referencias y se resuelven contra
+#el ATN cargado, porque el runtime los compara por identidad.
+#La clave incluye las gramáticas, el ATN serializado de los lexers y del parser
+#generados y la instalación del runtime: si cambia algo, el archivo viejo se ignora.
+#Uso: python dfa_cache.py entrenar [programa.txt ...] | info | limpiar
+import gc
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+import antlr4
+from antlr4 import FileStream
+from antlr4.atn.ATNState import ATNState
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.PredictionContext import PredictionContext
+
+import ExprLexer as modulo_lexer
+import ExprParser as modulo_parser
+
+try:
+    import ExprLexerTabla as modulo_tabla
+except ImportError:  # sin generar: COMPILADOR_LEXER=tabla usa ExprLexer (keyword_lexer.py)
+    modulo_tabla = None
+
+GRAMATICA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Expr.g4")
+GRAMATICA_TABLA = os.path.join(os.path.dirname(GRAMATICA), "ExprLexerTabla.g4")
+
+# Clases generadas cuyo decisionsToDFA se guarda, por nombre en el archivo
+RECONOCEDORES = {"lexer": modulo_lexer.ExprLexer, "parser": modulo_parser.ExprParser}
+if modulo_tabla is not None:
+    RECONOCEDORES["tabla"] = modulo_tabla.ExprLexerTabla
+
+_precargado = False
+_huella = None
+
+
+def directorio_por_defecto():
+    base = os.environ.get("COMPILADOR_CACHE") or os.path.join(os.path.expanduser("~"), ".cache", "compilador_cesar")
+    return os.path.join(base, "dfa")
+
+
+def huella_gramatica():
+    """Hash de todo lo que define el ATN: si algo cambia, los DFA guardados ya no sirven"""
+    global _huella
+    if _huella is not None:
+        return _huella
+    h = hashlib.sha256()
+    for gramatica in (GRAMATICA, GRAMATICA_TABLA):
+        try:
+            with open(gramatica, "rb") as f:
+                h.update(f.read())
+        except OSError:
+            pass  # sin la gramática junto al código, basta con el ATN generado
+    for clase in RECONOCEDORES.values():
+        h.update(sys.modules[clase.__module__].serializedATN().encode())
+    # Instalación del runtime (importlib.metadata costaría más que cargar la caché)
+    h.update(f"{antlr4.__file__}|{os.stat(antlr4.__file__).st_mtime_ns}".encode())
+    _huella = h.hexdigest()
+    return _huella
+
+
+def ruta_cache(directorio=None):
+    return os.path.join(directorio or directorio_por_defecto(), huella_gramatica()[:32] + ".dfa")
+
+
+def contar_estados():
+    """(estados de los lexers, estados del parser) actualmente en memoria"""
+    estados = {nombre: sum(len(dfa.states) for dfa in clase.decisionsToDFA)
+               for nombre, clase in RECONOCEDORES.items()}
+    return estados["lexer"] + estados.get("tabla", 0), estados["parser"]
+
+
+# ========================
+# SERIALIZACION
+# ========================
+
+class _Serializador(pickle.Pickler):
+    def __init__(self, archivo, atns):
+        super().__init__(archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        self._acciones = {id(a): (nombre, i) for nombre, atn in atns.items()
+                          for i, a in enumerate(atn.lexerActions or [])}
+        self._atn_de_estado = {id(s): nombre for nombre, atn in atns.items() for s in atn.states if s is not None}
+
+    def persistent_id(self, obj):
+        if obj is SemanticContext.NONE:
+            return ("none",)
+        if obj is PredictionContext.EMPTY:
+            return ("vacio",)
+        if isinstance(obj, ATNState):
+            return ("estado", self._atn_de_estado[id(obj)], obj.stateNumber)
+        if id(obj) in self._acciones:
+            return ("accion", *self._acciones[id(obj)])
+        return None
+
+
+class _Deserializador(pickle.Unpickler):
+    def __init__(self, archivo, atns):
+        super().__init__(archivo)
+        self._atns = atns
+
+    def persistent_load(self, referencia):
+        tipo = referencia[0]
+        if tipo == "none":
+            return SemanticContext.NONE
+        if tipo == "vacio":
+            return PredictionContext.EMPTY
+        if tipo == "estado":
+            return self._atns[referencia[1]].states[referencia[2]]
+        if tipo == "accion":
+            return self._atns[referencia[1]].lexerActions[referencia[2]]
+        raise pickle.UnpicklingError(f"Referencia desconocida: {referencia}")
+
+
+def _atns():
+    return {nombre: clase.atn for nombre, clase in RECONOCEDORES.items()}
+
+
+def guardar_dfa(ruta=None):
+    """Escribe los DFA actuales de los lexers y del parser; retorna la ruta"""
+    ruta = ruta or ruta_cache()
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    datos = {"huella": huella_gramatica()}
+    datos.update((nombre, clase.decisionsToDFA) for nombre, clase in RECONOCEDORES.items())
+    limite = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limite, 20000))  # cadenas largas de aristas entre estados
+    try:
+        # Escritura atómica: otro proceso nunca lee un archivo a medio escribir
+        fd, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta))
+        with os.fdopen(fd, "wb") as f:
+            _Serializador(f, _atns()).dump(datos)
+        os.replace(temporal, ruta)
+    finally:
+        sys.setrecursionlimit(limite)
+    return ruta
+
+
+def cargar_dfa(ruta=None):
+    """
+    Instala los DFA guardados en RECONOCEDORES. Retorna True si se cargaron; False
+    si no hay archivo, es de otra gramática o está dañado (se sigue en frío).
+    """
+    ruta = ruta or ruta_cache()
+    limite = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limite, 20000))
+    # Miles de objetos nuevos y ninguno es basura: el recolector sólo haría pasadas inútiles
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        with open(ruta, "rb") as f:
+            datos = _Deserializador(f, _atns()).load()
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, IndexError, KeyError, TypeError):
+        return False
+    finally:
+        if gc_activo:
+            gc.enable()
+        sys.setrecursionlimit(limite)
+    if datos.get("huella") != huella_gramatica():
+        return False
+    if any(len(datos.get(nombre, ())) != len(clase.decisionsToDFA) for nombre, clase in RECONOCEDORES.items()):
+        return False
+    # Reemplazo en sitio: los lexers y parsers ya creados comparten estas mismas listas
+    for nombre, clase in RECONOCEDORES.items():
+        clase.decisionsToDFA[:] = datos[nombre]
+    return True
+
+
+def precargar():
+    """Carga la caché una sola vez por proceso (la llaman los puntos de entrada al parsear)"""
+    global _precargado
+    if not _precargado:
+        _precargado = True
+        cargar_dfa()
+
+
+# ========================
+# ENTRENAMIENTO
+# ========================
+
+def entrenar(archivos, ruta=None):
+    """Analiza cada archivo para poblar el DFA y lo guarda; retorna (ruta, segundos)"""
+    from keyword_lexer import LEXERS, crear_lexer, lexer_por_defecto
+    from pipeline import parsear
+    precargar()
+    inicio = time.perf_counter()
+    for archivo in archivos:
+        parsear(FileStream(archivo, encoding="utf-8"))
+        # El otro lexer (COMPILADOR_LEXER) también debe quedar entrenado
+        for tipo in LEXERS:
+            if tipo != lexer_por_defecto():
+                crear_lexer(FileStream(archivo, encoding="utf-8"), tipo).getAllTokens()
+    return guardar_dfa(ruta), time.perf_counter() - inicio
+
+
+def main():
+    accion = sys.argv[1] if len(sys.argv) > 1 else "info"
+    ruta = ruta_cache()
+    if accion == "entrenar":
+        archivos = sys.argv[2:] or [os.path.join(os.path.dirname(GRAMATICA), "a.txt")]
+        ruta, segundos = entrenar(archivos, ruta)
+        lexer, parser = contar_estados()
+        print(f"[INFO] {len(archivos)} programas analizados en {segundos:.2f} s")
+        print(f"[INFO] DFA guardado en {ruta}: {lexer} estados del lexer, {parser} del parser "
+              f"({os.path.getsize(ruta) / 1024:.0f} KiB)")
+    elif accion == "info":
+        if cargar_dfa(ruta):
+            lexer, parser = contar_estados()
+            print(f"{ruta}: {lexer} estados del lexer, {parser} del parser")
+        else:
+            print(f"No hay caché válida para la gramática actual ({ruta})")
+    elif accion == "limpiar":
+        directorio = os.path.dirname(ruta)
+        if os.path.isdir(directorio):
+            for nombre in os.listdir(directorio):
+                if nombre.endswith(".dfa"):
+                    os.remove(os.path.join(directorio, nombre))
+    else:
+        print("Uso: python dfa_cache.py entrenar [programa.txt ...] | info | limpiar")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#INFERENCIA DE ATRIBUTOS DE FUNCION SOBRE EL AST
+#LLVMGenerator marca cada función del usuario con lo que se puede demostrar de
+#ella, para que LLVM borre llamadas cuyo resultado no se usa, saque llamadas de
+#los bucles o reordene accesos a memoria alrededor de ellas:
+#  nounwind   siempre: el lenguaje no tiene excepciones y las funciones de C que
+#             se llaman (printf, malloc, pow...) no las lanzan.
+#  norecurse  la función no está en un ciclo del grafo de llamadas.
+#  readnone   no lee ni escribe variables globales, no pinta y no llama a nada
+#             que no sea readnone. Concatenar cadenas (malloc) y '^' o '%' con
+#             decimales (pow/fmod pueden escribir errno) también lo impiden.
+#  readonly   igual que readnone, pero puede leer variables globales.
+#  willreturn no tiene bucles, es norecurse y sólo llama a funciones willreturn
+#             (no pinta: printf depende de la salida).
+#Las variables locales viven en la pila de la propia función: escribirlas no
+#cuenta. Las llamadas a funciones del programa se resuelven hasta un punto fijo:
+#se parte suponiendo todo y se quita lo que una llamada no garantiza.
+from ast_builder import (
+    ASTNode,
+    DeclarationNode,
+    BlockNode,
+    ForNode,
+    WhileNode,
+    DoWhileNode,
+    PrintNode,
+    BinaryOpNode,
+    VariableNode,
+    AssignmentNode,
+    FunctionCallNode,
+)
+
+
+def inferir_atributos(program_node):
+    """nombre de función -> conjunto de atributos (el AST debe tener los tipos anotados)"""
+    return AttributeInference().infer(program_node)
+
+
+def _hijos(node):
+    for value in vars(node).values():
+        if isinstance(value, ASTNode):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ASTNode):
+                    yield item
+
+
+class _Cuerpo:
+    """Lo que hace el cuerpo de una función sin contar a quién llama"""
+
+    def __init__(self, func):
+        self.lee_globales = self.escribe_globales = False
+        self.pinta = self.usa_libc = self.bucles = False
+        self.llamadas = set()
+        self.scopes = [{p.identifier for p in func.parameters}]
+        self._node(func.block)
+
+    def _local(self, name):
+        return any(name in scope for scope in self.scopes)
+
+    def _node(self, node):
+        if isinstance(node, DeclarationNode):
+            if node.expr is not None:
+                self._node(node.expr)
+            self.scopes[-1].add(node.identifier)
+            return
+        if isinstance(node, VariableNode) and not self._local(node.name):
+            self.lee_globales = True
+        elif isinstance(node, AssignmentNode) and not self._local(node.name):
+            self.escribe_globales = True
+        elif isinstance(node, PrintNode):
+            self.pinta = True
+        elif isinstance(node, FunctionCallNode):
+            self.llamadas.add(node.name)
+        elif isinstance(node, (WhileNode, DoWhileNode, ForNode)):
+            self.bucles = True
+        elif isinstance(node, BinaryOpNode) and (
+                node.operand_type == 'cadena' or node.op == '^'
+                or (node.op == '%' and node.operand_type == 'decimal')):
+            self.usa_libc = True
+
+        if isinstance(node, BlockNode):
+            self.scopes.append(set())
+        for child in _hijos(node):
+            self._node(child)
+        if isinstance(node, BlockNode):
+            self.scopes.pop()
+
+
+class AttributeInference:
+    def infer(self, program_node):
+        cuerpos = {func.name: _Cuerpo(func) for func in program_node.functions}
+        self.calls = {name: cuerpo.llamadas for name, cuerpo in cuerpos.items()}
+
+        atributos = {}
+        for name, cuerpo in cuerpos.items():
+            propios = {'nounwind'}
+            if name not in self._alcanzables(name):
+                propios.add('norecurse')
+            if not (cuerpo.escribe_globales or cuerpo.pinta or cuerpo.usa_libc):
+                propios.add('readonly')
+                if not cuerpo.lee_globales:
+                    propios.add('readnone')
+            if 'norecurse' in propios and not (cuerpo.bucles or cuerpo.pinta or cuerpo.usa_libc):
+                propios.add('willreturn')
+            atributos[name] = propios
+
+        # Una función garantiza readnone/readonly/willreturn sólo si lo que llama también
+        cambio = True
+        while cambio:
+            cambio = False
+            for name, propios in atributos.items():
+                for atributo in ('readnone', 'readonly', 'willreturn'):
+                    if atributo in propios and any(atributo not in atributos.get(llamada, ())
+                                                   for llamada in self.calls[name]):
+                        propios.discard(atributo)
+                        cambio = True
+        for propios in atributos.values():
+            if 'readnone' in propios:
+                propios.discard('readonly')  # LLVM no admite ambos a la vez
+        return atributos
+
+    def _alcanzables(self, name):
+        vistos, pendientes = set(), list(self.calls[name])
+        while pendientes:
+            actual = pendientes.pop()
+            if actual not in vistos and actual in self.calls:
+                vistos.add(actual)
+                pendientes.extend(self.calls[actual])
+        return vistos
@@ -0,0 +1,58 @@
+#ANALISIS DE VARIABLES GLOBALES
+#Busca qué variables globales se asignan en alguna parte del programa (funciones,
+#Inicio o el inicializador de otra global), resolviendo cada nombre con los mismos
+#ámbitos que TypeAnnotator: una local o un parámetro con el mismo nombre tapa a la
+#global. Las que nunca se asignan conservan siempre su valor inicial; si ese valor
+#se conoce al compilar, LLVMGenerator las emite como constantes y LLVM puede
+#reemplazar cada lectura por el valor.
+from ast_builder import (
+    ASTNode,
+    DeclarationNode,
+    BlockNode,
+    AssignmentNode,
+)
+
+
+def globales_constantes(program_node):
+    """Nombres de las variables globales que nunca se asignan"""
+    return GlobalAnalysis().constants(program_node)
+
+
+def _hijos(node):
+    for value in vars(node).values():
+        if isinstance(value, ASTNode):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ASTNode):
+                    yield item
+
+
+class GlobalAnalysis:
+    def constants(self, program_node):
+        self.assigned = set()
+        for decl in program_node.globals:
+            if decl.expr is not None:
+                self.scopes = []
+                self._node(decl.expr)
+        for func in program_node.functions:
+            self.scopes = [{param.identifier for param in func.parameters}]
+            self._node(func.block)
+        self.scopes = []
+        self._node(program_node.block)
+        return {decl.identifier for decl in program_node.globals} - self.assigned
+
+    def _node(self, node):
+        if isinstance(node, DeclarationNode):
+            if node.expr is not None:
+                self._node(node.expr)
+            self.scopes[-1].add(node.identifier)
+            return
+        if isinstance(node, AssignmentNode) and not any(node.name in scope for scope in self.scopes):
+            self.assigned.add(node.name)
+        if isinstance(node, BlockNode):
+            self.scopes.append(set())
+        for child in _hijos(node):
+            self._node(child)
+        if isinstance(node, BlockNode):
+            self.scopes.pop()
@@ -0,0 +1,532 @@
+#FRONTEND MANUAL: LEXER Y PARSER ESCRITOS A MANO, SIN ANTLR
+#El runtime de Python de ANTLR es lo más lento del frontend: predicción
+#adaptativa token por token, un contexto por regla y un recorrido del árbol
+#para la semántica y otro para el AST. Aquí:
+#  - tokenizar() reconoce todo el fuente con una sola expresión regular y
+#    clasifica las palabras con la tabla de keyword_lexer.py,
+#  - HandParser es descendente recursivo en las sentencias y de precedencia
+#    (Pratt) en las expresiones, y construye directamente los nodos de
+#    ast_builder.py con las mismas líneas que les pone ASTBuilder,
+#  - ast_semantics.py hace sobre ese AST las verificaciones de SemanticListener.
+#El lenguaje aceptado es el de Expr.g4 y el parser rechaza en el mismo token
+#que ANTLR. Los mensajes de error de sintaxis se piden a ANTLR volviendo a
+#analizar el fuente, sólo cuando hay un error: así son los mismos, con la
+#recuperación de ANTLR incluida. A diferencia del camino de ANTLR, que informa
+#y sigue con el árbol reparado, un error léxico o sintáctico detiene la
+#compilación (ParseError).
+#Se elige con construir_ast(..., frontend) de pipeline.py o la variable de
+#entorno COMPILADOR_FRONTEND ('antlr', por defecto, o 'manual').
+import os
+import re
+
+from antlr4 import Token
+
+from ExprParser import ExprParser
+from ast_builder import (
+    ProgramNode,
+    DeclarationNode,
+    FunctionNode,
+    ParameterNode,
+    BlockNode,
+    IfNode,
+    ForNode,
+    WhileNode,
+    DoWhileNode,
+    ReturnNode,
+    PrintNode,
+    BinaryOpNode,
+    UnaryOpNode,
+    NumberNode,
+    BooleanNode,
+    StringNode,
+    VariableNode,
+    AssignmentNode,
+    FunctionCallNode,
+)
+from ast_semantics import ASTSemanticAnalyzer
+from keyword_lexer import PALABRAS_EXACTAS, SIMBOLOS, clasificar
+from SemanticListener import SemanticError
+
+FRONTENDS = ("antlr", "manual")
+
+EOF = Token.EOF
+ERROR_LEXICO = -2  # seudo-token: carácter que ninguna regla del lexer reconoce
+
+ID = ExprParser.ID
+NUMERO = ExprParser.NUMERO
+BOOL_LIT = ExprParser.BOOL_LIT
+TEXTO = ExprParser.TEXTO
+ASIGN = ExprParser.ASIGN
+POTENCIA = ExprParser.POTENCIA
+NOT = ExprParser.NOT
+SUMA = ExprParser.SUMA
+RESTA = ExprParser.RESTA
+PAR_IZQ = ExprParser.PAR_IZQ
+PAR_DER = ExprParser.PAR_DER
+LLAVE_IZQ = ExprParser.LLAVE_IZQ
+LLAVE_DER = ExprParser.LLAVE_DER
+PUNTOCOMA = ExprParser.PUNTOCOMA
+COMA = ExprParser.COMA
+FUNCIONES = PALABRAS_EXACTAS["funciones"]
+
+TIPOS = {ExprParser.ENTERO, ExprParser.DECIMAL, ExprParser.BOOL, ExprParser.CADENA, ExprParser.VOID}
+DECLARACIONES = TIPOS | {ExprParser.VAR}
+UNARIOS = {NOT, SUMA, RESTA}
+
+# Nivel de cada operador binario: mayor número, liga más fuerte ('^' aparte: es
+# asociativo a la derecha y su base es un unario)
+NIVELES = {
+    ExprParser.O: 1,
+    ExprParser.Y: 2,
+    ExprParser.IGUAL: 3, ExprParser.DIF: 3,
+    ExprParser.MENOR: 4, ExprParser.MAYOR: 4, ExprParser.MEN_IGUAL: 4, ExprParser.MAY_IGUAL: 4,
+    SUMA: 5, RESTA: 5,
+    ExprParser.MULT: 6, ExprParser.DIV: 6, ExprParser.MOD: 6,
+}
+
+# Las reglas del lexer de Expr.g4; '.' de ANTLR incluye el salto de línea
+_TOKEN = re.compile(
+    r"(?P<espacios>[ \t\r\n]+)"
+    r"|(?P<comentario>//[^\r\n]*|/\*.*?\*/)"
+    r"|(?P<palabra>[a-zA-Z][a-zA-Z0-9_]*)"
+    r"|(?P<numero>[0-9]+(?:\.[0-9]+)?)"
+    r'|(?P<texto>"(?:[^"\\\r\n]|\\.)*")'
+    r"|(?P<simbolo>" + "|".join(re.escape(simbolo) for simbolo in sorted(SIMBOLOS, key=len, reverse=True)) + ")",
+    re.DOTALL)
+
+
+def frontend_por_defecto():
+    return os.environ.get("COMPILADOR_FRONTEND", "antlr")
+
+
+def elegir_frontend(frontend=None):
+    """'antlr' o 'manual' según 'frontend' (por defecto COMPILADOR_FRONTEND)"""
+    frontend = frontend or frontend_por_defecto()
+    if frontend not in FRONTENDS:
+        raise ValueError(f"Frontend desconocido '{frontend}': use uno de {', '.join(FRONTENDS)}")
+    return frontend
+
+
+class ParseError(SemanticError):
+    """
+    Errores léxicos o sintácticos, con los mensajes de ANTLR ('line L:C ...').
+    Hereda de SemanticError: quien atrapa los errores de construir_ast atrapa éstos.
+    """
+
+    def __init__(self, errors, line=None, column=None):
+        super().__init__("\n".join(errors))
+        self.errors = errors
+        self.line = line        # token donde se detuvo el parser manual
+        self.column = column
+
+
+class _Rechazo(Exception):
+    def __init__(self, token):
+        tipo, texto, line, column = token
+        if tipo == ERROR_LEXICO:
+            mensaje = f"token recognition error at: '{texto}'"
+        else:
+            mensaje = f"mismatched input '{texto}'"
+        super().__init__(f"line {line}:{column} {mensaje}")
+        self.line = line
+        self.column = column
+
+
+# ========================
+# LEXER
+# ========================
+
+def tokenizar(codigo):
+    """
+    Lista de tokens (tipo, texto, línea, columna) terminada en EOF. Un carácter no
+    reconocido corta la lista con un seudo-token ERROR_LEXICO en su posición.
+    """
+    tokens = []
+    agregar = tokens.append
+    linea, inicio_linea, pos = 1, 0, 0
+    for m in _TOKEN.finditer(codigo):
+        inicio = m.start()
+        if inicio != pos:
+            agregar((ERROR_LEXICO, codigo[pos], linea, pos - inicio_linea))
+            return tokens
+        texto = m.group()
+        grupo = m.lastgroup
+        if grupo == "palabra":
+            agregar((clasificar(texto), texto, linea, inicio - inicio_linea))
+        elif grupo == "simbolo":
+            agregar((SIMBOLOS[texto], texto, linea, inicio - inicio_linea))
+        elif grupo == "numero":
+            agregar((NUMERO, texto, linea, inicio - inicio_linea))
+        elif grupo == "texto":
+            agregar((TEXTO, texto, linea, inicio - inicio_linea))
+        # Como en ANTLR, sólo '\n' cambia de línea (también dentro de cadenas y comentarios)
+        if grupo in ("espacios", "comentario", "texto"):
+            saltos = texto.count("\n")
+            if saltos:
+                linea += saltos
+                inicio_linea = inicio + texto.rfind("\n") + 1
+        pos = m.end()
+    if pos != len(codigo):
+        agregar((ERROR_LEXICO, codigo[pos], linea, pos - inicio_linea))
+        return tokens
+    agregar((EOF, "<EOF>", linea, pos - inicio_linea))
+    return tokens
+
+
+# ========================
+# PARSER
+# ========================
+
+class HandParser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        # Lo que el AST no distingue y ast_semantics.py necesita
+        self.funciones_primero = True  # la sección 'funciones' precede al bloque principal
+        self.primer_grupo = {}         # f(a)(b): llamada -> argumentos del primer grupo
+        self.inicios = {}              # (expr) en otra línea que su '(' -> línea del '('
+
+    def _rechazar(self):
+        raise _Rechazo(self.tokens[self.pos])
+
+    def _esperar(self, tipo):
+        token = self.tokens[self.pos]
+        if token[0] != tipo:
+            self._rechazar()
+        self.pos += 1
+        return token
+
+    # Programa y funciones
+
+    def programa(self):
+        inicio = self._esperar(ExprParser.PROGRAMA)
+        name = self._esperar(ID)[1]
+        self._esperar(LLAVE_IZQ)
+        globals_list = []
+        while self.tokens[self.pos][0] in TIPOS:
+            globals_list.append(self._declaracion())
+        functions = []
+        if self.tokens[self.pos][0] == FUNCIONES:
+            functions = self._funciones()
+            block = self._bloque_programa()
+        else:
+            block = self._bloque_programa()
+            self.funciones_primero = False
+            if self.tokens[self.pos][0] == FUNCIONES:
+                functions = self._funciones()
+        self._esperar(LLAVE_DER)
+        self._esperar(EOF)
+        node = ProgramNode(name, globals_list, functions, block)
+        node.line = inicio[2]
+        return node
+
+    def _funciones(self):
+        self.pos += 1  # 'funciones'
+        self._esperar(LLAVE_IZQ)
+        functions = []
+        while self.tokens[self.pos][0] != LLAVE_DER:
+            functions.append(self._funcion())
+        self.pos += 1
+        return functions
+
+    def _funcion(self):
+        tipo = self.tokens[self.pos]
+        if tipo[0] not in TIPOS:
+            self._rechazar()
+        self.pos += 1
+        name = self._esperar(ID)[1]
+        self._esperar(PAR_IZQ)
+        parameters = []
+        if self.tokens[self.pos][0] in TIPOS:
+            parameters.append(self._parametro())
+            while self.tokens[self.pos][0] == COMA:
+                self.pos += 1
+                parameters.append(self._parametro())
+        self._esperar(PAR_DER)
+        block = self._bloque()
+        node = FunctionNode(tipo[1].lower(), name, parameters, block)
+        node.line = tipo[2]
+        return node
+
+    def _parametro(self):
+        tipo = self.tokens[self.pos]
+        if tipo[0] not in TIPOS:
+            self._rechazar()
+        self.pos += 1
+        # ASTBuilder crea los parámetros sin visitarlos: quedan sin línea
+        return ParameterNode(tipo[1].lower(), self._esperar(ID)[1])
+
+    def _bloque_programa(self):
+        self._esperar(ExprParser.INICIO)
+        block = self._bloque()
+        self._esperar(ExprParser.FIN)
+        return block
+
+    # Sentencias
+
+    def _bloque(self):
+        inicio = self._esperar(LLAVE_IZQ)
+        statements = []
+        tokens = self.tokens
+        while tokens[self.pos][0] != LLAVE_DER:
+            statements.append(self._sentencia())
+        self.pos += 1
+        node = BlockNode(statements)
+        node.line = inicio[2]
+        return node
+
+    def _sentencia(self):
+        tipo = self.tokens[self.pos][0]
+        if tipo in DECLARACIONES:
+            return self._declaracion()
+        metodo = self._sentencias.get(tipo)
+        if metodo is not None:
+            return metodo(self)
+        expr = self._expr()
+        self._esperar(PUNTOCOMA)
+        return expr
+
+    def _declaracion(self):
+        tipo = self.tokens[self.pos]
+        self.pos += 1
+        identifier = self._esperar(ID)[1]
+        expr = None
+        if self.tokens[self.pos][0] == ASIGN:
+            self.pos += 1
+            expr = self._expr()
+        self._esperar(PUNTOCOMA)
+        node = DeclarationNode("inferido" if tipo[0] == ExprParser.VAR else tipo[1].lower(), identifier, expr)
+        node.line = tipo[2]
+        return node
+
+    def _si(self):
+        inicio = self.tokens[self.pos]
+        self.pos += 1
+        self._esperar(PAR_IZQ)
+        condition = self._expr()
+        self._esperar(PAR_DER)
+        then_stmt = self._sentencia()
+        else_stmt = None
+        if self.tokens[self.pos][0] == ExprParser.SINO:
+            self.pos += 1
+            else_stmt = self._sentencia()
+        node = IfNode(condition, then_stmt, else_stmt)
+        node.line = inicio[2]
+        return node
+
+    def _para(self):
+        inicio = self.tokens[self.pos]
+        self.pos += 1
+        self._esperar(PAR_IZQ)
+        if self.tokens[self.pos][0] in DECLARACIONES:
+            init = self._declaracion()
+        else:
+            init = self._expr()
+            self._esperar(PUNTOCOMA)
+        condition = self._expr() if self.tokens[self.pos][0] != PUNTOCOMA else None
+        self._esperar(PUNTOCOMA)
+        update = self._expr() if self.tokens[self.pos][0] != PAR_DER else None
+        self._esperar(PAR_DER)
+        node = ForNode(init, condition, update, self._sentencia())
+        node.line = inicio[2]
+        return node
+
+    def _mientras(self):
+        inicio = self.tokens[self.pos]
+        self.pos += 1
+        self._esperar(PAR_IZQ)
+        condition = self._expr()
+        self._esperar(PAR_DER)
+        node = WhileNode(condition, self._sentencia())
+        node.line = inicio[2]
+        return node
+
+    def _hacer(self):
+        inicio = self.tokens[self.pos]
+        self.pos += 1
+        body = self._sentencia()
+        self._esperar(ExprParser.MIENTRAS)
+        self._esperar(PAR_IZQ)
+        condition = self._expr()
+        self._esperar(PAR_DER)
+        self._esperar(PUNTOCOMA)
+        node = DoWhileNode(body, condition)
+        node.line = inicio[2]
+        return node
+
+    def _retornar(self):
+        inicio = self.tokens[self.pos]
+        self.pos += 1
+        expr = self._expr() if self.tokens[self.pos][0] != PUNTOCOMA else None
+        self._esperar(PUNTOCOMA)
+        node = ReturnNode(expr)
+        node.line = inicio[2]
+        return node
+
+    def _pintar(self):
+        inicio = self.tokens[self.pos]
+        self.pos += 1
+        self._esperar(PAR_IZQ)
+        args = self._argumentos() if self.tokens[self.pos][0] != PAR_DER else []
+        self._esperar(PAR_DER)
+        self._esperar(PUNTOCOMA)
+        node = PrintNode(args)
+        node.line = inicio[2]
+        return node
+
+    _sentencias = {
+        LLAVE_IZQ: _bloque,
+        ExprParser.SI: _si,
+        ExprParser.PARA: _para,
+        ExprParser.MIENTRAS: _mientras,
+        ExprParser.HACER: _hacer,
+        ExprParser.RET: _retornar,
+        ExprParser.PINTAR: _pintar,
+    }
+
+    # Expresiones
+
+    def _argumentos(self):
+        args = [self._expr()]
+        while self.tokens[self.pos][0] == COMA:
+            self.pos += 1
+            args.append(self._expr())
+        return args
+
+    def _expr(self):
+        # La asignación sólo encabeza una expresión: 'a + b = 1' no es válido
+        token = self.tokens[self.pos]
+        if token[0] == ID and self.tokens[self.pos + 1][0] == ASIGN:
+            self.pos += 2
+            node = AssignmentNode(token[1], self._expr())
+            node.line = token[2]
+            return node
+        return self._binaria(1)
+
+    def _binaria(self, minimo):
+        """Operadores de nivel >= minimo, asociativos a la izquierda"""
+        tokens = self.tokens
+        line = tokens[self.pos][2]
+        left = self._potencia()
+        while True:
+            op = tokens[self.pos]
+            nivel = NIVELES.get(op[0])
+            if nivel is None or nivel < minimo:
+                return left
+            self.pos += 1
+            left = BinaryOpNode(left, op[1], self._binaria(nivel + 1))
+            left.line = line
+
+    def _potencia(self):
+        line = self.tokens[self.pos][2]
+        base = self._unario()
+        if self.tokens[self.pos][0] != POTENCIA:
+            return base
+        self.pos += 1
+        node = BinaryOpNode(base, "^", self._potencia())
+        node.line = line
+        return node
+
+    def _unario(self):
+        token = self.tokens[self.pos]
+        if token[0] in UNARIOS:
+            self.pos += 1
+            node = UnaryOpNode(token[1], self._unario())
+            node.line = token[2]
+            return node
+        primary = self._primario()
+        if self.tokens[self.pos][0] != PAR_IZQ:
+            return primary
+
+        # Llamada: ASTBuilder junta en una los grupos de f(a)(b) y toma el nombre
+        # sólo si la expresión primaria es un identificador
+        name = token[1] if token[0] == ID else primary
+        args = []
+        grupos = 0
+        primero = None
+        while self.tokens[self.pos][0] == PAR_IZQ:
+            self.pos += 1
+            if self.tokens[self.pos][0] != PAR_DER:
+                grupo = self._argumentos()
+                args += grupo
+                if primero is None:
+                    primero = len(grupo)
+            self._esperar(PAR_DER)
+            grupos += 1
+        node = FunctionCallNode(name, args)
+        node.line = token[2]
+        if grupos > 1 and primero is not None and primero != len(args):
+            self.primer_grupo[node] = primero
+        return node
+
+    def _primario(self):
+        token = self.tokens[self.pos]
+        tipo, texto, line, _ = token
+        self.pos += 1
+        if tipo == ID:
+            node = VariableNode(texto)
+        elif tipo == NUMERO:
+            node = NumberNode(float(texto) if '.' in texto else int(texto))
+        elif tipo == TEXTO:
+            node = StringNode(texto[1:-1])
+        elif tipo == BOOL_LIT:
+            node = BooleanNode(texto == 'verdad')
+        elif tipo == PAR_IZQ:
+            node = self._expr()
+            self._esperar(PAR_DER)
+            if node.line != line:
+                self.inicios[node] = line
+            return node
+        else:
+            self.pos -= 1
+            self._rechazar()
+        node.line = line
+        return node
+
+
+# ========================
+# API PÚBLICA
+# ========================
+
+def mensajes_antlr(codigo):
+    """Errores léxicos y sintácticos que informa ANTLR para 'codigo', en orden"""
+    from antlr4 import InputStream, CommonTokenStream
+    from antlr4.error.ErrorListener import ErrorListener
+    from keyword_lexer import crear_lexer
+
+    class Recolector(ErrorListener):
+        def __init__(self):
+            self.errors = []
+
+        def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+            self.errors.append(f"line {line}:{column} {msg}")
+
+    recolector = Recolector()
+    lexer = crear_lexer(InputStream(codigo))
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(recolector)
+    parser = ExprParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(recolector)
+    parser.prog()
+    return recolector.errors
+
+
+def parsear_manual(codigo):
+    """Retorna (ProgramNode, HandParser). Lanza ParseError si el fuente no es válido."""
+    parser = HandParser(tokenizar(codigo))
+    try:
+        return parser.programa(), parser
+    except _Rechazo as rechazo:
+        raise ParseError(mensajes_antlr(codigo) or [str(rechazo)], rechazo.line, rechazo.column) from None
+
+
+def analizar_manual(codigo, check_unused_functions=True):
+    """
+    AST sin anotar y analizador semántico (con errors y warnings) del código.
+    Lanza ParseError si el fuente no es léxica o sintácticamente válido.
+    """
+    program, parser = parsear_manual(codigo)
+    analizador = ASTSemanticAnalyzer(check_unused_functions)
+    analizador.analyze(program, parser.funciones_primero, parser.primer_grupo, parser.inicios)
+    return program, analizador
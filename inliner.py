@@ -0,0 +1,389 @@
+#EXPANSION EN LINEA DE FUNCIONES PEQUEÑAS SOBRE EL AST
+#Reemplaza llamadas a funciones pequeñas y no recursivas por una copia de su
+#cuerpo, antes de generar código: sirve a cualquier consumidor del AST y evita
+#el costo de la llamada aunque no se optimice el IR (lli no hace inlining).
+#Cada llamada expandida queda como sentencias antes de la sentencia que la
+#contenía:
+#    entero f.3.ret;                          (temporal del resultado)
+#    { entero f.3.a = <arg>; <cuerpo de f> }  (parámetros como locales)
+#y la llamada se reemplaza por 'f.3.ret'. Los 'ret' del cuerpo pasan a ser
+#asignaciones al temporal; para eso todo 'ret' debe quedar al final de un camino
+#('si (c) { ret x; } ret y;' se reescribe como si/sino). Los parámetros y las
+#locales del cuerpo se renombran con el prefijo 'f.3.' (un punto no es válido
+#en un identificador del lenguaje) y no se expande si una variable global que lee
+#el cuerpo está tapada por una local del llamador.
+#Sólo se sube una llamada si lo que se evalúa antes en la misma sentencia no
+#cambia de orden: nada con efectos antes, ni lecturas de variables que la función
+#o sus argumentos escriben (globales, o locales asignadas en un argumento), ni
+#llamadas bajo el lado derecho de && / || o en la condición de un bucle. El tamaño máximo del cuerpo (en nodos del AST) se configura con el
+#parámetro 'umbral' o la variable de entorno COMPILADOR_UMBRAL_INLINE.
+import copy
+import os
+
+from ast_builder import (
+    ASTNode,
+    DeclarationNode,
+    BlockNode,
+    IfNode,
+    ForNode,
+    WhileNode,
+    DoWhileNode,
+    ReturnNode,
+    PrintNode,
+    BinaryOpNode,
+    UnaryOpNode,
+    VariableNode,
+    AssignmentNode,
+    FunctionCallNode,
+)
+from type_annotator import LOGICAL_OPS, TypeAnnotator
+
+UMBRAL_POR_DEFECTO = 40  # nodos del AST en el cuerpo de la función
+
+
+def umbral_por_defecto():
+    return int(os.environ.get("COMPILADOR_UMBRAL_INLINE", UMBRAL_POR_DEFECTO))
+
+
+def expandir_en_linea(program_node, umbral=None):
+    """Aplica Inliner al programa; retorna la lista de llamadas expandidas"""
+    return Inliner(umbral).inline(program_node)
+
+
+def _hijos(node):
+    for value in vars(node).values():
+        if isinstance(value, ASTNode):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ASTNode):
+                    yield item
+
+
+def _nodos(node):
+    """Todos los nodos del subárbol, incluido 'node'"""
+    pendientes = [node]
+    while pendientes:
+        actual = pendientes.pop()
+        yield actual
+        pendientes.extend(_hijos(actual))
+
+
+def _sentencias_de(stmt):
+    """Una sentencia como lista (los bloques se aplanan: los nombres ya son únicos)"""
+    if stmt is None:
+        return []
+    if isinstance(stmt, BlockNode):
+        return list(stmt.statements)
+    return [stmt]
+
+
+def _contiene_ret(node):
+    return any(isinstance(n, ReturnNode) for n in _nodos(node))
+
+
+def _siempre_retorna(stmts):
+    for stmt in stmts:
+        if isinstance(stmt, ReturnNode):
+            return True
+        if isinstance(stmt, BlockNode) and _siempre_retorna(stmt.statements):
+            return True
+        if (isinstance(stmt, IfNode) and _siempre_retorna(_sentencias_de(stmt.then_stmt))
+                and _siempre_retorna(_sentencias_de(stmt.else_stmt))):
+            return True
+    return False
+
+
+def _en_cola(stmts):
+    """
+    Reescribe 'stmts' para que todo 'ret' sea lo último de su camino; None si no
+    se puede sin duplicar código (un 'ret' dentro de un bucle, o un 'si' donde
+    ninguna rama retorna siempre).
+    """
+    result = []
+    for i, stmt in enumerate(stmts):
+        rest = stmts[i + 1:]
+        if isinstance(stmt, ReturnNode):
+            return result + [stmt]  # lo que sigue es inalcanzable
+        if not _contiene_ret(stmt):
+            result.append(stmt)
+            continue
+        if isinstance(stmt, BlockNode):
+            return _en_cola(result + stmt.statements + rest)
+        if not isinstance(stmt, IfNode):
+            return None
+        then_stmts, else_stmts = _sentencias_de(stmt.then_stmt), _sentencias_de(stmt.else_stmt)
+        if _siempre_retorna(then_stmts):
+            then_stmts, else_stmts = _en_cola(then_stmts), _en_cola(else_stmts + rest)
+        elif _siempre_retorna(else_stmts):
+            then_stmts, else_stmts = _en_cola(then_stmts + rest), _en_cola(else_stmts)
+        else:
+            return None
+        if then_stmts is None or else_stmts is None:
+            return None
+        node = IfNode(stmt.condition, BlockNode(then_stmts), BlockNode(else_stmts))
+        node.line = stmt.line
+        return result + [node]
+    return result
+
+
+class _Renombrador:
+    """
+    Antepone 'prefijo' a parámetros y locales de una copia del cuerpo y junta las
+    variables libres (globales). Dos declaraciones con el mismo nombre quedan
+    distintas ('x', 'x.1'), así los bloques se pueden aplanar sin que una tape a otra.
+    Sin prefijo una local siempre lleva sufijo ('g.0'): con su nombre original
+    taparía, al aplanar, a una global del mismo nombre leída después del bloque.
+    """
+
+    def __init__(self, prefijo):
+        self.prefijo = prefijo
+        self.libres = set()
+        self.usados = {}
+
+    def renombrar(self, stmts, parameters):
+        self.scopes = [{p.identifier: self._nuevo(p.identifier) for p in parameters}]
+        for stmt in stmts:
+            self._node(stmt)
+
+    def _nuevo(self, name, local=False):
+        veces = self.usados.get(name, 0)
+        self.usados[name] = veces + 1
+        # Un punto no es válido en un identificador: 'g.0' no choca con ninguna global
+        if veces == 0 and (self.prefijo or not local):
+            return f"{self.prefijo}{name}"
+        return f"{self.prefijo}{name}.{veces}"
+
+    def _lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        self.libres.add(name)
+        return name
+
+    def _node(self, node):
+        if isinstance(node, DeclarationNode):
+            if node.expr is not None:
+                self._node(node.expr)
+            self.scopes[-1][node.identifier] = self._nuevo(node.identifier, local=True)
+            node.identifier = self.scopes[-1][node.identifier]
+            return
+        if isinstance(node, (AssignmentNode, VariableNode)):
+            if isinstance(node, AssignmentNode):
+                self._node(node.expr)
+            node.name = self._lookup(node.name)
+            return
+        if isinstance(node, BlockNode):
+            self.scopes.append({})
+        for child in _hijos(node):
+            self._node(child)
+        if isinstance(node, BlockNode):
+            self.scopes.pop()
+
+
+def _retornos_a_asignaciones(stmts, destino):
+    """Cambia cada 'ret e' (ya en posición final) por 'destino = e'"""
+    result = []
+    for stmt in stmts:
+        if isinstance(stmt, ReturnNode):
+            if stmt.expr is not None and destino is not None:
+                asignacion = AssignmentNode(destino, stmt.expr)
+                asignacion.line = stmt.line
+                result.append(asignacion)
+        elif isinstance(stmt, IfNode) and _contiene_ret(stmt):
+            stmt.then_stmt = BlockNode(_retornos_a_asignaciones(_sentencias_de(stmt.then_stmt), destino))
+            stmt.else_stmt = BlockNode(_retornos_a_asignaciones(_sentencias_de(stmt.else_stmt), destino))
+            result.append(stmt)
+        else:
+            result.append(stmt)
+    return result
+
+
+class Inliner:
+    def __init__(self, umbral=None):
+        self.umbral = umbral_por_defecto() if umbral is None else umbral
+
+    def inline(self, program_node):
+        """Expande en sitio; retorna la lista de llamadas expandidas"""
+        self.expanded = []
+        self.counter = 0
+        self.functions = {func.name: func for func in program_node.functions}
+        self.global_names = {decl.identifier for decl in program_node.globals}
+        self._calls = {name: {n.name for n in _nodos(func.block) if isinstance(n, FunctionCallNode)}
+                       for name, func in self.functions.items()}
+        self._writes_globals = self._escriben_globales()
+        self._candidates = {}
+
+        if self.umbral > 0:
+            # De las hojas hacia arriba: cada función ya tiene expandidas sus propias llamadas
+            for name in self._orden_ascendente():
+                self._procesar(name, self.functions[name])
+            self._procesar("Inicio", None, program_node.block)
+
+        if self.expanded and program_node.type is not None:
+            TypeAnnotator().annotate(program_node)  # las sentencias nuevas no tienen tipo
+        return self.expanded
+
+    # ========================
+    # GRAFO DE LLAMADAS
+    # ========================
+
+    def _alcanzables(self, name):
+        vistos, pendientes = set(), list(self._calls.get(name, ()))
+        while pendientes:
+            actual = pendientes.pop()
+            if actual not in vistos and actual in self._calls:
+                vistos.add(actual)
+                pendientes.extend(self._calls[actual])
+        return vistos
+
+    def _orden_ascendente(self):
+        orden, visitados = [], set()
+
+        def visitar(name):
+            visitados.add(name)
+            for llamada in sorted(self._calls[name]):
+                if llamada in self._calls and llamada not in visitados:
+                    visitar(llamada)
+            orden.append(name)
+
+        for name in self.functions:
+            if name not in visitados:
+                visitar(name)
+        return orden
+
+    def _escriben_globales(self):
+        """nombre -> True si la función (o algo que llama) asigna alguna global"""
+        directas = {name: any(isinstance(n, AssignmentNode) and n.name in self.global_names
+                              for n in _nodos(func.block))
+                    for name, func in self.functions.items()}
+        return {name: directas[name] or any(directas[f] for f in self._alcanzables(name))
+                for name in self.functions}
+
+    def _candidato(self, name):
+        """(cuerpo con los ret al final, variables libres) si se puede expandir; si no, None"""
+        if name not in self._candidates:
+            func = self.functions.get(name)
+            self._candidates[name] = None
+            if (func is not None and name not in self._alcanzables(name)
+                    and sum(1 for _ in _nodos(func.block)) <= self.umbral):
+                # Primero nombres únicos y después mover los 'ret' al final de cada camino
+                cuerpo = copy.deepcopy(func.block.statements)
+                renombrador = _Renombrador("")
+                renombrador.renombrar(cuerpo, func.parameters)
+                cuerpo = _en_cola(cuerpo)
+                if cuerpo is not None and (func.return_type == 'void' or _siempre_retorna(cuerpo)):
+                    self._candidates[name] = (cuerpo, renombrador.libres)
+        return self._candidates[name]
+
+    # ========================
+    # SENTENCIAS DEL LLAMADOR
+    # ========================
+
+    def _procesar(self, name, func, block=None):
+        self._caller = name
+        block = block or func.block
+        self._locals = {n.identifier for n in _nodos(block) if isinstance(n, DeclarationNode)}
+        if func is not None:
+            self._locals |= {p.identifier for p in func.parameters}
+        block.statements = self._sentencias(block.statements)
+
+    def _sentencias(self, stmts):
+        result = []
+        for stmt in stmts:
+            result.extend(self._sentencia(stmt))
+        return result
+
+    def _unica(self, stmt):
+        if stmt is None:
+            return None
+        result = self._sentencia(stmt)
+        return result[0] if len(result) == 1 else BlockNode(result)
+
+    def _sentencia(self, stmt):
+        """Lista de sentencias que reemplaza a 'stmt' (las expansiones van primero)"""
+        if isinstance(stmt, BlockNode):
+            stmt.statements = self._sentencias(stmt.statements)
+            return [stmt]
+        if isinstance(stmt, IfNode):
+            stmt.then_stmt = self._unica(stmt.then_stmt)
+            stmt.else_stmt = self._unica(stmt.else_stmt)
+        elif isinstance(stmt, (WhileNode, DoWhileNode, ForNode)):
+            stmt.body = self._unica(stmt.body)
+
+        # Lo que la sentencia evalúa una sola vez y antes que todo lo demás
+        self._preludio, self._efectos, self._leidas = [], False, set()
+        if isinstance(stmt, (DeclarationNode, AssignmentNode, ReturnNode)):
+            stmt.expr = self._extraer(stmt.expr)
+        elif isinstance(stmt, PrintNode):
+            stmt.args = [self._extraer(arg) for arg in stmt.args]
+        elif isinstance(stmt, IfNode):
+            stmt.condition = self._extraer(stmt.condition)
+        elif isinstance(stmt, ForNode) and isinstance(stmt.init, (DeclarationNode, AssignmentNode)):
+            stmt.init.expr = self._extraer(stmt.init.expr)
+        elif isinstance(stmt, FunctionCallNode):
+            if self._extraer(stmt) is not stmt:
+                return self._preludio  # el resultado no se usa
+        return self._preludio + [stmt]
+
+    def _extraer(self, expr, condicional=False):
+        """Retorna 'expr' con las llamadas expandibles reemplazadas por su temporal"""
+        if isinstance(expr, FunctionCallNode):
+            efectos, leidas = self._efectos, set(self._leidas)
+            expr.args = [self._extraer(arg, condicional) for arg in expr.args]
+            # Los argumentos se mueven junto con la llamada: lo evaluado antes no puede
+            # tener efectos ni leer algo que escriban la función o sus argumentos
+            if (not condicional and not efectos and not (leidas & self._escritas(expr))
+                    and self._expandible(expr.name)):
+                return self._expandir(expr)
+            self._efectos = True
+        elif isinstance(expr, AssignmentNode):
+            expr.expr = self._extraer(expr.expr, condicional)
+            self._efectos = True
+        elif isinstance(expr, VariableNode):
+            self._leidas.add(expr.name)
+        elif isinstance(expr, BinaryOpNode):
+            expr.left = self._extraer(expr.left, condicional)
+            expr.right = self._extraer(expr.right, condicional or expr.op in LOGICAL_OPS)
+        elif isinstance(expr, UnaryOpNode):
+            expr.operand = self._extraer(expr.operand, condicional)
+        return expr
+
+    def _escritas(self, call):
+        """Variables que puede escribir 'call' junto con sus argumentos (ya extraídos)"""
+        escritas = set()
+        for node in _nodos(call):
+            if isinstance(node, AssignmentNode):
+                escritas.add(node.name)
+            elif isinstance(node, FunctionCallNode) and self._writes_globals.get(node.name, True):
+                escritas |= self.global_names
+        return escritas
+
+    def _expandible(self, name):
+        candidato = self._candidato(name)
+        return candidato is not None and not (candidato[1] & self._locals)
+
+    def _expandir(self, call):
+        """Agrega al preludio la copia del cuerpo; retorna la lectura del resultado (None si es void)"""
+        func = self.functions[call.name]
+        self.counter += 1
+        prefijo = f"{func.name}.{self.counter}."
+        cuerpo = copy.deepcopy(self._candidato(call.name)[0])
+        _Renombrador(prefijo).renombrar(cuerpo, func.parameters)
+
+        resultado = None if func.return_type == 'void' else f"{prefijo}ret"
+        parametros = [DeclarationNode(param.var_type, f"{prefijo}{param.identifier}", arg)
+                      for param, arg in zip(func.parameters, call.args)]
+        nuevas = [BlockNode(parametros + _retornos_a_asignaciones(cuerpo, resultado))]
+        if resultado is not None:
+            nuevas.insert(0, DeclarationNode(func.return_type, resultado, None))
+        for node in nuevas + parametros:
+            node.line = call.line
+        self._preludio.extend(nuevas)
+        self.expanded.append(f"[Línea {call.line}] Llamada a '{func.name}' expandida en '{self._caller}'")
+
+        if resultado is None:
+            return None
+        lectura = VariableNode(resultado)
+        lectura.line = call.line
+        return lectura
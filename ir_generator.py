@@ -1,8 +1,15 @@
 #ARCHIVO GENERADOR DE IR EN BASE A NUESTRO AST
+import hashlib
+
 from llvmlite import ir
-import llvmlite.binding as llvm
 from ast_builder import *
+from const_eval import valor_constante
+from function_attrs import inferir_atributos
+from global_analysis import globales_constantes
 from llvmlite.ir._utils import DuplicatedNameError 
+from symbol_table import SymbolTable
+from target_config import TargetConfig, configuracion_por_defecto
+from type_annotator import TypeAnnotator, ARITHMETIC_OPS, COMPARISON_OPS, LOGICAL_OPS
 
 
 from ast_builder import (
@@ -29,21 +36,48 @@ from ast_builder import (
     ASTBuilder
 )
 
+PGO_HOT_FRACTION = 0.05    # >= 5% de las entradas de la función más llamada: caliente
+PGO_COLD_FRACTION = 0.001  # <= 0.1%: fría
+WINDOWS_TRIPLE = "x86_64-pc-windows-gnu"
+
+
+def _constant_name(prefix, text):
+    """
+    Nombre de una constante de texto según su contenido: el mismo en cada proceso
+    (hash() de Python cambia entre ejecuciones) y en cada módulo que la use.
+    """
+    return prefix + hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
 class LLVMGenerator:
-    def __init__(self, for_windows_exe=False):
-        # Inicializar LLVM
-        llvm.initialize()
-        llvm.initialize_native_target()
-        llvm.initialize_native_asmprinter()
+    def __init__(self, for_windows_exe=False, profile_path=None, pgo_profile=None, target=None):
         self.for_windows_exe = for_windows_exe  # Bandera para EXE
+        # Destino (target_config.TargetConfig): triple, CPU, features y data layout del módulo
+        if target is None:
+            target = TargetConfig(WINDOWS_TRIPLE) if for_windows_exe else configuracion_por_defecto()
+        self.target = target
+        self.profile_path = profile_path  # Si se indica: contadores de perfil volcados ahí al salir
+        self.profile_counters = []  # [(global i64, (tipo, función, línea, sitio, contador))]
+        self.profile_sites = {}  # (función, tipo, línea) -> último ordinal de sitio usado
+        # PGO: {(tipo, función, línea, sitio): Sitio} leído de una corrida instrumentada
+        # (profile_report.leer_perfil); se traduce a pesos de ramas y conteos de entrada
+        self.pgo_profile = pgo_profile
+        self.pgo_entries = 0  # entradas de la función actual según el perfil
+        if pgo_profile:
+            entries = [site.counters.get('entradas', 0) for site in pgo_profile.values() if site.kind == 'funcion']
+            self.pgo_max_entries = max(entries, default=0)
         
         # Crear módulo para almacenar
         self.module = ir.Module(name="mi_programa")
-        self.module.triple = "x86_64-pc-linux-gnu" #para linux 64bits
+        self.target.aplicar(self.module)
         self.builder = None
-        self.symbol_tables = [{}]  # Pila de tablas de símbolos
+        self.symbols = SymbolTable()  # Tabla de símbolos con ámbitos
         self.functions = {}
+        self.signatures = {}  # nombre -> FunctionNode (tipos de parámetros y retorno)
         self.current_function = None
+        self.current_return_type = None
+        self.pending_globals = []  # globales cuyo valor inicial se calcula al ejecutar
+        self.global_initializer = None  # __inicializar_globales, si hace falta
         
         # Configurar tipos
         self.llvm_types = {
@@ -70,41 +104,165 @@ class LLVMGenerator:
         # Declarar getchar para la pausa final (AGREGADO)
         getchar_type = ir.FunctionType(ir.IntType(32), [])
         ir.Function(self.module, getchar_type, name="getchar")
+
+        if self.profile_path:
+            self._setup_profile_runtime()
     
     def generate(self, ast_node):
         """Genera código LLVM a partir del AST"""
         if isinstance(ast_node, ProgramNode):
+            if ast_node.type is None:
+                TypeAnnotator().annotate(ast_node)
             self._generate_program(ast_node)
+            if self.profile_path:
+                self._generate_profile_dump()
         return self.module
     
     def _generate_program(self, program_node):
-        # 1. Procesar declaraciones globales
-        for decl in program_node.globals:
-            self._generate_declaration(decl, is_global=True)
+        # 1. Procesar declaraciones globales. Es el programa completo: nada fuera del
+        # módulo lee o asigna estas variables ni llama a estas funciones
+        for global_var in self._generate_globals(program_node.globals, program_node):
+            global_var.linkage = 'internal'
         
-        # 2. Procesar funciones
+        # 2. Declarar firmas (permite llamadas antes de la definición)
+        atributos = inferir_atributos(program_node)
+        for func in program_node.functions:
+            function = self.declare_function(func)
+            function.linkage = 'internal'
+            self._add_attributes(function, atributos[func.name])
+        self._generate_global_initializer()
+
+        # 3. Procesar funciones
         for func in program_node.functions:
             self._generate_function(func)
         
-        # 3. Generar función main
+        # 4. Generar función main
         self._generate_main_function(program_node.block)
+
+    def declare_function(self, func_node, symbol=None):
+        """Declara la firma de una función sin generar su cuerpo.
+        'symbol' permite usar en el módulo un nombre distinto al del código fuente."""
+        if func_node.name in self.functions:
+            return self.functions[func_node.name]
+        return_type = self.llvm_types[func_node.return_type]
+        param_types = [self.llvm_types[p.var_type] for p in func_node.parameters]
+        func_type = ir.FunctionType(return_type, param_types)
+        function = ir.Function(self.module, func_type, name=symbol or func_node.name)
+        self.functions[func_node.name] = function
+        self.signatures[func_node.name] = func_node
+        return function
+
+    def _add_attributes(self, function, attributes):
+        """Atributos inferidos por function_attrs.py"""
+        if self.profile_path:
+            # Los contadores de perfil escriben globales en cada función
+            attributes = attributes - {'readnone', 'readonly'}
+        for attribute in sorted(attributes):
+            if attribute == 'willreturn':
+                # llvmlite no lo tiene en su lista, pero LLVM 14 lo acepta
+                set.add(function.attributes, attribute)
+            else:
+                function.attributes.add(attribute)
+
+    def _generate_globals(self, declarations, program_node=None):
+        """
+        Define las globales en orden de declaración. El valor inicial queda en el
+        módulo si se conoce al compilar (const_eval.valor_constante); si no, la
+        global arranca en cero y su inicializador va a __inicializar_globales.
+        Con el programa completo ('program_node'), las que nunca se asignan
+        (global_analysis.py) y tienen valor conocido se marcan constantes, y ese
+        valor sirve para calcular los inicializadores siguientes.
+        """
+        constants = globales_constantes(program_node) if program_node else set()
+        known = {}  # nombre -> [tipo, valor] de las globales constantes
+        global_vars = []
+        for decl in declarations:
+            initializer = self._static_initializer(decl, program_node, known)
+            global_var = self._define_global(decl, initializer)
+            if initializer is not None and decl.identifier in constants:
+                global_var.global_constant = True
+                if decl.type != 'cadena':
+                    python_type = {'entero': int, 'decimal': float, 'bool': bool}[decl.type]
+                    known[decl.identifier] = [decl.type, python_type(initializer.constant or 0)]
+            global_vars.append(global_var)
+        return global_vars
+
+    def _define_global(self, decl_node, initializer=None, symbol=None):
+        """Define una global; sin valor inicial arranca en cero y queda pendiente para __inicializar_globales"""
+        llvm_type = self.llvm_types[decl_node.type]
+        global_var = ir.GlobalVariable(self.module, llvm_type, symbol or decl_node.identifier)
+        if initializer is None:
+            initializer = ir.Constant(llvm_type, None)
+            self.pending_globals.append(decl_node)
+        global_var.initializer = initializer
+        self.symbols.declare(decl_node.identifier, global_var)
+        return global_var
+
+    def _static_initializer(self, decl_node, program_node=None, known=None):
+        """Valor inicial de una global como constante de LLVM, o None si hay que calcularlo al ejecutar"""
+        llvm_type = self.llvm_types[decl_node.type]
+        if decl_node.expr is None:
+            return ir.Constant(llvm_type, None)
+        if isinstance(decl_node.expr, StringNode):
+            return self._create_string_constant(decl_node.expr.value)
+        value = valor_constante(decl_node.expr, decl_node.type, program_node, known)
+        if value is None:
+            return None
+        return ir.Constant(llvm_type, int(value) if isinstance(value, bool) else value)
+
+    def _generate_global_initializer(self):
+        """
+        __inicializar_globales: calcula en orden de declaración los valores iniciales
+        que no se conocen al compilar (llamadas, globales asignables). main la llama
+        antes que nada; debe generarse con las funciones ya declaradas.
+        """
+        if not self.pending_globals:
+            return None
+        function = ir.Function(self.module, ir.FunctionType(ir.VoidType(), []), name="__inicializar_globales")
+        function.linkage = 'internal'
+        function.attributes.add('nounwind')
+
+        old_builder = self.builder
+        self.builder = ir.IRBuilder(function.append_basic_block(name="entry"))
+        self.current_function = function
+        for decl in self.pending_globals:
+            self.builder.store(self._generate_typed(decl.expr, decl.type), self._lookup_variable(decl.identifier))
+        self.builder.ret_void()
+
+        self.builder = old_builder
+        self.current_function = None
+        self.global_initializer = function
+        return function
+
+    def declare_global(self, decl_node, symbol=None):
+        """Declara una global definida en otro módulo (enlace externo)"""
+        llvm_type = self.llvm_types.get(decl_node.var_type, ir.IntType(32))
+        global_var = ir.GlobalVariable(self.module, llvm_type, symbol or decl_node.identifier)
+        self.symbols.declare(decl_node.identifier, global_var)
+        return global_var
     
-    def _generate_main_function(self, block_node):
+    def _generate_main_function(self, block_node, name="main"):
         """Genera la función main que encapsula el programa"""
         func_type = ir.FunctionType(ir.IntType(32), [])
-        function = ir.Function(self.module, func_type, name="main")
+        function = ir.Function(self.module, func_type, name=name)
+        function.attributes.add('nounwind')
         entry_block = function.append_basic_block(name="entry")
         
         # Configurar builder y contexto
         old_builder = self.builder
         self.builder = ir.IRBuilder(entry_block)
         self.current_function = function
+        self.pgo_entries = 1
+        if self.global_initializer is not None:
+            self.builder.call(self.global_initializer, [])
         
         # Generar código del bloque principal
         self._generate_block(block_node)
         
         # Asegurar retorno (con pausa condicional)
         if not self.builder.block.terminator:
+            if self.profile_path:
+                self.builder.call(self.profile_dump, [])
             if self.for_windows_exe:  # Solo para compilación a EXE
                 getchar_func = self.module.get_global("getchar")
                 self.builder.call(getchar_func, [])
@@ -116,14 +274,8 @@ class LLVMGenerator:
     
     def _generate_function(self, func_node):
         """Genera código para una función definida por el usuario"""
-        # Determinar tipos
-        return_type = self.llvm_types[func_node.return_type]
-        param_types = [self.llvm_types[p.var_type] for p in func_node.parameters]
-        
-        # Crear función
-        func_type = ir.FunctionType(return_type, param_types)
-        function = ir.Function(self.module, func_type, name=func_node.name)
-        self.functions[func_node.name] = function
+        # Crear función (o reutilizar la firma ya declarada)
+        function = self.declare_function(func_node)
         
         # Crear bloques
         entry_block = function.append_basic_block(name="entry")
@@ -135,14 +287,20 @@ class LLVMGenerator:
         # Configurar nuevo contexto
         self.builder = ir.IRBuilder(entry_block)
         self.current_function = function
-        self.symbol_tables.append({})
+        self.current_return_type = func_node.return_type
+        self.symbols.enter_scope()
+        site = self._profile_site('funcion', func_node.line)
+        if self.profile_path:
+            self._profile_add(self._profile_counter(site, 'entradas'))
+        if self.pgo_profile:
+            self._pgo_function(function, site)
         
         # Asignar parámetros
         for i, arg in enumerate(function.args):
             arg_name = func_node.parameters[i].identifier
-            alloca = self.builder.alloca(arg.type, name=arg_name)
+            alloca = self._alloca(arg.type, arg_name)
             self.builder.store(arg, alloca)
-            self.symbol_tables[-1][arg_name] = alloca
+            self.symbols.declare(arg_name, alloca)
         
         # Generar cuerpo
         self._generate_block(func_node.block)
@@ -157,12 +315,15 @@ class LLVMGenerator:
         # Restaurar contexto
         self.builder = old_builder
         self.current_function = old_function
-        self.symbol_tables.pop()
+        self.current_return_type = None
+        self.symbols.exit_scope()
     
     def _generate_block(self, block_node):
         """Genera código para un bloque de sentencias"""
+        self.symbols.enter_scope()
         for stmt in block_node.statements:
             self._generate_statement(stmt)
+        self.symbols.exit_scope()
     
     def _generate_statement(self, stmt_node):
         """Distribuye la generación según el tipo de sentencia"""
@@ -187,58 +348,73 @@ class LLVMGenerator:
         elif isinstance(stmt_node, BlockNode):
             self._generate_block(stmt_node)
     
-    def _generate_declaration(self, decl_node, is_global=False):
+    def _generate_declaration(self, decl_node, is_global=False, symbol=None):
         var_name = decl_node.identifier
-        var_type = decl_node.var_type
-
-        # Genera la expresión (para obtener valor y tipo real)
-        expr_value = self._generate_expression(decl_node.expr)
-
-        # Inferir tipo si es necesario
-        if var_type in ("inferido", "auto"):
-            llvm_type = expr_value.type  # Usa directamente el tipo LLVM inferido
-        else:
-            llvm_type = self.llvm_types.get(var_type, ir.IntType(32))
-
-            # Asegurar compatibilidad de tipos (casting simple si es necesario)
-            expr_value = self._cast_value(expr_value, llvm_type)
+        llvm_type = self.llvm_types[decl_node.type]
 
         if is_global:
-            global_var = ir.GlobalVariable(self.module, llvm_type, var_name)
-            global_var.initializer = expr_value
-            self.symbol_tables[0][var_name] = global_var
-        else:
-            alloca = self.builder.alloca(llvm_type, name=var_name)
-            self.symbol_tables[-1][var_name] = alloca
-            self.builder.store(expr_value, alloca)
+            return self._define_global(decl_node, self._static_initializer(decl_node), symbol)
 
-            
-    def _cast_value(self, value, target_type):
-        if value.type == target_type:
+        # Sin inicializador la variable arranca en cero
+        if decl_node.expr is None:
+            expr_value = ir.Constant(llvm_type, None)
+        else:
+            expr_value = self._generate_typed(decl_node.expr, decl_node.type)
+        alloca = self._alloca(llvm_type, var_name)
+        self.symbols.declare(var_name, alloca)
+        self.builder.store(expr_value, alloca)
+
+    def _alloca(self, llvm_type, name):
+        """
+        Reserva una variable al inicio del bloque de entrada de la función actual:
+        las locales declaradas en un bucle (o traídas por inliner.py) no hacen
+        crecer la pila en cada iteración y mem2reg puede promoverlas a registros.
+        """
+        # El builder siempre agrega al final del bloque actual: se vuelve ahí después
+        current_block = self.builder.block
+        self.builder.position_at_start(self.current_function.entry_basic_block)
+        alloca = self.builder.alloca(llvm_type, name=name)
+        self.builder.position_at_end(current_block)
+        return alloca
+
+    def _generate_typed(self, expr_node, target_type):
+        """Genera una expresión y la convierte al tipo pedido según su anotación"""
+        value = self._generate_expression(expr_node)
+        return self._convert(value, expr_node.type, target_type)
+
+    def _convert(self, value, source_type, target_type):
+        """Conversión entre tipos del lenguaje ('entero', 'decimal', 'bool')"""
+        if source_type == target_type:
             return value
 
-        if isinstance(value.type, ir.IntType) and isinstance(target_type, ir.DoubleType):
-            return self.builder.sitofp(value, target_type)
-
-        if isinstance(value.type, ir.DoubleType) and isinstance(target_type, ir.IntType):
-            return self.builder.fptosi(value, target_type)
-
-        if isinstance(value.type, ir.IntType) and isinstance(target_type, ir.PointerType):
-            raise TypeError("Cannot cast integer to pointer directly.")
-
-        if isinstance(value.type, ir.PointerType) and isinstance(target_type, ir.PointerType):
-            return self.builder.bitcast(value, target_type)
-
-        raise TypeError(f"No suitable cast from {value.type} to {target_type}")
-
-
+        # Las constantes se convierten en tiempo de compilación (válido también para globales)
+        if isinstance(value, ir.Constant) and isinstance(value.constant, (int, float)):
+            python_value = {'entero': int, 'decimal': float, 'bool': lambda v: int(bool(v))}[target_type](value.constant)
+            return ir.Constant(self.llvm_types[target_type], python_value)
+
+        if target_type == 'decimal':
+            if source_type == 'bool':
+                return self.builder.uitofp(value, self.llvm_types['decimal'])
+            return self.builder.sitofp(value, self.llvm_types['decimal'])
+        if target_type == 'entero':
+            if source_type == 'bool':
+                return self.builder.zext(value, self.llvm_types['entero'])
+            if source_type == 'decimal':
+                return self.builder.fptosi(value, self.llvm_types['entero'])
+        if target_type == 'bool':
+            if source_type == 'decimal':
+                return self.builder.fcmp_ordered('!=', value, ir.Constant(value.type, 0.0))
+            if source_type == 'entero':
+                return self.builder.icmp_signed('!=', value, ir.Constant(value.type, 0))
+
+        raise TypeError(f"No hay conversión de '{source_type}' a '{target_type}'")
     
     def _generate_assignment(self, assign_node):
         """Genera código para asignación de variables"""
-        var_name = assign_node.name
-        ptr = self._lookup_variable(var_name)
-        value = self._generate_expression(assign_node.expr)
+        ptr = self._lookup_variable(assign_node.name)
+        value = self._generate_typed(assign_node.expr, assign_node.type)
         self.builder.store(value, ptr)
+        return value
     
     def _generate_print(self, print_node):
         """Genera código para la función pintar()"""
@@ -248,25 +424,23 @@ class LLVMGenerator:
 
         for arg in print_node.args:
             value = self._generate_expression(arg)
-            llvm_type = value.type
 
-            if isinstance(llvm_type, ir.PointerType) and llvm_type.pointee == ir.IntType(8):
+            if arg.type == 'cadena':
                 format_parts.append("%s")
-            elif isinstance(llvm_type, ir.DoubleType):
+            elif arg.type == 'decimal':
                 format_parts.append("%f")
-            elif isinstance(llvm_type, ir.IntType):
+            elif arg.type == 'entero':
                 format_parts.append("%d")
-                if llvm_type.width == 1:
-                    value = self.builder.zext(value, ir.IntType(32))
-                elif llvm_type.width != 32:
-                    value = self.builder.sext(value, ir.IntType(32))
+            elif arg.type == 'bool':
+                format_parts.append("%d")
+                value = self.builder.zext(value, self.llvm_types['entero'])
             else:
-                raise RuntimeError(f"Tipo no soportado para imprimir: {llvm_type}")
+                raise RuntimeError(f"Tipo no soportado para imprimir: {arg.type}")
 
             values.append(value)
 
         format_str = " ".join(format_parts) + "\n\0"
-        fmt_name = ".fmt." + str(hash(format_str))
+        fmt_name = _constant_name(".fmt.", format_str)
         fmt_type = ir.ArrayType(ir.IntType(8), len(format_str))
 
         if fmt_name in self.module.globals:
@@ -286,19 +460,23 @@ class LLVMGenerator:
     
     def _generate_if(self, if_node):
         """Genera código para la estructura if-else"""
-        cond = self._generate_expression(if_node.condition)
+        bool_cond = self._generate_typed(if_node.condition, 'bool')
+        site = self._profile_site('si', if_node.line)
+        if self.profile_path:
+            self._profile_branch(site, bool_cond)
 
         then_block = self.current_function.append_basic_block("if.then")
         else_block = self.current_function.append_basic_block("if.else") if if_node.else_stmt else None
         merge_block = self.current_function.append_basic_block("if.merge")
 
-        bool_cond = self._convert_to_bool(cond)
-
         # Redirige a then o else (o merge si no hay else)
         if else_block:
-            self.builder.cbranch(bool_cond, then_block, else_block)
+            branch = self.builder.cbranch(bool_cond, then_block, else_block)
         else:
-            self.builder.cbranch(bool_cond, then_block, merge_block)
+            branch = self.builder.cbranch(bool_cond, then_block, merge_block)
+        if self.pgo_profile:
+            counts = self._pgo_counts(site)
+            self._set_branch_weights(branch, counts.get('verdadero', 0), counts.get('falso', 0))
 
         # THEN
         self.builder.position_at_end(then_block)
@@ -339,14 +517,18 @@ class LLVMGenerator:
         
         # Generar test
         self.builder.position_at_end(test_block)
-        cond = self._generate_expression(while_node.condition)
-        bool_cond = self._convert_to_bool(cond)
-        self.builder.cbranch(bool_cond, body_block, end_block)
+        bool_cond = self._generate_typed(while_node.condition, 'bool')
+        site = self._profile_site('mientras', while_node.line)
+        branch = self.builder.cbranch(bool_cond, body_block, end_block)
+        if self.pgo_profile:
+            self._set_loop_weights(branch, site)
         
         # Generar cuerpo
         self.builder.position_at_end(body_block)
         self._generate_statement(while_node.body)
         if not self.builder.block.terminator:
+            if self.profile_path:
+                self._profile_add(self._profile_counter(site, 'iteraciones'))
             self.builder.branch(test_block)
         
         # Continuar con el end block
@@ -370,9 +552,14 @@ class LLVMGenerator:
         
         # Generar test
         self.builder.position_at_end(test_block)
-        cond = self._generate_expression(do_while_node.condition)
-        bool_cond = self._convert_to_bool(cond)
-        self.builder.cbranch(bool_cond, body_block, end_block)
+        bool_cond = self._generate_typed(do_while_node.condition, 'bool')
+        site = self._profile_site('hacer', do_while_node.line)
+        if self.profile_path:
+            counter = self._profile_counter(site, 'iteraciones')
+            self._profile_add(counter, self.builder.zext(bool_cond, ir.IntType(64)))
+        branch = self.builder.cbranch(bool_cond, body_block, end_block)
+        if self.pgo_profile:
+            self._set_loop_weights(branch, site)
         
         # Continuar con el end block
         self.builder.position_at_end(end_block)
@@ -398,10 +585,12 @@ class LLVMGenerator:
         
         # Generar el bloque de test: evaluar la condición (si existe)
         self.builder.position_at_end(test_block)
+        site = self._profile_site('para', for_node.line)
         if for_node.condition:
-            cond = self._generate_expression(for_node.condition)
-            bool_cond = self._convert_to_bool(cond)
-            self.builder.cbranch(bool_cond, body_block, end_block)
+            bool_cond = self._generate_typed(for_node.condition, 'bool')
+            branch = self.builder.cbranch(bool_cond, body_block, end_block)
+            if self.pgo_profile:
+                self._set_loop_weights(branch, site)
         else:
             # Si no hay condición, se asume que es verdadera y se salta al cuerpo
             self.builder.branch(body_block)
@@ -417,6 +606,8 @@ class LLVMGenerator:
         self.builder.position_at_end(update_block)
         if for_node.update:
             self._generate_statement(for_node.update)
+        if self.profile_path:
+            self._profile_add(self._profile_counter(site, 'iteraciones'))
         # Después de la actualización, volver al bloque de test para re-evaluar la condición
         self.builder.branch(test_block)
         
@@ -428,7 +619,7 @@ class LLVMGenerator:
     def _generate_return(self, return_node):
         """Genera código para la sentencia return"""
         if return_node.expr:
-            value = self._generate_expression(return_node.expr)
+            value = self._generate_typed(return_node.expr, self.current_return_type or return_node.expr.type)
             self.builder.ret(value)
         else:
             self.builder.ret_void()
@@ -439,8 +630,9 @@ class LLVMGenerator:
         if not func:
             raise RuntimeError(f"Función '{call_node.name}' no definida")
         
-        # Procesar los argumentos: si se presentan listas anidadas, aplanarlas
-        args = [self._generate_expression(arg) for arg in call_node.args]
+        # Convertir cada argumento al tipo declarado del parámetro
+        params = self.signatures[call_node.name].parameters
+        args = [self._generate_typed(arg, param.var_type) for arg, param in zip(call_node.args, params)]
         return self.builder.call(func, args)
 
     
@@ -464,32 +656,28 @@ class LLVMGenerator:
             return self._generate_unary_op(expr_node)
         elif isinstance(expr_node, FunctionCallNode):
             return self._generate_function_call(expr_node)
-        elif isinstance(expr_node, AssignmentNode):  # <- Agrega este bloque
-            ptr = self._lookup_variable(expr_node.name)
-            value = self._generate_expression(expr_node.expr)
-            self.builder.store(value, ptr)
-            return value
+        elif isinstance(expr_node, AssignmentNode):
+            return self._generate_assignment(expr_node)
         else:
             raise RuntimeError(f"Tipo de expresión no soportado: {type(expr_node)}")
 
     def _generate_binary_op(self, bin_node):
-        left = self._generate_expression(bin_node.left)
-        right = self._generate_expression(bin_node.right)
-        
-        # Convertir tipos si es necesario
-        left, right = self._match_types(left, right)
+        # Ambos operandos se llevan al tipo anotado de la operación
+        operand_type = bin_node.operand_type
+        left = self._generate_typed(bin_node.left, operand_type)
+        right = self._generate_typed(bin_node.right, operand_type)
         
         op = bin_node.op
         # Detectar concatenación de cadenas:
-        if op == '+' and left.type == self.llvm_types['cadena'] and right.type == self.llvm_types['cadena']:
+        if operand_type == 'cadena' and op == '+':
             concat_func = self._get_concat_function()
             return self.builder.call(concat_func, [left, right])
 
-        elif op in ('+', '-', '*', '/','%'):
-            return self._generate_arithmetic_op(op, left, right)
-        elif op in ('<', '>', '<=', '>=', '==', '!='):
-            return self._generate_comparison_op(op, left, right)
-        elif op in ('&&', '||'):
+        elif op in ARITHMETIC_OPS:
+            return self._generate_arithmetic_op(op, left, right, operand_type)
+        elif op in COMPARISON_OPS:
+            return self._generate_comparison_op(op, left, right, operand_type)
+        elif op in LOGICAL_OPS:
             return self._generate_logical_op(op, left, right)
         elif op == '^':
             return self._generate_power_op(left, right)
@@ -508,14 +696,14 @@ class LLVMGenerator:
         return concat_func
 
     
-    def _generate_arithmetic_op(self, op, left, right):
+    def _generate_arithmetic_op(self, op, left, right, operand_type):
             if op == '%':
-                if isinstance(left.type, ir.IntType):
+                if operand_type != 'decimal':
                     return self.builder.srem(left, right)
                 else:
                     fmod_func = self._get_fmod_function()
                     return self.builder.call(fmod_func, [left, right])
-            if isinstance(left.type, ir.IntType):
+            if operand_type != 'decimal':
                 if op == '+': return self.builder.add(left, right)
                 if op == '-': return self.builder.sub(left, right)
                 if op == '*': return self.builder.mul(left, right)
@@ -527,42 +715,20 @@ class LLVMGenerator:
                 if op == '/': return self.builder.fdiv(left, right)
 
 
-    def _generate_comparison_op(self, op, left, right):
+    def _generate_comparison_op(self, op, left, right, operand_type):
         """Genera código para operaciones de comparación"""
-        if isinstance(left.type, ir.IntType):
-            if op == '<': return self.builder.icmp_signed('<', left, right)
-            if op == '>': return self.builder.icmp_signed('>', left, right)
-            if op == '<=': return self.builder.icmp_signed('<=', left, right)
-            if op == '>=': return self.builder.icmp_signed('>=', left, right)
-            if op == '==': return self.builder.icmp_signed('==', left, right)
-            if op == '!=': return self.builder.icmp_signed('!=', left, right)
-        else:
-            if op == '<': return self.builder.fcmp_ordered('<', left, right)
-            if op == '>': return self.builder.fcmp_ordered('>', left, right)
-            if op == '<=': return self.builder.fcmp_ordered('<=', left, right)
-            if op == '>=': return self.builder.fcmp_ordered('>=', left, right)
-            if op == '==': return self.builder.fcmp_ordered('==', left, right)
-            if op == '!=': return self.builder.fcmp_ordered('!=', left, right)
+        if operand_type != 'decimal':
+            return self.builder.icmp_signed(op, left, right)
+        return self.builder.fcmp_ordered(op, left, right)
     
     def _generate_logical_op(self, op, left, right):
-        """Genera código para operaciones lógicas"""
-        left = self._convert_to_bool(left)
-        right = self._convert_to_bool(right)
-        
+        """Genera código para operaciones lógicas (operandos ya convertidos a bool)"""
         if op == '&&': return self.builder.and_(left, right)
         if op == '||': return self.builder.or_(left, right)
     
     def _generate_power_op(self, left, right):
-        # Asegurarse que ambos operandos sean double
-        if isinstance(left.type, ir.IntType):
-            left = self.builder.sitofp(left, ir.DoubleType())
-        if isinstance(right.type, ir.IntType):
-            right = self.builder.sitofp(right, ir.DoubleType())
-
-        # Obtener o declarar función pow()
+        # Ambos operandos llegan convertidos a decimal
         pow_func = self._get_pow_function()
-
-        # Generar llamada a pow y retornar
         return self.builder.call(pow_func, [left, right])
 
     
@@ -578,30 +744,143 @@ class LLVMGenerator:
     
     def _generate_unary_op(self, unary_node):
         """Genera código para operaciones unarias"""
-        operand = self._generate_expression(unary_node.operand)
         op = unary_node.op
-        
+        if op == '!':
+            return self.builder.not_(self._generate_typed(unary_node.operand, 'bool'))
+
+        operand = self._generate_expression(unary_node.operand)
         if op == '-':
-            if isinstance(operand.type, ir.IntType):
-                return self.builder.neg(operand)
-            else:
+            if unary_node.type == 'decimal':
                 return self.builder.fneg(operand)
-        elif op == '!':
-            return self.builder.not_(self._convert_to_bool(operand))
+            return self.builder.neg(operand)
         elif op == '+':
             return operand
         else:
             raise RuntimeError(f"Operador unario no soportado: {op}")
     
+    # ========================
+    # PERFILADO (CONTADORES DE EJECUCION)
+    # ========================
+
+    def _setup_profile_runtime(self):
+        """Declara fopen/fprintf/fclose y la función que vuelca los contadores"""
+        i8_ptr = ir.PointerType(ir.IntType(8))
+        ir.Function(self.module, ir.FunctionType(i8_ptr, [i8_ptr, i8_ptr]), name="fopen")
+        ir.Function(self.module, ir.FunctionType(ir.IntType(32), [i8_ptr, i8_ptr], var_arg=True), name="fprintf")
+        ir.Function(self.module, ir.FunctionType(ir.IntType(32), [i8_ptr]), name="fclose")
+        # El cuerpo se genera al final, cuando ya se conocen todos los contadores
+        self.profile_dump = ir.Function(self.module, ir.FunctionType(ir.VoidType(), []), name="__perfil_volcar")
+        self.profile_dump.linkage = 'internal'
+
+    def _profile_site(self, kind, line):
+        """
+        Clave (tipo, función, línea, sitio) de un punto del programa, o None si no se
+        instrumenta ni se aplica PGO. 'sitio' numera las construcciones del mismo tipo
+        en una misma línea; la numeración es igual al instrumentar y al aplicar el perfil.
+        """
+        if not (self.profile_path or self.pgo_profile):
+            return None
+        function = self.current_function.name
+        site = self.profile_sites.get((function, kind, line), -1) + 1
+        self.profile_sites[(function, kind, line)] = site
+        return (kind, function, line, site)
+
+    def _profile_counter(self, site, counter):
+        """Crea un contador i64 para un sitio y retorna su global"""
+        global_var = ir.GlobalVariable(self.module, ir.IntType(64), name=f"__perfil.{len(self.profile_counters)}")
+        global_var.linkage = 'internal'
+        global_var.initializer = ir.Constant(ir.IntType(64), 0)
+        self.profile_counters.append((global_var, site + (counter,)))
+        return global_var
+
+    def _profile_add(self, counter, amount=None):
+        amount = amount if amount is not None else ir.Constant(ir.IntType(64), 1)
+        value = self.builder.load(counter)
+        self.builder.store(self.builder.add(value, amount), counter)
+
+    def _profile_branch(self, site, bool_cond):
+        """Cuenta cuántas veces la condición fue verdadera y cuántas falsa (sin bloques extra)"""
+        taken = self._profile_counter(site, 'verdadero')
+        not_taken = self._profile_counter(site, 'falso')
+        self._profile_add(taken, self.builder.zext(bool_cond, ir.IntType(64)))
+        self._profile_add(not_taken, self.builder.zext(self.builder.not_(bool_cond), ir.IntType(64)))
+
+    def _generate_profile_dump(self):
+        """
+        Cuerpo de __perfil_volcar: escribe una línea por contador en profile_path,
+        'tipo<TAB>función<TAB>línea<TAB>sitio<TAB>contador<TAB>valor' (ver profile_report.py).
+        El archivo se abre con "w": cada corrida reemplaza el perfil de la anterior.
+        """
+        old_builder = self.builder
+        self.builder = ir.IRBuilder(self.profile_dump.append_basic_block("entry"))
+        fopen, fprintf, fclose = (self.module.get_global(n) for n in ("fopen", "fprintf", "fclose"))
+
+        handle = self.builder.call(fopen, [self._create_string_constant(self.profile_path),
+                                           self._create_string_constant("w")])
+        write_block = self.profile_dump.append_basic_block("escribir")
+        end_block = self.profile_dump.append_basic_block("fin")
+        is_null = self.builder.icmp_unsigned('==', handle, ir.Constant(handle.type, None))
+        self.builder.cbranch(is_null, end_block, write_block)
+
+        self.builder.position_at_end(write_block)
+        self.builder.call(fprintf, [handle, self._create_string_constant(f"# perfil de {self.module.name}\n")])
+        for global_var, (kind, function, line, site, counter) in self.profile_counters:
+            fmt = self._create_string_constant(f"{kind}\t{function}\t{line}\t{site}\t{counter}\t%lld\n")
+            self.builder.call(fprintf, [handle, fmt, self.builder.load(global_var)])
+        self.builder.call(fclose, [handle])
+        self.builder.branch(end_block)
+
+        self.builder.position_at_end(end_block)
+        self.builder.ret_void()
+        self.builder = old_builder
+
+    # ========================
+    # PGO (OPTIMIZACION GUIADA POR PERFIL)
+    # ========================
+
+    def _pgo_counts(self, site):
+        entry = self.pgo_profile.get(site)
+        return entry.counters if entry else {}
+
+    def _pgo_function(self, function, site):
+        """Conteo de entradas de la función; las calientes se sugieren para inline y las frías se optimizan por tamaño"""
+        self.pgo_entries = self._pgo_counts(site).get('entradas', 0)
+        function.set_metadata('prof', self.module.add_metadata([
+            ir.MetaDataString(self.module, 'function_entry_count'),
+            ir.Constant(ir.IntType(64), self.pgo_entries),
+        ]))
+        if self.pgo_max_entries and self.pgo_entries >= self.pgo_max_entries * PGO_HOT_FRACTION:
+            function.attributes.add('inlinehint')
+        elif self.pgo_entries <= self.pgo_max_entries * PGO_COLD_FRACTION:
+            function.attributes.add('cold')
+            function.attributes.add('optsize')
+
+    def _set_branch_weights(self, branch, taken, not_taken):
+        if taken + not_taken == 0:
+            return  # sin datos: el optimizador usa sus heurísticas
+        branch.set_metadata('prof', self.module.add_metadata([
+            ir.MetaDataString(self.module, 'branch_weights'),
+            ir.Constant(ir.IntType(32), min(taken, 2**31 - 1)),
+            ir.Constant(ir.IntType(32), min(not_taken, 2**31 - 1)),
+        ]))
+
+    def _set_loop_weights(self, branch, site):
+        # El perfil guarda solo las vueltas: las salidas se aproximan con las
+        # entradas a la función que contiene el bucle
+        iterations = self._pgo_counts(site).get('iteraciones', 0)
+        if iterations:
+            self._set_branch_weights(branch, iterations, max(self.pgo_entries, 1))
+
     def _create_string_constant(self, text):
         """Crea una constante global para un string (evitando duplicados)"""
         text_bytes = text.encode('utf-8') + b'\x00'
         arr_type = ir.ArrayType(ir.IntType(8), len(text_bytes))
-        name = ".str." + str(hash(text))
+        name = _constant_name(".str.", text)
 
         # Verificar si ya existe
+        # bitcast constante (no del builder): sirve también como valor inicial de una global
         if name in self.module.globals:
-            return self.builder.bitcast(self.module.get_global(name), ir.PointerType(ir.IntType(8)))
+            return self.module.get_global(name).bitcast(ir.PointerType(ir.IntType(8)))
 
         # Crear global si no existe
         global_str = ir.GlobalVariable(self.module, arr_type, name=name)
@@ -609,7 +888,7 @@ class LLVMGenerator:
         global_str.global_constant = True
         global_str.initializer = ir.Constant(arr_type, bytearray(text_bytes))
 
-        return self.builder.bitcast(global_str, ir.PointerType(ir.IntType(8)))
+        return global_str.bitcast(ir.PointerType(ir.IntType(8)))
 
     def _get_pow_function(self):
         """Declara o recupera la función estándar 'pow' (de libm)"""
@@ -622,40 +901,11 @@ class LLVMGenerator:
     
     def _lookup_variable(self, name):
         """Busca una variable en la tabla de símbolos"""
-        for table in reversed(self.symbol_tables):
-            if name in table:
-                return table[name]
+        ptr = self.symbols.lookup(name)
+        if ptr is not None:
+            return ptr
         raise RuntimeError(f"Variable '{name}' no definida")
     
-    def _match_types(self, left, right):
-        """Convierte operandos a tipos compatibles"""
-        if left.type == right.type:
-            return left, right
-        
-        # Si uno es double, convertir ambos a double
-        if isinstance(left.type, ir.DoubleType) or isinstance(right.type, ir.DoubleType):
-            if isinstance(left.type, ir.IntType):
-                left = self.builder.sitofp(left, ir.DoubleType())
-            if isinstance(right.type, ir.IntType):
-                right = self.builder.sitofp(right, ir.DoubleType())
-            return left, right
-        
-        # Si ambos son enteros y tienen distinto ancho, se extiende el de menor ancho
-        if isinstance(left.type, ir.IntType) and isinstance(right.type, ir.IntType):
-            if left.type.width > right.type.width:
-                right = self.builder.sext(right, left.type)
-            else:
-                left = self.builder.sext(left, right.type)
-            return left, right
-        
-        return left, right
-    
-    def _convert_to_bool(self, value):
-        """Convierte un valor a booleano (i1)"""
-        if isinstance(value.type, ir.IntType) and value.type.width == 1:
-            return value
-        return self.builder.icmp_signed('!=', value, ir.Constant(value.type, 0))
-    
     #PRUEBA
 def define_concat_function(module, llvm_types):
         i8ptr = llvm_types['cadena']
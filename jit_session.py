@@ -0,0 +1,231 @@
+#SESION JIT PERSISTENTE PARA EL INTERPRETE (REPL)
+#Cada función de usuario vive en su propio módulo dentro de un único motor MCJIT.
+#Al editar el programa solo se recompilan las funciones nuevas o modificadas
+#(y las que las llaman); el resto permanece residente en memoria.
+#MCJIT no olvida los símbolos de un módulo retirado, así que cada versión
+#compilada recibe un nombre único (p. ej. "fib.3") y los llamadores se enlazan
+#contra esa versión exacta.
+#El código máquina de cada módulo pasa por una caché de objetos en disco
+#(object_cache.py): volver a ejecutar un programa sin cambios no regenera código.
+#Las globales también quedan residentes; cada main empieza llamando a la función
+#de reinicio, así cada ejecución parte de sus valores iniciales. El reinicio vive
+#en su propio módulo: sus inicializadores pueden llamar a funciones del programa,
+#y se regenera cuando cambian las versiones de esas funciones.
+import ctypes
+import sys
+import time
+
+import llvmlite.binding as llvm
+from llvmlite import ir
+
+from ast_builder import ASTNode, FunctionCallNode
+from global_analysis import globales_constantes
+from ir_generator import LLVMGenerator
+from target_config import TargetConfig
+from object_cache import ObjectCache
+from pipeline import construir_ast
+
+
+def _recolectar_llamadas(nodo, llamadas):
+    """Agrega a 'llamadas' los nombres de funciones invocadas dentro de 'nodo'"""
+    if isinstance(nodo, list):
+        for elemento in nodo:
+            _recolectar_llamadas(elemento, llamadas)
+    elif isinstance(nodo, ASTNode):
+        if isinstance(nodo, FunctionCallNode):
+            llamadas.add(nodo.name)
+        for valor in vars(nodo).values():
+            _recolectar_llamadas(valor, llamadas)
+    return llamadas
+
+
+class JITSession:
+    def __init__(self, cache=True):
+        """cache: True (directorio por defecto), un ObjectCache propio o False"""
+        # El JIT ejecuta en esta máquina: siempre el host, con su CPU y features
+        self.target = TargetConfig.host()
+        self.target_machine = self.target.target_machine()
+        self.engine = llvm.create_mcjit_compiler(llvm.parse_assembly(""), self.target_machine)
+        self.cache = ObjectCache(target=self.target) if cache is True else cache or None
+        if self.cache:
+            self.cache.conectar(self.engine)
+
+        self.funciones = {}     # nombre -> (huella, módulo residente, símbolo)
+        self.globales = None    # (huella, módulo residente)
+        self.reinicio = None    # (huella, módulo residente, símbolo de la función de reinicio)
+        self.simbolos_globales = {}
+        self.version = 0
+        self._libc = ctypes.CDLL(None)
+
+    # ========================
+    # API PÚBLICA
+    # ========================
+
+    def ejecutar(self, codigo):
+        """
+        Compila incrementalmente el programa y ejecuta su bloque principal.
+        Retorna un resumen con las funciones recompiladas, reutilizadas y el tiempo.
+        """
+        inicio = time.perf_counter()
+        ast, _ = construir_ast(codigo)
+
+        recompiladas = self._sincronizar(ast)
+        reutilizadas = len(self.funciones) - len(recompiladas)
+        simbolo_main = self._nuevo_simbolo("main")
+        main_mod = self._agregar_modulo(self._generar_main(ast, simbolo_main))
+        compilacion = time.perf_counter() - inicio
+
+        try:
+            sys.stdout.flush()
+            main = ctypes.CFUNCTYPE(ctypes.c_int32)(self.engine.get_function_address(simbolo_main))
+            codigo_salida = main()
+            self._libc.fflush(None)
+        finally:
+            self.engine.remove_module(main_mod)
+
+        return {
+            "recompiladas": sorted(recompiladas),
+            "reutilizadas": reutilizadas,
+            "tiempo_compilacion": compilacion,
+            "codigo_salida": codigo_salida,
+            "cache": self.cache.resumen() if self.cache else None,
+        }
+
+    def reiniciar(self):
+        """Descarta todos los símbolos residentes"""
+        for _, modulo, _ in self.funciones.values():
+            self.engine.remove_module(modulo)
+        if self.globales:
+            self.engine.remove_module(self.globales[1])
+        if self.reinicio:
+            self.engine.remove_module(self.reinicio[1])
+        self.funciones = {}
+        self.globales = None
+        self.reinicio = None
+
+    # ========================
+    # MÉTODOS AUXILIARES
+    # ========================
+
+    def _sincronizar(self, ast):
+        """Actualiza los módulos residentes según el nuevo AST"""
+        huella_globales = repr(ast.globals)
+        if self.globales is None or self.globales[0] != huella_globales:
+            # Cambiar una global invalida todas las direcciones ya resueltas
+            self.reiniciar()
+            self.simbolos_globales = {decl.identifier: self._nuevo_simbolo(decl.identifier)
+                                      for decl in ast.globals}
+            self.globales = (huella_globales, self._agregar_modulo(self._generar_globales(ast), finalizar=False))
+
+        nuevas = {func.name: func for func in ast.functions}
+        llamadas = {name: _recolectar_llamadas(func.block, set()) for name, func in nuevas.items()}
+
+        # Funciones nuevas, modificadas o eliminadas
+        sucias = {name for name, func in nuevas.items()
+                  if name not in self.funciones or self.funciones[name][0] != repr(func)}
+        sucias |= set(self.funciones) - set(nuevas)
+
+        # Quien llama a una función recompilada guarda su dirección antigua:
+        # propagar la invalidación a todos los llamadores transitivos
+        pendientes = list(sucias)
+        while pendientes:
+            cambiada = pendientes.pop()
+            for name, destinos in llamadas.items():
+                if cambiada in destinos and name not in sucias:
+                    sucias.add(name)
+                    pendientes.append(name)
+
+        for name in sucias:
+            if name in self.funciones:
+                self.engine.remove_module(self.funciones.pop(name)[1])
+
+        recompiladas = [name for name in nuevas if name in sucias]
+        # Asignar símbolos antes de generar: las recompiladas se llaman entre sí
+        simbolos = {name: self.funciones[name][2] for name in nuevas if name not in sucias}
+        simbolos.update({name: self._nuevo_simbolo(name) for name in recompiladas})
+        for name in recompiladas:
+            module = self._generar_funcion(ast, nuevas[name], simbolos)
+            self.funciones[name] = (repr(nuevas[name]), self._agregar_modulo(module, finalizar=False), simbolos[name])
+
+        # El reinicio se enlaza contra las versiones actuales de las funciones que llaman
+        # los inicializadores, y su plegado de constantes depende de qué globales se asignan
+        llamadas_globales = _recolectar_llamadas([decl.expr for decl in ast.globals], set())
+        huella_reinicio = (huella_globales, sorted(globales_constantes(ast)),
+                           sorted(simbolos[name] for name in llamadas_globales))
+        if self.reinicio is None or self.reinicio[0] != huella_reinicio:
+            if self.reinicio:
+                self.engine.remove_module(self.reinicio[1])
+            reinicio = self._nuevo_simbolo("__reiniciar_globales")
+            module = self._generar_reinicio(ast, reinicio, simbolos)
+            self.reinicio = (huella_reinicio, self._agregar_modulo(module, finalizar=False), reinicio)
+        self.engine.finalize_object()
+        return recompiladas
+
+    def _nuevo_simbolo(self, name):
+        self.version += 1
+        return f"{name}.{self.version}"
+
+    def _nuevo_generador(self, ast, nombre_modulo, simbolos):
+        generator = LLVMGenerator(target=self.target)
+        generator.module.name = nombre_modulo
+        for decl in ast.globals:
+            generator.declare_global(decl, self.simbolos_globales[decl.identifier])
+        for func in ast.functions:
+            generator.declare_function(func, simbolos[func.name])
+        return generator
+
+    def _generar_globales(self, ast):
+        """Define las globales con valor cero: sus valores iniciales los guarda el reinicio"""
+        generator = LLVMGenerator(target=self.target)
+        generator.module.name = "globales"
+        for decl in ast.globals:
+            llvm_type = generator.llvm_types[decl.type]
+            generator._define_global(decl, ir.Constant(llvm_type, None), self.simbolos_globales[decl.identifier])
+        return generator.module
+
+    def _generar_reinicio(self, ast, simbolo, simbolos):
+        """
+        Reinicio: vuelve a guardar, en orden de declaración, el valor inicial de cada
+        global (las ejecuciones anteriores las modificaron). Los que se conocen al
+        compilar se guardan como constantes, contando las globales anteriores que
+        nunca se asignan; el resto se calcula como en __inicializar_globales.
+        """
+        generator = self._nuevo_generador(ast, "reinicio", simbolos)
+        constantes = globales_constantes(ast)
+        known = {}  # nombre -> [tipo, valor] de las globales constantes
+        function = ir.Function(generator.module, ir.FunctionType(ir.VoidType(), []), name=simbolo)
+        generator.builder = ir.IRBuilder(function.append_basic_block(name="entry"))
+        generator.current_function = function
+        for decl in ast.globals:
+            valor = generator._static_initializer(decl, ast, known)
+            if valor is None:
+                valor = generator._generate_typed(decl.expr, decl.type)
+            elif decl.identifier in constantes and decl.type != 'cadena':
+                python_type = {'entero': int, 'decimal': float, 'bool': bool}[decl.type]
+                known[decl.identifier] = [decl.type, python_type(valor.constant or 0)]
+            generator.builder.store(valor, generator._lookup_variable(decl.identifier))
+        generator.builder.ret_void()
+        return generator.module
+
+    def _generar_funcion(self, ast, func_node, simbolos):
+        generator = self._nuevo_generador(ast, f"fn.{func_node.name}", simbolos)
+        generator._generate_function(func_node)
+        return generator.module
+
+    def _generar_main(self, ast, simbolo):
+        simbolos = {name: entrada[2] for name, entrada in self.funciones.items()}
+        generator = self._nuevo_generador(ast, simbolo, simbolos)
+        # main la llama antes que nada, como a __inicializar_globales en un programa completo
+        generator.global_initializer = ir.Function(generator.module, ir.FunctionType(ir.VoidType(), []), name=self.reinicio[2])
+        generator._generate_main_function(ast.block, name=simbolo)
+        return generator.module
+
+    def _agregar_modulo(self, module, finalizar=True):
+        # Los auxiliares definidos en cada módulo no deben chocar entre sí
+        module.get_global("concat").linkage = "internal"
+        llvm_mod = llvm.parse_assembly(str(module))
+        llvm_mod.verify()
+        self.engine.add_module(llvm_mod)
+        if finalizar:
+            self.engine.finalize_object()
+        return llvm_mod
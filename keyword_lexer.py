@@ -0,0 +1,126 @@
+#LEXER CON TABLA DE PALABRAS CLAVE
+#Expr.g4 escribe cada palabra clave con clases de caracteres ([Pp][Rr][Oo]...)
+#junto a la regla general ID: el ATN del lexer queda grande y el runtime de
+#Python lo recorre carácter por carácter para cada identificador. ExprLexerTabla.g4
+#no tiene esas reglas: reconoce la palabra una sola vez como ID y aquí se
+#clasifica con un diccionario. Los tokens son los mismos que los de ExprLexer:
+#  - las palabras clave no distinguen mayúsculas ('Programa', 'SI', 'entero'),
+#  - 'funciones', 'verdad' y 'falso' son literales de la gramática y sí las distinguen,
+#  - ANTLR toma la coincidencia más larga, así que 'sinombre' o 'enteros' son ID.
+#Achicar el ATN por sí solo no acelera el lexer: con el DFA ya construido el
+#runtime de Python paga lo mismo por cada carácter. Por eso KeywordTableLexer
+#reconoce con una expresión regular, de una vez, los tramos que más abundan
+#(palabras, números, espacios y operadores) y deja el resto (cadenas,
+#comentarios, errores y EOF) al lexer de ANTLR.
+#Se elige con crear_lexer(..., tipo) o la variable de entorno COMPILADOR_LEXER
+#('antlr', por defecto, o 'tabla').
+import mmap
+import os
+import re
+
+from antlr4 import Token
+
+from ExprLexer import ExprLexer
+from ExprParser import ExprParser
+
+try:
+    from ExprLexerTabla import ExprLexerTabla
+except ImportError:  # sin generar: antlr4 -Dlanguage=Python3 -visitor Expr.g4 ExprLexerTabla.g4
+    ExprLexerTabla = None
+
+LEXERS = ("antlr", "tabla")
+
+# Reglas [Aa][Bb]... de Expr.g4: se buscan con el texto en minúsculas
+PALABRAS_CLAVE = {
+    nombre.lower(): getattr(ExprParser, nombre)
+    for nombre in ("PROGRAMA", "INICIO", "FIN", "SI", "SINO", "PARA", "MIENTRAS", "HACER", "RET",
+                   "PINTAR", "ENTERO", "DECIMAL", "BOOL", "CADENA", "VOID", "VAR")
+}
+# Literales entre comillas de Expr.g4: se buscan con el texto tal cual
+PALABRAS_EXACTAS = {
+    "funciones": ExprParser.literalNames.index("'funciones'"),
+    "verdad": ExprParser.BOOL_LIT,
+    "falso": ExprParser.BOOL_LIT,
+}
+# Operadores y símbolos: '==', '(', ';'...
+SIMBOLOS = {
+    nombre[1:-1]: tipo for tipo, nombre in enumerate(ExprParser.literalNames)
+    if nombre.startswith("'") and not nombre[1].isalpha()
+}
+
+# Mismos lenguajes que ID, NUMERO, WS y los símbolos de Expr.g4; ninguna otra regla
+# empieza con una letra, un dígito o un espacio, así que la coincidencia más larga
+# es ésta. Los símbolos de dos caracteres van primero y '/' no puede abrir un comentario.
+_RAPIDO = (r"(?P<espacios>[ \t\r\n]+)|(?P<palabra>[a-zA-Z][a-zA-Z0-9_]*)|(?P<numero>[0-9]+(?:\.[0-9]+)?)"
+           r"|(?P<simbolo>" + "|".join(re.escape(simbolo) for simbolo in sorted(SIMBOLOS, key=len, reverse=True)
+                                       if simbolo != "/") + r"|/(?![/*]))")
+_RAPIDO_TEXTO = re.compile(_RAPIDO)
+_RAPIDO_BYTES = re.compile(_RAPIDO.encode())
+
+
+def lexer_por_defecto():
+    return os.environ.get("COMPILADOR_LEXER", "antlr")
+
+
+def crear_lexer(input_stream, tipo=None):
+    """Lexer para ExprParser según 'tipo' ('antlr' o 'tabla'; por defecto COMPILADOR_LEXER)"""
+    tipo = tipo or lexer_por_defecto()
+    if tipo not in LEXERS:
+        raise ValueError(f"Lexer desconocido '{tipo}': use uno de {', '.join(LEXERS)}")
+    if tipo == "tabla":
+        return KeywordTableLexer(input_stream)
+    return ExprLexer(input_stream)
+
+
+def clasificar(texto):
+    """Tipo de token de una palabra reconocida como ID"""
+    return PALABRAS_EXACTAS.get(texto) or PALABRAS_CLAVE.get(texto.lower(), ExprParser.ID)
+
+
+# Si ExprLexerTabla no está generado se usa ExprLexer: ya emite las palabras
+# clave con su tipo y la clasificación de los ID no cambia nada
+class KeywordTableLexer(ExprLexerTabla or ExprLexer):
+    def __init__(self, input=None, output=None):
+        super().__init__(input, output)
+        # Texto completo de la entrada (InputStream/FileStream, o los bytes de
+        # streaming_compiler.MappedFileStream); sin él, todo pasa por ANTLR
+        self._fuente = getattr(input, "strdata", None)
+        self._rapido = _RAPIDO_TEXTO
+        if self._fuente is None and isinstance(getattr(input, "data", None), (bytes, mmap.mmap)):
+            self._fuente, self._rapido = input.data, _RAPIDO_BYTES
+
+    def nextToken(self):
+        entrada, interp = self._input, self._interp
+        while True:
+            inicio = entrada.index
+            m = self._rapido.match(self._fuente, inicio) if self._fuente is not None else None
+            if m is None:
+                token = super().nextToken()
+                if token.type == ExprParser.ID:
+                    token.type = clasificar(token.text)
+                return token
+
+            texto = m.group()
+            if isinstance(texto, bytes):
+                texto = texto.decode("ascii")
+            fin = m.end()
+            entrada.seek(fin)
+            if m.lastgroup == "espacios":
+                # Igual que LexerATNSimulator.consume: sólo '\n' cambia de línea
+                saltos = texto.count("\n")
+                if saltos:
+                    interp.line += saltos
+                    interp.column = len(texto) - texto.rfind("\n") - 1
+                else:
+                    interp.column += len(texto)
+                continue
+
+            if m.lastgroup == "palabra":
+                tipo = clasificar(texto)
+            else:
+                tipo = ExprParser.NUMERO if m.lastgroup == "numero" else SIMBOLOS[texto]
+            self._token = self._factory.create(self._tokenFactorySourcePair, tipo, texto, Token.DEFAULT_CHANNEL,
+                                               inicio, fin - 1, interp.line, interp.column)
+            interp.column += len(texto)
+            self._hitEOF = fin >= entrada.size
+            return self._token
@@ -0,0 +1,36 @@
+#INICIALIZACION DE LLVM UNA SOLA VEZ POR PROCESO
+#Sólo lo necesita quien usa llvmlite.binding (target_config, JIT, caché de
+#objetos, backend paralelo, servidor); construir IR con llvmlite.ir no.
+import threading
+
+_inicializado = False
+_todos = False
+_candado = threading.Lock()
+
+
+def inicializar_llvm():
+    """Registra el target nativo y su asmprinter; las llamadas siguientes no hacen nada"""
+    global _inicializado
+    if _inicializado:
+        return
+    with _candado:
+        if not _inicializado:
+            import llvmlite.binding as llvm
+            llvm.initialize()
+            llvm.initialize_native_target()
+            llvm.initialize_native_asmprinter()
+            _inicializado = True
+
+
+def inicializar_todos_los_targets():
+    """Registra todos los targets compilados en LLVM (compilación cruzada); una sola vez"""
+    global _todos
+    inicializar_llvm()
+    if _todos:
+        return
+    with _candado:
+        if not _todos:
+            import llvmlite.binding as llvm
+            llvm.initialize_all_targets()
+            llvm.initialize_all_asmprinters()
+            _todos = True
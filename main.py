@@ -1,20 +1,22 @@
 import os
 from pathlib import Path
-from antlr4 import *
-from ExprLexer import ExprLexer
-from ExprParser import ExprParser
-from Evaluar import Evaluador
-from ast_builder import ASTBuilder
-from ir_generator import LLVMGenerator
-from SemanticListener import SemanticListener, SemanticError
+# antlr4, el parser generado, llvmlite y la sesión JIT se importan la primera vez
+# que una opción los necesita: validar o ver el AST no carga LLVM
 
 
 class Interprete:
     def __init__(self):
-        self.evaluador = Evaluador()
+        self.evaluador = None
         self.historial = []
         self.programa_actual = None
-        self.llvm_generator = LLVMGenerator()
+        self._sesion_jit = None
+
+    @property
+    def sesion_jit(self):
+        if self._sesion_jit is None:
+            from jit_session import JITSession
+            self._sesion_jit = JITSession()
+        return self._sesion_jit
         
     def _menu(self, opciones):
         print("\nMenú:")
@@ -62,11 +64,22 @@ class Interprete:
             self._error("\nEdición cancelada")
             return None
 
+    def _componer_programa(self, nombre, lineas):
+        # El editor recibe el contenido del programa: globales, funciones e Inicio
+        return f"programa {nombre} {{\n" + "\n".join(lineas) + "\n}"
+
     def _ejecutar_en_memoria(self, nombre, lineas):
         try:
-            programa = f"programa {nombre}\ninicio\n" + "\n".join(lineas) + "\nfin"
+            programa = self._componer_programa(nombre, lineas)
             self._agregar_historial(nombre, programa)
-            self.evaluador.ejecutar(InputStream(programa))
+            resumen = self.sesion_jit.ejecutar(programa)
+            print(f"[JIT] Recompiladas: {', '.join(resumen['recompiladas']) or 'ninguna'} | "
+                  f"reutilizadas: {resumen['reutilizadas']} | "
+                  f"compilación: {resumen['tiempo_compilacion'] * 1000:.1f} ms")
+            if resumen['cache']:
+                cache = resumen['cache']
+                print(f"[JIT] Caché de objetos: {cache['aciertos']} aciertos / {cache['fallos']} fallos "
+                      f"({cache['tasa_aciertos']:.0%}) | codegen evitado: {cache['tiempo_ahorrado'] * 1000:.1f} ms")
         except Exception as e:
             self._error(str(e))
 
@@ -84,6 +97,7 @@ class Interprete:
             elif opcion == 'g': 
                 self._guardar(nombre, codigo)
             elif opcion == 'n': 
+                self.sesion_jit.reiniciar()
                 break
             elif opcion == 's': 
                 return
@@ -91,13 +105,15 @@ class Interprete:
                 self._error("Opción inválida")
 
     def _editar(self, nombre, codigo):
+        # La sesión JIT conserva las funciones ya compiladas entre ediciones
         if nuevo_codigo := self._leer_codigo():
+            codigo[:] = nuevo_codigo
             self._ejecutar_en_memoria(nombre, nuevo_codigo)
 
     def _guardar(self, nombre, codigo):
         try:
             archivo = input("Nombre del archivo: ") + ".ea"
-            Path(archivo).write_text(f"programa {nombre}\ninicio\n" + "\n".join(codigo) + "\nfin")
+            Path(archivo).write_text(self._componer_programa(nombre, codigo))
             print(f"Guardado en: {archivo}")
         except Exception as e:
             self._error(str(e))
@@ -132,6 +148,12 @@ class Interprete:
         try:
             if not Path(ruta_codigo).exists():
                 raise FileNotFoundError(f"El archivo '{ruta_codigo}' no existe.")
+            from antlr4 import FileStream, CommonTokenStream
+            from ExprLexer import ExprLexer
+            from ExprParser import ExprParser
+            from ast_builder import ASTBuilder
+            from dfa_cache import precargar
+            precargar()
             input_stream = FileStream(ruta_codigo, encoding="utf-8")
             lexer = ExprLexer(input_stream)
             tokens = CommonTokenStream(lexer)
@@ -146,10 +168,18 @@ class Interprete:
 
     def _ejecutar_programa(self):
         ruta = input("Ruta del archivo: ")
+        from SemanticListener import SemanticError
         try:
             if not Path(ruta).exists():
                 raise FileNotFoundError(f"El archivo '{ruta}' no existe.")
-            
+            from antlr4 import FileStream, CommonTokenStream, ParseTreeWalker
+            from ExprLexer import ExprLexer
+            from ExprParser import ExprParser
+            from SemanticListener import SemanticListener
+            from Evaluar import Evaluador
+            from dfa_cache import precargar
+            precargar()
+
             print("Realizando análisis semántico...")
             input_stream = FileStream(ruta, encoding="utf-8")
             lexer = ExprLexer(input_stream)
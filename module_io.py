@@ -0,0 +1,70 @@
+#EL MODULO LLVM EN MEMORIA Y COMO BITCODE
+#LLVMGenerator construye un llvmlite.ir.Module; optimizar, ejecutar o emitir
+#código necesita un módulo de llvmlite.binding. llvmlite sólo pasa de uno a otro
+#analizando el texto del IR, así que eso se hace una sola vez (modulo_binario) y
+#desde ahí el optimizador, el JIT y la emisión de objetos trabajan sobre el mismo
+#módulo en memoria. Lo que tenga que ir a disco para opt, lli o llc se escribe
+#como bitcode (.bc): es más chico y se lee mucho más rápido que el texto, y las
+#herramientas lo aceptan igual que un .ll.
+import llvmlite.binding as llvm
+
+from llvm_init import inicializar_llvm
+from target_config import configuracion_por_defecto
+
+
+def modulo_binario(module):
+    """Módulo de llvmlite.binding para 'module' (ir.Module, se analiza una vez; o ya binario)"""
+    if isinstance(module, llvm.ModuleRef):
+        return module
+    inicializar_llvm()
+    binario = llvm.parse_assembly(str(module))
+    binario.verify()
+    return binario
+
+
+def optimizar(module, nivel=2, target=None):
+    """Aplica los pases de -O<nivel> en memoria con los costos del destino; retorna el módulo binario"""
+    module = modulo_binario(module)
+    if nivel <= 0:
+        return module
+    builder = llvm.create_pass_manager_builder()
+    builder.opt_level = nivel
+    pass_manager = llvm.create_module_pass_manager()
+    # Una TargetMachine propia: este módulo puede optimizarse en cualquier hilo.
+    # Debe seguir viva mientras corren los pases que la consultan
+    target_machine = (target or configuracion_por_defecto()).nueva_target_machine(nivel)
+    target_machine.add_analysis_passes(pass_manager)
+    builder.populate(pass_manager)
+    pass_manager.run(module)
+    return module
+
+
+def clonar(module):
+    """Copia independiente de un módulo binario (vía bitcode, sin pasar por texto)"""
+    return llvm.parse_bitcode(modulo_binario(module).as_bitcode())
+
+
+def guardar_bitcode(module, path):
+    """Escribe el módulo como bitcode; retorna el módulo binario"""
+    module = modulo_binario(module)
+    with open(path, "wb") as f:
+        f.write(module.as_bitcode())
+    return module
+
+
+def cargar_modulo(path):
+    """Lee un .bc o un .ll"""
+    inicializar_llvm()
+    with open(path, "rb") as f:
+        datos = f.read()
+    if datos[:4] == b"BC\xc0\xde":
+        return llvm.parse_bitcode(datos)
+    return llvm.parse_assembly(datos.decode("utf-8"))
+
+
+def emitir_objeto(module, target=None, opt_level=2):
+    """Código objeto del módulo para 'target' (host por defecto), sin pasar por llc"""
+    target = target or configuracion_por_defecto()
+    module = modulo_binario(module)
+    target.aplicar(module)
+    return target.nueva_target_machine(opt_level).emit_object(module)
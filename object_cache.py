@@ -0,0 +1,103 @@
+#CACHE DE OBJETOS PARA EL JIT (PERSISTIDA EN DISCO)
+#MCJIT consulta la caché antes de generar código máquina para un módulo: si ya
+#existe un objeto con la misma clave lo carga tal cual y se salta la generación.
+#La clave es un hash del IR del módulo más el destino (triple, CPU y features).
+#LLVMGenerator emite el mismo texto para el mismo programa en cualquier proceso,
+#así que basta con quitar el ModuleID (el nombre del módulo no cambia el código).
+import hashlib
+import os
+import re
+import tempfile
+import time
+
+from target_config import TargetConfig
+
+
+def directorio_por_defecto():
+    base = os.environ.get("COMPILADOR_CACHE") or os.path.join(os.path.expanduser("~"), ".cache", "compilador_cesar")
+    return os.path.join(base, "objetos")
+
+
+class ObjectCache:
+    def __init__(self, directorio=None, target=None):
+        self.directorio = directorio or directorio_por_defecto()
+        os.makedirs(self.directorio, exist_ok=True)
+        self._huella_destino = (target or TargetConfig.host()).huella()
+        self.aciertos = 0
+        self.fallos = 0
+        self.tiempo_generacion = 0.0   # segundos de codegen en los fallos
+        self.tiempo_ahorrado = 0.0     # codegen que se evitó en los aciertos (según lo medido al guardarlos)
+        self._pendiente = None         # (clave, inicio) del último fallo, aún sin objeto
+
+    def conectar(self, engine):
+        """Activa la caché en un ExecutionEngine de llvmlite"""
+        engine.set_object_cache(self._guardar, self._buscar)
+        return engine
+
+    def resumen(self):
+        total = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / total if total else 0.0,
+            "tiempo_generacion": self.tiempo_generacion,
+            "tiempo_ahorrado": self.tiempo_ahorrado,
+        }
+
+    def limpiar(self):
+        """Borra todos los objetos guardados"""
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith((".o", ".seg")):
+                os.remove(os.path.join(self.directorio, nombre))
+
+    # ========================
+    # CALLBACKS DE MCJIT
+    # ========================
+
+    def _buscar(self, module):
+        clave = self.clave(module)
+        ruta = os.path.join(self.directorio, clave + ".o")
+        try:
+            with open(ruta, "rb") as f:
+                objeto = f.read()
+        except OSError:
+            self.fallos += 1
+            self._pendiente = (clave, time.perf_counter())
+            return None
+        self.aciertos += 1
+        self.tiempo_ahorrado += self._leer_segundos(clave)
+        return objeto
+
+    def _guardar(self, module, objeto):
+        # MCJIT avisa justo después de generar el módulo que falló en _buscar.
+        # No se recalcula la clave: la generación de código ya modificó el IR.
+        if self._pendiente is None:
+            return
+        clave, inicio = self._pendiente
+        self._pendiente = None
+        segundos = time.perf_counter() - inicio
+        self.tiempo_generacion += segundos
+        self._escribir(clave + ".o", objeto)
+        self._escribir(clave + ".seg", f"{segundos:.6f}".encode())
+
+    # ========================
+    # AUXILIARES
+    # ========================
+
+    def clave(self, module):
+        texto = re.sub(r"^; ModuleID = .*$", "", str(module), count=1, flags=re.MULTILINE)
+        return hashlib.sha256(f"{self._huella_destino}\n{texto}".encode()).hexdigest()
+
+    def _leer_segundos(self, clave):
+        try:
+            with open(os.path.join(self.directorio, clave + ".seg")) as f:
+                return float(f.read())
+        except (OSError, ValueError):
+            return 0.0
+
+    def _escribir(self, nombre, datos):
+        # Escritura atómica: otro proceso nunca ve un objeto a medio escribir
+        fd, temporal = tempfile.mkstemp(dir=self.directorio)
+        with os.fdopen(fd, "wb") as f:
+            f.write(datos)
+        os.replace(temporal, os.path.join(self.directorio, nombre))
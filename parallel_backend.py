@@ -0,0 +1,245 @@
+#BACKEND PARALELO: PARTICION DEL MODULO Y EMISION DE OBJETOS EN HILOS
+#El módulo completo se divide en particiones formadas por componentes fuertemente
+#conexas (SCC) del grafo de llamadas, balanceadas por número de instrucciones.
+#Cada partición lleva los cuerpos de sus funciones y solo declaraciones del resto,
+#y se optimiza y emite a un objeto en su propio hilo y su propio contexto LLVM
+#(llvmlite libera el GIL durante la generación de código). Los objetos se enlazan
+#luego en un ejecutable o se cargan juntos en un motor JIT. Cada SCC queda entera
+#en una partición, así la recursión mutua se sigue optimizando junta.
+import os
+import re
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import llvmlite.binding as llvm
+
+from module_io import modulo_binario
+from target_config import TargetConfig, configuracion_por_defecto
+
+# ========================
+# GRAFO DE LLAMADAS Y PARTICIONES
+# ========================
+
+_LLAMADA = re.compile(r'\bcall\b[^@\n]*@("[^"]*"|[-\w.$]+)')
+
+
+def grafo_de_llamadas(piezas):
+    """
+    Retorna (llamadas, tamanos): por cada función definida, la lista ordenada de funciones
+    definidas que llama y su número de líneas (aprox. instrucciones).
+    Trabaja sobre el texto de cada definición: recorrer instrucciones con llvmlite
+    es mucho más lento en programas grandes.
+    """
+    definiciones = {nombre: definicion for nombre, definicion, _ in piezas if nombre is not None}
+    llamadas, tamanos = {}, {}
+    for nombre, definicion in definiciones.items():
+        destinos = {destino.strip('"') for destino in _LLAMADA.findall(definicion)}
+        # Ordenado: las SCC y las particiones salen iguales en cada proceso
+        llamadas[nombre] = sorted(destinos & definiciones.keys())
+        tamanos[nombre] = definicion.count("\n")
+    return llamadas, tamanos
+
+
+def componentes_fuertes(grafo):
+    """Algoritmo de Tarjan (iterativo) sobre un grafo nombre -> destinos"""
+    indice, bajo, en_pila = {}, {}, set()
+    pila, componentes = [], []
+    contador = 0
+
+    for raiz in grafo:
+        if raiz in indice:
+            continue
+        trabajo = [(raiz, iter(grafo[raiz]))]
+        indice[raiz] = bajo[raiz] = contador
+        contador += 1
+        pila.append(raiz)
+        en_pila.add(raiz)
+        while trabajo:
+            nodo, hijos = trabajo[-1]
+            for hijo in hijos:
+                if hijo not in indice:
+                    indice[hijo] = bajo[hijo] = contador
+                    contador += 1
+                    pila.append(hijo)
+                    en_pila.add(hijo)
+                    trabajo.append((hijo, iter(grafo[hijo])))
+                    break
+                if hijo in en_pila:
+                    bajo[nodo] = min(bajo[nodo], indice[hijo])
+            else:
+                trabajo.pop()
+                if trabajo:
+                    padre = trabajo[-1][0]
+                    bajo[padre] = min(bajo[padre], bajo[nodo])
+                if bajo[nodo] == indice[nodo]:
+                    componente = []
+                    while True:
+                        miembro = pila.pop()
+                        en_pila.discard(miembro)
+                        componente.append(miembro)
+                        if miembro == nodo:
+                            break
+                    componentes.append(componente)
+    return componentes
+
+
+def particionar(piezas, particiones):
+    """Reparte las SCC en 'particiones' grupos de tamaño parecido (mayor primero)"""
+    llamadas, tamanos = grafo_de_llamadas(piezas)
+    componentes = componentes_fuertes(llamadas)
+    componentes.sort(key=lambda c: sum(tamanos[f] for f in c), reverse=True)
+
+    grupos = [(0, i, set()) for i in range(max(1, min(particiones, len(componentes))))]
+    for componente in componentes:
+        carga, i, nombres = min(grupos)
+        nombres.update(componente)
+        grupos[i] = (carga + sum(tamanos[f] for f in componente), i, nombres)
+    return [nombres for _, _, nombres in grupos if nombres]
+
+
+# ========================
+# EMISION POR PARTICION
+# ========================
+
+def _crear_target_machine(target, opt_level):
+    # Código reubicable: sirve tanto para ejecutables PIE como para bibliotecas
+    return target.nueva_target_machine(opt_level, reloc="pic", codemodel="default")
+
+
+def _trocear(module):
+    """
+    Divide el texto del módulo en piezas (nombre, definición, declaración).
+    Las piezas fuera de funciones (globales, declaraciones, atributos) tienen nombre None.
+    """
+    definidas = iter([f for f in module.functions if not f.is_declaration])
+    piezas, actual = [], []
+    for linea in str(module).splitlines(keepends=True):
+        if linea.startswith("define "):
+            if actual:
+                piezas.append((None, "".join(actual), None))
+            actual = [linea]
+        elif linea.startswith("}") and actual and actual[0].startswith("define "):
+            actual.append(linea)
+            func = next(definidas)
+            cabecera = actual[0].split()[1:]
+            while cabecera[0] in _ENLACES:
+                cabecera.pop(0)
+            # Los adjuntos de metadatos (!prof de PGO) nombran nodos que otra partición no tiene
+            declaracion = "declare " + _ADJUNTOS.sub("", " ".join(cabecera).rstrip("{ ")) + "\n"
+            piezas.append((func.name, "".join(actual), declaracion))
+            actual = []
+        else:
+            actual.append(linea)
+    if actual:
+        piezas.append((None, "".join(actual), None))
+    return piezas
+
+
+_ENLACES = {"external", "internal", "private", "linkonce", "linkonce_odr", "weak", "weak_odr",
+            "available_externally", "dso_local", "dso_preemptable"}
+_DEFINICION_LOCAL = re.compile(r"^define (internal|private) ")
+_ADJUNTOS = re.compile(r" ![\w.]+ !\d+")
+
+
+def _texto_particion(piezas, nombres, unica=False):
+    """
+    Módulo con los cuerpos de 'nombres'; el resto de funciones queda solo declarado.
+    Si hay varias particiones, las funciones internas (las del usuario en un programa
+    completo) pasan a externas: otra partición puede llamarlas. Una partición única
+    es el módulo entero y conserva el enlace interno.
+    """
+    if unica:
+        return "".join(definicion for _, definicion, _ in piezas)
+    partes = []
+    for nombre, definicion, declaracion in piezas:
+        if nombre is None:
+            partes.append(definicion)
+        elif nombre in nombres:
+            partes.append(_DEFINICION_LOCAL.sub("define ", definicion, count=1))
+        else:
+            partes.append(declaracion)
+    return "".join(partes)
+
+
+def _emitir_particion(ir_texto, define_globales, opt_level, target):
+    """Optimiza y emite a objeto una partición (corre en un hilo con su propio contexto)"""
+    context = llvm.create_context()
+    module = llvm.parse_assembly(ir_texto, context=context)
+    target_machine = _crear_target_machine(target, opt_level)
+    module.triple = target_machine.triple
+    module.data_layout = str(target_machine.target_data)
+
+    for global_var in module.global_variables:
+        if global_var.is_declaration:
+            continue
+        es_constante = " constant " in str(global_var)
+        if global_var.linkage in (llvm.Linkage.internal, llvm.Linkage.private):
+            if es_constante:
+                continue  # p. ej. cadenas: cada objeto lleva su copia
+            global_var.linkage = llvm.Linkage.external  # el estado debe ser único
+        if not define_globales:
+            global_var.linkage = llvm.Linkage.available_externally
+
+    pass_manager = llvm.create_module_pass_manager()
+    target_machine.add_analysis_passes(pass_manager)
+    if opt_level:
+        builder = llvm.create_pass_manager_builder()
+        builder.opt_level = opt_level
+        builder.populate(pass_manager)
+    pass_manager.add_global_dce_pass()
+    pass_manager.run(module)
+
+    return target_machine.emit_object(module)
+
+
+def compilar_objetos(module, workers=None, particiones=None, opt_level=2, target=None):
+    """
+    Emite el módulo como varios objetos generados en paralelo para 'target'
+    (TargetConfig; por defecto el host o lo que indiquen las variables de entorno).
+    Retorna (lista de objetos en bytes, segundos de pared).
+    """
+    target = target or configuracion_por_defecto()
+
+    inicio = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    base = modulo_binario(module)  # un módulo ya analizado no vuelve a pasar por texto
+    piezas = _trocear(base)
+    grupos = particionar(piezas, particiones or workers * 2)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futuros = [pool.submit(_emitir_particion, _texto_particion(piezas, nombres, len(grupos) == 1),
+                               i == 0, opt_level, target)
+                   for i, nombres in enumerate(grupos)]
+        objetos = [futuro.result() for futuro in futuros]
+    return objetos, time.perf_counter() - inicio
+
+
+# ========================
+# ENLACE
+# ========================
+
+def enlazar_ejecutable(objetos, salida, compilador="cc", compartido=False):
+    """Enlaza los objetos en un ejecutable (o biblioteca compartida) con el compilador de C"""
+    with tempfile.TemporaryDirectory() as tmp:
+        rutas = []
+        for i, objeto in enumerate(objetos):
+            ruta = os.path.join(tmp, f"particion_{i}.o")
+            with open(ruta, "wb") as f:
+                f.write(objeto)
+            rutas.append(ruta)
+        comando = [compilador] + (["-shared"] if compartido else []) + rutas + ["-o", salida, "-lm"]
+        resultado = subprocess.run(comando, capture_output=True, text=True)
+    if resultado.returncode != 0:
+        raise RuntimeError(f"Falló el enlace con {compilador}:\n{resultado.stderr}")
+    return salida
+
+
+def cargar_en_jit(objetos, opt_level=2):
+    """Carga todos los objetos en un único motor MCJIT y lo retorna ya finalizado"""
+    engine = llvm.create_mcjit_compiler(llvm.parse_assembly(""), _crear_target_machine(TargetConfig.host(), opt_level))
+    for objeto in objetos:
+        engine.add_object_file(llvm.ObjectFileRef.from_data(objeto))
+    engine.finalize_object()
+    return engine
@@ -0,0 +1,263 @@
+#COMPILACION PARALELA POR FUNCION PARA PROGRAMAS GRANDES
+#1. Pre-pasada sobre los tokens: firmas de funciones, globales y el texto de cada función.
+#2. Un pool de procesos analiza (semántica, AST y tipos) y genera el IR de lotes de
+#   funciones, cada lote en su propio módulo llvmlite.
+#3. Mientras tanto el proceso principal analiza el resto del programa (globales y
+#   bloque Inicio); al final se enlazan todos los módulos en uno solo.
+#Los diagnósticos son los mismos que en modo secuencial: cada lote conoce solo las
+#funciones definidas antes que él, igual que SemanticListener al recorrer el archivo.
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import llvmlite.binding as llvm
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker, Token
+
+from ExprLexer import ExprLexer
+from ExprParser import ExprParser
+from ast_builder import ASTBuilder, DeclarationNode, FunctionNode, ParameterNode
+from ir_generator import LLVMGenerator
+from keyword_lexer import crear_lexer
+from llvm_init import inicializar_llvm
+from pipeline import parsear, analizar_semantica
+from SemanticListener import SemanticListener
+from type_annotator import TypeAnnotator
+
+TIPOS = {
+    ExprLexer.ENTERO: 'entero',
+    ExprLexer.DECIMAL: 'decimal',
+    ExprLexer.BOOL: 'bool',
+    ExprLexer.CADENA: 'cadena',
+    ExprLexer.VOID: 'void',
+}
+
+
+class Firma:
+    def __init__(self, name, return_type, params, texto, linea):
+        self.name = name
+        self.return_type = return_type
+        self.params = params    # [(identificador, tipo)]
+        self.texto = texto      # código fuente completo de la función
+        self.linea = linea      # línea donde empieza en el archivo original
+
+
+class Prepasada:
+    def __init__(self, firmas, globales, esqueleto, funciones_primero):
+        self.firmas = firmas                        # [Firma] en orden de aparición
+        self.globales = globales                    # nombre -> tipo
+        self.esqueleto = esqueleto                  # fuente con la sección 'funciones' vacía
+        self.funciones_primero = funciones_primero  # 'funciones' aparece antes de Inicio
+
+
+# ========================
+# PRE-PASADA SOBRE TOKENS
+# ========================
+
+def prepasada(codigo):
+    """
+    Recorre solo los tokens (sin parser) para extraer firmas y globales.
+    Retorna None si la estructura no es la esperada; el llamador compila en secuencial.
+    """
+    stream = CommonTokenStream(crear_lexer(InputStream(codigo)))
+    stream.fill()
+    toks = stream.tokens
+
+    globales = {}
+    inicio_seccion = None
+    vio_inicio = False
+    profundidad = 0
+    for i, tok in enumerate(toks):
+        if tok.type == ExprLexer.LLAVE_IZQ:
+            profundidad += 1
+        elif tok.type == ExprLexer.LLAVE_DER:
+            profundidad -= 1
+        elif profundidad == 1 and tok.type == ExprLexer.INICIO:
+            vio_inicio = True
+        elif profundidad == 1 and tok.text == 'funciones':
+            inicio_seccion = i
+            break
+        elif profundidad == 1 and tok.type in TIPOS and toks[i + 1].type == ExprLexer.ID:
+            globales[toks[i + 1].text] = TIPOS[tok.type]
+
+    if inicio_seccion is None:
+        return Prepasada([], globales, codigo, False)
+
+    try:
+        firmas, fin_seccion = _leer_funciones(codigo, toks, inicio_seccion + 1)
+    except (IndexError, ValueError):
+        return None
+
+    # Dejar la sección vacía (mismas alternativas para el parser) y conservar
+    # la numeración de líneas con los saltos de línea del contenido original
+    a, b = toks[inicio_seccion].start, toks[fin_seccion].stop + 1
+    esqueleto = codigo[:a] + "funciones {" + "\n" * codigo.count("\n", a, b) + "}" + codigo[b:]
+    return Prepasada(firmas, globales, esqueleto, not vio_inicio)
+
+
+def _leer_funciones(codigo, toks, i):
+    def esperar(tipo):
+        nonlocal i
+        if toks[i].type != tipo:
+            raise ValueError(f"Token inesperado '{toks[i].text}' en la línea {toks[i].line}")
+        i += 1
+        return toks[i - 1]
+
+    esperar(ExprLexer.LLAVE_IZQ)
+    firmas = []
+    while toks[i].type != ExprLexer.LLAVE_DER:
+        primero = toks[i]
+        if primero.type not in TIPOS:
+            raise ValueError(f"Se esperaba un tipo en la línea {primero.line}")
+        i += 1
+        name = esperar(ExprLexer.ID).text
+        esperar(ExprLexer.PAR_IZQ)
+        params = []
+        while toks[i].type != ExprLexer.PAR_DER:
+            if params:
+                esperar(ExprLexer.COMA)
+            if toks[i].type not in TIPOS:
+                raise ValueError(f"Se esperaba un tipo en la línea {toks[i].line}")
+            tipo = TIPOS[toks[i].type]
+            i += 1
+            params.append((esperar(ExprLexer.ID).text, tipo))
+        esperar(ExprLexer.PAR_DER)
+
+        # Cuerpo: llaves balanceadas
+        esperar(ExprLexer.LLAVE_IZQ)
+        profundidad = 1
+        while profundidad:
+            if toks[i].type == ExprLexer.LLAVE_IZQ:
+                profundidad += 1
+            elif toks[i].type == ExprLexer.LLAVE_DER:
+                profundidad -= 1
+            elif toks[i].type == Token.EOF:
+                raise ValueError("Fin de archivo dentro de una función")
+            i += 1
+        texto = codigo[primero.start:toks[i - 1].stop + 1]
+        firmas.append(Firma(name, TIPOS[primero.type], params, texto, primero.line))
+    return firmas, i
+
+
+# ========================
+# TRABAJO DE CADA PROCESO
+# ========================
+
+def _compilar_lote(lote, previas, todas, globales):
+    """
+    Analiza y genera el IR de un lote de funciones.
+    lote: [(texto, linea)]; previas/todas: nombre -> (tipo_retorno, [(param, tipo)]).
+    Retorna (ir_texto o None, errores, advertencias, funciones_llamadas).
+    """
+    listener = SemanticListener(check_unused_functions=False)
+    listener.predeclare(previas, globales)
+    walker = ParseTreeWalker()
+    nodes = []
+    for texto, linea in lote:
+        # El lexer arranca en la línea original para que los diagnósticos coincidan
+        lexer = crear_lexer(InputStream(texto))
+        lexer.line = linea
+        parser = ExprParser(CommonTokenStream(lexer))
+        tree = parser.funcion()
+        walker.walk(listener, tree)
+        nodes.append(ASTBuilder().visit(tree))
+
+    if listener.errors:
+        return None, listener.errors, listener.warnings, listener.called_functions
+
+    generator = LLVMGenerator()
+    generator.module.name = f"lote.{nodes[0].name}"
+    for name, tipo in globales.items():
+        generator.declare_global(DeclarationNode(tipo, name, None))
+    for name, (return_type, params) in todas.items():
+        generator.declare_function(_firma_a_nodo(name, return_type, params))
+
+    return_types = {name: firma[0] for name, firma in todas.items()}
+    for node in nodes:
+        TypeAnnotator().annotate_function(node, return_types, globales)
+        generator._generate_function(node)
+
+    # Cada lote trae su copia del auxiliar concat: el enlazador conserva una sola
+    generator.module.get_global("concat").linkage = "linkonce_odr"
+    return str(generator.module), listener.errors, listener.warnings, listener.called_functions
+
+
+def _firma_a_nodo(name, return_type, params):
+    return FunctionNode(return_type, name, [ParameterNode(tipo, ident) for ident, tipo in params], None)
+
+
+# ========================
+# API PÚBLICA
+# ========================
+
+def compilar_paralelo(codigo, workers=None, lotes_por_worker=4):
+    """
+    Compila el programa repartiendo las funciones entre procesos.
+    Retorna (módulo llvmlite enlazado o None, errores, advertencias).
+    """
+    inicializar_llvm()
+    pre = prepasada(codigo)
+    if pre is None:
+        return _compilar_secuencial(codigo)
+
+    workers = workers or os.cpu_count() or 1
+    todas = {f.name: (f.return_type, f.params) for f in pre.firmas}
+
+    # Lotes contiguos: cada uno conoce las funciones definidas antes que él
+    tamano = max(1, -(-len(pre.firmas) // (workers * lotes_por_worker)))
+    lotes = [pre.firmas[i:i + tamano] for i in range(0, len(pre.firmas), tamano)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futuros = []
+        previas = {}
+        for lote in lotes:
+            futuros.append(pool.submit(_compilar_lote, [(f.texto, f.linea) for f in lote],
+                                       dict(previas), todas, pre.globales))
+            previas.update((f.name, todas[f.name]) for f in lote)
+
+        # En paralelo con los lotes: globales y bloque principal
+        tree = parsear(InputStream(pre.esqueleto))
+        listener = SemanticListener(check_unused_functions=False)
+        listener.predeclare(todas if pre.funciones_primero else {})
+        ParseTreeWalker().walk(listener, tree)
+
+        resultados = [futuro.result() for futuro in futuros]
+
+    errors, warnings, modulos = [], [], []
+    for ir_texto, lote_errors, lote_warnings, llamadas in resultados:
+        errors += lote_errors
+        warnings += lote_warnings
+        listener.called_functions |= llamadas
+        modulos.append(ir_texto)
+    # Las definiciones se recorrieron en los procesos: sus líneas vienen de la pre-pasada
+    for firma in pre.firmas:
+        listener.function_lines.setdefault(firma.name, firma.linea)
+    listener.warn_unused_functions()
+    errors += listener.errors
+    warnings += listener.warnings
+    if errors:
+        return None, errors, warnings
+
+    # Módulo principal: globales, declaraciones de funciones y main
+    ast = ASTBuilder().visit(tree)
+    ast.functions = [_firma_a_nodo(name, *firma) for name, firma in todas.items()]
+    TypeAnnotator().annotate(ast)
+    generator = LLVMGenerator()
+    generator._generate_globals(ast.globals)
+    for func in ast.functions:
+        generator.declare_function(func)
+    generator._generate_global_initializer()
+    generator._generate_main_function(ast.block)
+
+    module = llvm.parse_assembly(str(generator.module))
+    for ir_texto in modulos:
+        module.link_in(llvm.parse_assembly(ir_texto))
+    module.verify()
+    return module, errors, warnings
+
+
+def _compilar_secuencial(codigo):
+    tree = parsear(InputStream(codigo))
+    listener = analizar_semantica(tree)
+    if listener.errors:
+        return None, listener.errors, listener.warnings
+    ir_module = LLVMGenerator().generate(ASTBuilder().visit(tree))
+    return llvm.parse_assembly(str(ir_module)), listener.errors, listener.warnings
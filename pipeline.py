@@ -0,0 +1,87 @@
+#FLUJO COMPARTIDO DEL FRONTEND: FUENTE -> ARBOL -> SEMANTICA -> AST
+import os
+import time
+
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+from ExprParser import ExprParser
+from ast_builder import ASTBuilder
+from const_eval import evaluar_en_compilacion
+from dead_code import eliminar_codigo_muerto
+from dfa_cache import precargar
+from hand_parser import analizar_manual, elegir_frontend
+from inliner import expandir_en_linea
+from keyword_lexer import crear_lexer
+from SemanticListener import SemanticListener, SemanticError
+from type_annotator import TypeAnnotator
+
+
+def parsear(input_stream):
+    """Ejecuta lexer y parser sobre un stream y retorna el árbol de análisis"""
+    precargar()  # DFA de predicción guardado por dfa_cache.py, si existe
+    lexer = crear_lexer(input_stream)  # ExprLexer o KeywordTableLexer según COMPILADOR_LEXER
+    tokens = CommonTokenStream(lexer)
+    parser = ExprParser(tokens)
+    return parser.prog()
+
+
+def analizar_semantica(tree):
+    """Recorre el árbol con SemanticListener y retorna el listener"""
+    listener = SemanticListener()
+    ParseTreeWalker().walk(listener, tree)
+    return listener
+
+
+def construir_ast(codigo, frontend=None):
+    """
+    Convierte código fuente (texto) en AST validado y con tipos anotados.
+    frontend: 'antlr' o 'manual' (hand_parser.py); por defecto COMPILADOR_FRONTEND.
+    Lanza SemanticError con todos los errores si la validación falla
+    (hand_parser.ParseError, su subclase, si el frontend manual rechaza la sintaxis).
+    """
+    if elegir_frontend(frontend) == "manual":
+        ast, listener = analizar_manual(codigo)
+        if listener.errors:
+            raise SemanticError("\n".join(listener.errors))
+    else:
+        tree = parsear(InputStream(codigo))
+        listener = analizar_semantica(tree)
+        if listener.errors:
+            raise SemanticError("\n".join(listener.errors))
+        ast = ASTBuilder().visit(tree)
+    return TypeAnnotator().annotate(ast), listener
+
+
+# ========================
+# PASADAS SOBRE EL AST
+# ========================
+
+NIVEL_AST_POR_DEFECTO = 0
+
+
+def nivel_ast_por_defecto():
+    return int(os.environ.get("COMPILADOR_OPT_AST", NIVEL_AST_POR_DEFECTO))
+
+
+def optimizar_ast(ast, nivel=None, perfilado=False, tiempos=None):
+    """
+    Aplica al AST anotado las pasadas del nivel pedido (por defecto COMPILADOR_OPT_AST):
+    0 ninguna, 1 código muerto, 2 además evaluación en compilación y expansión en línea.
+    perfilado: el IR lleva contadores de perfil o se genera con uno (PGO). Evaluar y
+    expandir quitan llamadas y con ellas las entradas de función que cuenta el perfil,
+    así que se omiten.
+    Retorna {etapa: reporte de la pasada}; si se da 'tiempos', agrega los segundos de cada una.
+    """
+    nivel = nivel_ast_por_defecto() if nivel is None else nivel
+    pasadas = []
+    if nivel >= 2 and not perfilado:
+        pasadas += [("evaluacion", evaluar_en_compilacion), ("en_linea", expandir_en_linea)]
+    if nivel >= 1:
+        pasadas.append(("codigo_muerto", eliminar_codigo_muerto))
+
+    reportes = {}
+    for etapa, pasada in pasadas:
+        inicio = time.perf_counter()
+        reportes[etapa] = pasada(ast)
+        if tiempos is not None:
+            tiempos[etapa] = time.perf_counter() - inicio
+    return reportes
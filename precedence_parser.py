@@ -0,0 +1,69 @@
+#PARSER CON UNA SOLA REGLA DE PRECEDENCIA PARA LAS EXPRESIONES
+#En Expr.g4 cada nivel de precedencia es una regla: un literal suelto pasa por
+#doce contextos anidados (expr -> asignacion -> logicaOr -> logicaAnd -> igualdad
+#-> comparacion -> suma -> mult -> potencia -> unario -> llamada -> primary), y
+#ASTBuilder visita cada uno. ExprPrecedencia.g4 acepta el mismo lenguaje con
+#'expr' y una regla 'operacion' recursiva por la izquierda, que ANTLR resuelve
+#con un bucle de precedencia. PrecedenceASTBuilder construye sobre ese árbol el
+#mismo AST que ASTBuilder sobre el de Expr.g4 (nodos, operadores y líneas).
+#El análisis semántico (SemanticListener) sigue recorriendo el árbol de Expr.g4:
+#esta variante sólo reemplaza el camino fuente -> AST.
+from antlr4 import InputStream, CommonTokenStream
+
+from ExprPrecedencia import ExprPrecedencia
+from ast_builder import ASTBuilder, BinaryOpNode, UnaryOpNode, AssignmentNode, FunctionCallNode
+from keyword_lexer import crear_lexer
+
+
+def parsear_precedencia(input_stream):
+    """Ejecuta lexer y parser de ExprPrecedencia.g4 y retorna el árbol de análisis"""
+    parser = ExprPrecedencia(CommonTokenStream(crear_lexer(input_stream)))
+    return parser.prog()
+
+
+def construir_ast_precedencia(codigo):
+    """AST del código fuente (texto) sin análisis semántico ni anotación de tipos"""
+    return PrecedenceASTBuilder().visit(parsear_precedencia(InputStream(codigo)))
+
+
+# Las reglas de sentencias son las de Expr.g4: sólo cambian las de expresiones
+class PrecedenceASTBuilder(ASTBuilder):
+    def visitAsignacionExp(self, ctx: ExprPrecedencia.AsignacionExpContext):
+        name = ctx.ID().getText()
+        expr = self.visit(ctx.expr())
+        return AssignmentNode(name, expr)
+
+    def visitSoloExp(self, ctx: ExprPrecedencia.SoloExpContext):
+        return self.visit(ctx.operacion())
+
+    def _binaria(self, ctx):
+        left = self.visit(ctx.operacion(0))
+        right = self.visit(ctx.operacion(1))
+        return BinaryOpNode(left, ctx.getChild(1).getText(), right)
+
+    visitOpLogicaOR = _binaria
+    visitOpLogicaAND = _binaria
+    visitOpIgualdadDiferencia = _binaria
+    visitOpComparacion = _binaria
+    visitOpSumaResta = _binaria
+    visitOpMultDiv = _binaria
+    visitOpPotencia = _binaria
+
+    def visitOpUnario(self, ctx: ExprPrecedencia.OpUnarioContext):
+        operand = self.visit(ctx.operacion())
+        return UnaryOpNode(ctx.getChild(0).getText(), operand)
+
+    def visitLlamadaFuncion(self, ctx: ExprPrecedencia.LlamadaFuncionContext):
+        callee = ctx.operacion()
+        args = self.visitArgumentos(ctx.args()) if ctx.args() else []
+
+        # f(1)(2): en Expr.g4 es una sola 'llamada' y ASTBuilder junta los argumentos
+        if isinstance(callee, ExprPrecedencia.LlamadaFuncionContext):
+            node = self.visit(callee)
+            node.args += args
+            return node
+
+        name = callee.ID().getText() if isinstance(callee, ExprPrecedencia.VariableContext) else self.visit(callee)
+        return FunctionCallNode(name, args)
+
+# Fin del módulo precedence_parser.py
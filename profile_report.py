@@ -0,0 +1,91 @@
+#REPORTE DE PERFIL: PUNTOS CALIENTES CONTRA EL CODIGO FUENTE
+#Lee el archivo que escribe un programa compilado con instrumentación
+#(LLVMGenerator(profile_path=...)) y muestra las funciones, bucles y condiciones
+#más ejecutados junto a la línea de código correspondiente.
+#Uso: python profile_report.py programa.txt [programa.perfil] [--top=N]
+import os
+import sys
+
+
+class Sitio:
+    def __init__(self, kind, function, line, site):
+        self.kind = kind          # 'funcion', 'si', 'mientras', 'para' o 'hacer'
+        self.function = function  # función LLVM que contiene el punto ('main' = bloque Inicio)
+        self.line = line
+        self.site = site          # distingue construcciones iguales en la misma línea
+        self.counters = {}        # 'entradas' | 'iteraciones' | 'verdadero' | 'falso' -> valor
+
+    @property
+    def key(self):
+        return (self.kind, self.function, self.line, self.site)
+
+    @property
+    def total(self):
+        return sum(self.counters.values())
+
+
+def ruta_perfil(input_file):
+    """Archivo de perfil por defecto para un fuente: mismo nombre con extensión .perfil"""
+    return os.path.splitext(input_file)[0] + ".perfil"
+
+
+def leer_perfil(path):
+    """
+    Retorna {clave: Sitio}. Cada corrida del programa reescribe el archivo; si una
+    clave aparece más de una vez (perfiles de varias corridas concatenados) se suma.
+    """
+    sitios = {}
+    with open(path, encoding="utf-8") as f:
+        for linea in f:
+            if linea.startswith("#") or not linea.strip():
+                continue
+            kind, function, line, site, counter, value = linea.rstrip("\n").split("\t")
+            line = int(line) if line != "None" else None
+            key = (kind, function, line, int(site))
+            sitio = sitios.setdefault(key, Sitio(*key))
+            sitio.counters[counter] = sitio.counters.get(counter, 0) + int(value)
+    return sitios
+
+
+def _describir(sitio):
+    c = sitio.counters
+    if sitio.kind == "funcion":
+        return f"{c.get('entradas', 0)} llamadas"
+    if sitio.kind == "si":
+        verdadero, falso = c.get("verdadero", 0), c.get("falso", 0)
+        porcentaje = 100 * verdadero / (verdadero + falso) if verdadero + falso else 0
+        return f"{verdadero} verdadero / {falso} falso ({porcentaje:.0f}% tomado)"
+    return f"{c.get('iteraciones', 0)} iteraciones"
+
+
+def reporte(sitios, fuente=None, top=10):
+    """Imprime los 'top' sitios más ejecutados, con la línea de código si hay fuente"""
+    lineas = fuente.splitlines() if fuente else []
+    ordenados = sorted(sitios.values(), key=lambda s: s.total, reverse=True)[:top]
+    print(f"{'línea':>6} {'tipo':>9} {'función':>12}  conteo / código")
+    for sitio in ordenados:
+        print(f"{sitio.line if sitio.line is not None else '?':>6} {sitio.kind:>9} {sitio.function:>12}  {_describir(sitio)}")
+        if sitio.line and sitio.line <= len(lineas):
+            print(f"{'':>31}| {lineas[sitio.line - 1].strip()}")
+
+
+def main():
+    argumentos = [a for a in sys.argv[1:] if not a.startswith("--top")]
+    top = 10
+    for a in sys.argv[1:]:
+        if a.startswith("--top"):
+            top = int(a.split("=", 1)[1]) if "=" in a else top
+    if not argumentos:
+        print("Uso: python profile_report.py programa.txt [programa.perfil] [--top=N]")
+        return 1
+
+    input_file = argumentos[0]
+    path = argumentos[1] if len(argumentos) > 1 else ruta_perfil(input_file)
+    with open(input_file, encoding="utf-8") as f:
+        fuente = f.read()
+    reporte(leer_perfil(path), fuente, top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
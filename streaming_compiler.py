@@ -0,0 +1,293 @@
+#COMPILACION EN FLUJO CON POCA MEMORIA PARA FUENTES MUY GRANDES
+#El flujo normal mantiene vivos a la vez el texto, todos los tokens, el árbol de
+#análisis completo y el AST hasta que termina LLVMGenerator. Aquí:
+#1. El archivo se lee a través de un mapa de memoria (MappedFileStream): el lexer
+#   pide bytes al mapa y no se arma la lista de caracteres de todo el archivo.
+#2. La pre-pasada recorre los tokens de a uno (sin CommonTokenStream) y guarda
+#   sólo firmas, globales y la posición de cada función en el archivo.
+#3. Las funciones se analizan y se generan en orden, por lotes de pocos bytes de
+#   fuente: árbol, AST e IR de llvmlite de un lote se descartan apenas su módulo
+#   se enlaza al resultado (que vive en LLVM, no en objetos de Python).
+#Los diagnósticos son los mismos que en parallel_compiler.py: las funciones se
+#recorren en orden con un solo SemanticListener, que conoce las anteriores.
+import gc
+import mmap
+
+import llvmlite.binding as llvm
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker, Token
+
+from ExprLexer import ExprLexer
+from ExprParser import ExprParser
+from ast_builder import (
+    ASTNode,
+    ASTBuilder,
+    DeclarationNode,
+    VariableNode,
+    AssignmentNode,
+    FunctionCallNode,
+)
+from dfa_cache import precargar
+from ir_generator import LLVMGenerator
+from keyword_lexer import crear_lexer
+from llvm_init import inicializar_llvm
+from parallel_compiler import TIPOS, _compilar_secuencial, _firma_a_nodo
+from pipeline import parsear
+from SemanticListener import SemanticListener
+from type_annotator import TypeAnnotator
+
+BYTES_POR_LOTE = 256 * 1024  # fuente de funciones analizada y generada de una vez
+
+
+class MappedFileStream(InputStream):
+    """
+    InputStream sobre un archivo mapeado en memoria. Las posiciones son bytes:
+    fuera de cadenas y comentarios la gramática sólo acepta ASCII, así que un
+    token nunca corta un carácter UTF-8 y getText decodifica sólo su tramo.
+    """
+
+    def __init__(self, ruta):
+        self.name = ruta
+        self._index = 0
+        with open(ruta, "rb") as f:
+            # mmap no acepta archivos vacíos
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if f.seek(0, 2) else b""
+        self._size = len(self.data)
+
+    def getText(self, start, stop):
+        return self.data[start:stop + 1].decode("utf-8")
+
+    def __str__(self):
+        return self.getText(0, self._size - 1)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+
+class FuncionEnFuente:
+    def __init__(self, name, return_type, params, inicio, fin, linea):
+        self.name = name
+        self.return_type = return_type
+        self.params = params    # [(identificador, tipo)]
+        self.inicio = inicio    # primer byte de la función en el archivo
+        self.fin = fin          # byte siguiente a la llave que la cierra
+        self.linea = linea      # línea donde empieza
+
+
+# ========================
+# PRE-PASADA SOBRE TOKENS
+# ========================
+
+def _tokens(stream):
+    lexer = crear_lexer(stream)
+    while True:
+        tok = lexer.nextToken()
+        yield tok
+        if tok.type == Token.EOF:
+            return
+
+
+def _escanear(stream):
+    """
+    Como parallel_compiler.prepasada, pero sin guardar los tokens.
+    Retorna (funciones, globales, sección 'funciones' (inicio, fin, saltos de línea)
+    o None, funciones_primero). Lanza ValueError si la estructura no es la esperada.
+    """
+    tokens = _tokens(stream)
+    globales = {}
+    vio_inicio = False
+    profundidad = 0
+    anterior = None
+    for tok in tokens:
+        if tok.type == ExprLexer.LLAVE_IZQ:
+            profundidad += 1
+        elif tok.type == ExprLexer.LLAVE_DER:
+            profundidad -= 1
+        elif profundidad == 1 and tok.type == ExprLexer.INICIO:
+            vio_inicio = True
+        elif profundidad == 1 and tok.text == 'funciones':
+            funciones, cierre = _leer_funciones(tokens)
+            return funciones, globales, (tok.start, cierre.stop + 1, cierre.line - tok.line), not vio_inicio
+        elif profundidad == 1 and tok.type == ExprLexer.ID and anterior is not None and anterior.type in TIPOS:
+            globales[tok.text] = TIPOS[anterior.type]
+        anterior = tok
+    return [], globales, None, False
+
+
+def _leer_funciones(tokens):
+    def siguiente():
+        tok = next(tokens)
+        if tok.type == Token.EOF:
+            raise ValueError("Fin de archivo dentro de la sección 'funciones'")
+        return tok
+
+    def esperar(tipo):
+        tok = siguiente()
+        if tok.type != tipo:
+            raise ValueError(f"Token inesperado '{tok.text}' en la línea {tok.line}")
+        return tok
+
+    esperar(ExprLexer.LLAVE_IZQ)
+    funciones = []
+    while True:
+        primero = siguiente()
+        if primero.type == ExprLexer.LLAVE_DER:
+            return funciones, primero
+        if primero.type not in TIPOS:
+            raise ValueError(f"Se esperaba un tipo en la línea {primero.line}")
+        name = esperar(ExprLexer.ID).text
+        esperar(ExprLexer.PAR_IZQ)
+        params = []
+        tok = siguiente()
+        while tok.type != ExprLexer.PAR_DER:
+            if params:
+                if tok.type != ExprLexer.COMA:
+                    raise ValueError(f"Token inesperado '{tok.text}' en la línea {tok.line}")
+                tok = siguiente()
+            if tok.type not in TIPOS:
+                raise ValueError(f"Se esperaba un tipo en la línea {tok.line}")
+            params.append((esperar(ExprLexer.ID).text, TIPOS[tok.type]))
+            tok = siguiente()
+
+        # Cuerpo: llaves balanceadas
+        esperar(ExprLexer.LLAVE_IZQ)
+        profundidad = 1
+        while profundidad:
+            tok = siguiente()
+            if tok.type == ExprLexer.LLAVE_IZQ:
+                profundidad += 1
+            elif tok.type == ExprLexer.LLAVE_DER:
+                profundidad -= 1
+        funciones.append(FuncionEnFuente(name, TIPOS[primero.type], params,
+                                         primero.start, tok.stop + 1, primero.line))
+
+
+# ========================
+# GENERACION POR LOTES
+# ========================
+
+def _nombres_usados(node, names):
+    """Funciones llamadas y variables nombradas en el subárbol"""
+    if isinstance(node, FunctionCallNode):
+        names.add(node.name)
+    elif isinstance(node, (VariableNode, AssignmentNode)):
+        names.add(node.name)
+    for value in vars(node).values():
+        for item in (value if isinstance(value, list) else [value]):
+            if isinstance(item, ASTNode):
+                _nombres_usados(item, names)
+    return names
+
+
+def _generar_lote(nodes, firmas, return_types, globales):
+    """
+    IR de un lote de funciones ya validadas, como módulo binario. Sólo declara las
+    globales y funciones que el lote usa: con miles de funciones, declararlas todas
+    en cada lote haría crecer el trabajo con el cuadrado del programa.
+    """
+    usados = set()
+    for node in nodes:
+        _nombres_usados(node, usados)
+    generator = LLVMGenerator()
+    generator.module.name = f"flujo.{nodes[0].name}"
+    for name in sorted(usados & globales.keys()):
+        generator.declare_global(DeclarationNode(globales[name], name, None))
+    for name in sorted(usados & firmas.keys()):
+        generator.declare_function(_firma_a_nodo(name, *firmas[name]))
+
+    for node in nodes:
+        TypeAnnotator().annotate_function(node, return_types, globales)
+        generator._generate_function(node)
+
+    # Cada lote trae su copia del auxiliar concat: el enlazador conserva una sola
+    generator.module.get_global("concat").linkage = "linkonce_odr"
+    return llvm.parse_assembly(str(generator.module))
+
+
+# ========================
+# API PÚBLICA
+# ========================
+
+def compilar_en_flujo(ruta, bytes_por_lote=BYTES_POR_LOTE):
+    """
+    Compila el archivo 'ruta' función por función.
+    Retorna (módulo llvmlite.binding o None, errores, advertencias).
+    """
+    inicializar_llvm()
+    precargar()
+    stream = MappedFileStream(ruta)
+    try:
+        try:
+            funciones, globales, seccion, funciones_primero = _escanear(stream)
+        except (StopIteration, ValueError):
+            return _compilar_secuencial(str(stream))
+        return _compilar(stream, funciones, globales, seccion, funciones_primero, bytes_por_lote)
+    finally:
+        stream.close()
+
+
+def _compilar(stream, funciones, globales, seccion, funciones_primero, bytes_por_lote):
+    firmas = {f.name: (f.return_type, f.params) for f in funciones}
+    return_types = {name: firma[0] for name, firma in firmas.items()}
+
+    # Globales y bloque principal: el archivo con la sección 'funciones' vacía,
+    # con los mismos saltos de línea para conservar la numeración
+    if seccion is None:
+        esqueleto = str(stream)
+    else:
+        inicio, fin, saltos = seccion
+        esqueleto = (stream.getText(0, inicio - 1) + "funciones {" + "\n" * saltos + "}"
+                     + stream.getText(fin, stream.size - 1))
+    tree = parsear(InputStream(esqueleto))
+    principal = SemanticListener(check_unused_functions=False)
+    principal.predeclare(firmas if funciones_primero else {})
+    ParseTreeWalker().walk(principal, tree)
+
+    listener = SemanticListener(check_unused_functions=False)
+    listener.predeclare(None, globales)
+    walker = ParseTreeWalker()
+    module = None
+    lote, tamano = [], 0
+    for funcion in funciones:
+        # El lexer arranca en la línea original para que los diagnósticos coincidan
+        lexer = crear_lexer(InputStream(stream.getText(funcion.inicio, funcion.fin - 1)))
+        lexer.line = funcion.linea
+        subtree = ExprParser(CommonTokenStream(lexer)).funcion()
+        walker.walk(listener, subtree)
+        listener.expr_types.clear()  # memo por contexto: retendría cada árbol
+        if not listener.errors:
+            lote.append(ASTBuilder().visit(subtree))
+            tamano += funcion.fin - funcion.inicio
+        del subtree, lexer
+        if lote and (tamano >= bytes_por_lote or funcion is funciones[-1]):
+            parte = _generar_lote(lote, firmas, return_types, globales)
+            if module is None:
+                module = parte
+            else:
+                module.link_in(parte)
+            lote, tamano = [], 0
+            gc.collect()  # los árboles de ANTLR tienen ciclos (parentCtx)
+
+    listener.called_functions |= principal.called_functions
+    listener.warn_unused_functions()
+    errors = listener.errors + principal.errors
+    warnings = listener.warnings + principal.warnings
+    if errors:
+        return None, errors, warnings
+
+    # Módulo principal: globales, declaraciones de funciones y main
+    ast = ASTBuilder().visit(tree)
+    ast.functions = [_firma_a_nodo(name, *firma) for name, firma in firmas.items()]
+    TypeAnnotator().annotate(ast)
+    generator = LLVMGenerator()
+    generator._generate_globals(ast.globals)
+    for func in ast.functions:
+        generator.declare_function(func)
+    generator._generate_global_initializer()
+    generator._generate_main_function(ast.block)
+
+    principal_module = llvm.parse_assembly(str(generator.module))
+    if module is not None:
+        principal_module.link_in(module)
+    principal_module.verify()
+    return principal_module, errors, warnings
@@ -0,0 +1,58 @@
+#TABLA DE SIMBOLOS CON AMBITOS ANIDADOS
+#Cada nombre tiene su propia pila de enlaces (profundidad, valor): la cima es
+#siempre la declaración visible, así que declarar, buscar y detectar sombreado
+#cuestan O(1). Salir de un ámbito solo recorre los nombres declarados en él.
+#La usan tanto SemanticListener (metadatos de variables) como LLVMGenerator
+#(punteros a variables).
+
+
+class SymbolTable:
+    def __init__(self):
+        self._bindings = {}   # nombre -> [(profundidad, valor), ...]
+        self._scopes = [{}]   # por ámbito: nombre -> valor, en orden de declaración
+
+    @property
+    def depth(self):
+        """Profundidad del ámbito actual (0 = global)"""
+        return len(self._scopes) - 1
+
+    def enter_scope(self):
+        self._scopes.append({})
+
+    def exit_scope(self):
+        """Cierra el ámbito actual y retorna sus símbolos (nombre -> valor)"""
+        scope = self._scopes.pop()
+        for name in scope:
+            stack = self._bindings[name]
+            stack.pop()
+            if not stack:
+                del self._bindings[name]
+        return scope
+
+    def declare(self, name, value):
+        """
+        Declara 'name' en el ámbito actual (redeclarar en el mismo ámbito lo reemplaza).
+        Retorna el valor que queda oculto en un ámbito exterior, o None.
+        """
+        depth = self.depth
+        stack = self._bindings.setdefault(name, [])
+        if stack and stack[-1][0] == depth:
+            stack[-1] = (depth, value)
+            shadowed = stack[-2][1] if len(stack) > 1 else None
+        else:
+            shadowed = stack[-1][1] if stack else None
+            stack.append((depth, value))
+        self._scopes[-1][name] = value
+        return shadowed
+
+    def lookup(self, name):
+        """Valor visible para 'name' o None si no está declarado"""
+        stack = self._bindings.get(name)
+        return stack[-1][1] if stack else None
+
+    def lookup_local(self, name):
+        """Valor de 'name' solo si fue declarado en el ámbito actual"""
+        return self._scopes[-1].get(name)
+
+    def __contains__(self, name):
+        return name in self._bindings
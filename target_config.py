@@ -0,0 +1,93 @@
+#CONFIGURACION DEL DESTINO (TRIPLE, CPU, FEATURES Y DATA LAYOUT)
+#Por defecto el código se genera para la máquina actual: triple del proceso,
+#CPU detectada y todas sus features (AVX2, AVX-512, ...). Así opt, llc, lli y
+#los pases de llvmlite usan los modelos de costo reales y pueden vectorizar.
+#Para compilación cruzada se indica el triple (y opcionalmente CPU y features)
+#al construir TargetConfig, o con las variables de entorno COMPILADOR_TRIPLE,
+#COMPILADOR_CPU y COMPILADOR_FEATURES para todos los puntos de entrada.
+import os
+
+import llvmlite.binding as llvm
+
+from llvm_init import inicializar_llvm, inicializar_todos_los_targets
+
+_por_defecto = None
+_host = None
+
+
+class TargetConfig:
+    def __init__(self, triple=None, cpu=None, features=None):
+        """None en cada campo = el valor de la máquina actual (o genérico si el triple es otro)"""
+        inicializar_llvm()
+        host = llvm.get_process_triple()
+        self.triple = host if triple is None else triple
+        self.es_host = self.triple == host
+        if self.es_host:
+            self.cpu = llvm.get_host_cpu_name() if cpu is None else cpu
+            self.features = llvm.get_host_cpu_features().flatten() if features is None else features
+        else:
+            inicializar_todos_los_targets()
+            self.cpu = cpu or ""  # CPU genérica del target
+            self.features = features or ""
+        self._target = llvm.Target.from_triple(self.triple)
+        self._maquinas = {}
+
+    @classmethod
+    def host(cls):
+        """Configuración de la máquina actual, compartida por todo el proceso (JIT)"""
+        global _host
+        if _host is None:
+            _host = cls()
+        return _host
+
+    def __repr__(self):
+        return f"TargetConfig(triple={self.triple!r}, cpu={self.cpu!r}, features={len(self.features.split(',')) if self.features else 0})"
+
+    def target_machine(self, opt_level=2, reloc="default", codemodel="jitdefault"):
+        """TargetMachine para este destino; se crea una vez por combinación de opciones"""
+        clave = (opt_level, reloc, codemodel)
+        if clave not in self._maquinas:
+            self._maquinas[clave] = self.nueva_target_machine(opt_level, reloc, codemodel)
+        return self._maquinas[clave]
+
+    def nueva_target_machine(self, opt_level=2, reloc="default", codemodel="jitdefault"):
+        """TargetMachine propia (p. ej. una por hilo: LLVM no garantiza compartirlas al emitir)"""
+        return self._target.create_target_machine(cpu=self.cpu, features=self.features, opt=opt_level,
+                                                  reloc=reloc, codemodel=codemodel)
+
+    @property
+    def data_layout(self):
+        return str(self.target_machine().target_data)
+
+    def aplicar(self, module):
+        """Fija triple y data layout en un módulo (llvmlite.ir o llvmlite.binding)"""
+        module.triple = self.triple
+        module.data_layout = self.data_layout
+        return module
+
+    def argumentos_herramientas(self):
+        """Opciones equivalentes para opt, llc y lli"""
+        argumentos = [f"-mtriple={self.triple}"]
+        if self.cpu:
+            argumentos.append(f"-mcpu={self.cpu}")
+        if self.features:
+            argumentos.append(f"-mattr={self.features}")
+        return argumentos
+
+    def huella(self):
+        """Identifica el código máquina que produce este destino (claves de caché)"""
+        return f"{self.triple}|{self.cpu}|{self.features}"
+
+
+def configuracion_por_defecto():
+    """Host, salvo que COMPILADOR_TRIPLE / COMPILADOR_CPU / COMPILADOR_FEATURES digan otra cosa"""
+    global _por_defecto
+    if _por_defecto is None:
+        triple = os.environ.get("COMPILADOR_TRIPLE")
+        cpu = os.environ.get("COMPILADOR_CPU")
+        features = os.environ.get("COMPILADOR_FEATURES")
+        if triple is None and cpu is None and features is None:
+            _por_defecto = TargetConfig.host()
+        else:
+            _por_defecto = TargetConfig(triple, cpu, features)
+    return _por_defecto
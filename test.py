@@ -1,12 +1,9 @@
 import time
 import os
 import subprocess
-from antlr4 import FileStream, CommonTokenStream, ParseTreeWalker
-from ExprLexer import ExprLexer
-from ExprParser import ExprParser
-from ast_builder import ASTBuilder
-from ir_generator import LLVMGenerator
-from SemanticListener import SemanticListener
+# antlr4, llvmlite y cada etapa del compilador se importan dentro de la opción
+# que los usa: el menú aparece sin pagar su carga (ver benchmarks/bench_arranque.py)
+from profile_report import leer_perfil, reporte, ruta_perfil
 from SintacticValidacion import (
     validar_punto_y_coma,
     validar_parentesis,
@@ -19,10 +16,15 @@ def mostrar_menu():
     print("1. Ejecutar flujo completo con optimización (opt)")
     print("2. Ejecutar flujo completo sin optimización")
     print("3. Solo generar código LLVM IR (.ll)")
-    print("4. Compilar desde un .ll optimizado manualmente")
+    print("4. Compilar desde un .ll o .bc optimizado manualmente")
     print("5. Renombrar binario a .exe")
     print("6. Comparar desempeño entre variantes (-O1, -O2, -O3, sin optimizar, manual)")
-    print("7. Salir")
+    print("7. Generar LLVM IR en paralelo por función (programas grandes)")
+    print("8. Compilar ejecutable nativo con backend paralelo (objetos por partición)")
+    print("9. Compilar con contadores de perfil, ejecutar y mostrar puntos calientes")
+    print("10. Compilar con PGO usando el perfil de la opción 9 (opt -O2) y ejecutar")
+    print("11. Compilar en flujo con poca memoria (fuentes muy grandes) y ejecutar")
+    print("12. Salir")
 
 def validar_sintaxis(input_file):
     errores = []
@@ -32,17 +34,40 @@ def validar_sintaxis(input_file):
     errores.extend(validar_nombres_variables(input_file))
     return errores
 
-def generar_llvm(input_file, for_windows_exe=False):
-    input_stream = FileStream(input_file, encoding='utf-8')
-    lexer = ExprLexer(input_stream)
-    token_stream = CommonTokenStream(lexer)
-    parser = ExprParser(token_stream)
-    tree = parser.prog()
-
-    print("[INFO] Validando semánticamente...")
-    walker = ParseTreeWalker()
-    listener = SemanticListener()
-    walker.walk(listener, tree)
+def generar_llvm(input_file, for_windows_exe=False, profile_path=None, pgo_profile=None, nivel_ast=None):
+    from hand_parser import elegir_frontend
+
+    tree = None
+    if elegir_frontend() == "manual":
+        # Lexer y parser escritos a mano (COMPILADOR_FRONTEND=manual)
+        from hand_parser import ParseError, analizar_manual
+        print("[INFO] Validando semánticamente...")
+        try:
+            with open(input_file, encoding='utf-8') as f:
+                ast, listener = analizar_manual(f.read())
+        except ParseError as e:
+            print("\n[ERRORES SINTÁCTICOS DETECTADOS]")
+            for error in e.errors:
+                print("  -", error)
+            return None
+    else:
+        from antlr4 import FileStream, CommonTokenStream, ParseTreeWalker
+        from ExprParser import ExprParser
+        from SemanticListener import SemanticListener
+        from dfa_cache import precargar
+        from keyword_lexer import crear_lexer
+
+        precargar()
+        input_stream = FileStream(input_file, encoding='utf-8')
+        lexer = crear_lexer(input_stream)
+        token_stream = CommonTokenStream(lexer)
+        parser = ExprParser(token_stream)
+        tree = parser.prog()
+
+        print("[INFO] Validando semánticamente...")
+        walker = ParseTreeWalker()
+        listener = SemanticListener()
+        walker.walk(listener, tree)
 
     if listener.errors:
         print("\n[ERRORES SEMÁNTICOS DETECTADOS]")
@@ -57,25 +82,101 @@ def generar_llvm(input_file, for_windows_exe=False):
 
     print("[INFO] Validación semántica completada sin errores.")
 
-    ast_builder = ASTBuilder()
-    ast = ast_builder.visit(tree)
+    from ast_builder import ASTBuilder
+    from ir_generator import LLVMGenerator
+    from pipeline import optimizar_ast
+    if tree is not None:
+        ast_builder = ASTBuilder()
+        ast = ast_builder.visit(tree)
     if not ast:
         print("[ERROR] El árbol de sintaxis abstracta (AST) es None.")
         return None
 
+    # Pasadas sobre el AST según COMPILADOR_OPT_AST; con perfil no se evalúa ni expande
+    reportes = optimizar_ast(ast, nivel_ast, perfilado=bool(profile_path or pgo_profile))
+    evaluado = reportes.get("evaluacion")
+    if evaluado:
+        print("\n[EVALUADO EN COMPILACIÓN]")
+        for linea in evaluado:
+            print("  -", linea)
+
+    expandido = reportes.get("en_linea")
+    if expandido:
+        print(f"[INFO] {len(expandido)} llamadas expandidas en línea.")
+
+    eliminado = reportes.get("codigo_muerto")
+    if eliminado:
+        print("\n[CÓDIGO MUERTO ELIMINADO]")
+        for linea in eliminado:
+            print("  -", linea)
+
     print("[INFO] Generando código LLVM...")
-    llvm_gen = LLVMGenerator(for_windows_exe=for_windows_exe)
+    llvm_gen = LLVMGenerator(for_windows_exe=for_windows_exe, profile_path=profile_path, pgo_profile=pgo_profile)
     return llvm_gen.generate(ast)
 
+def generar_llvm_paralelo(input_file, workers=None):
+    from parallel_compiler import compilar_paralelo
+    print(f"[INFO] Validando y generando código LLVM en paralelo ({workers or os.cpu_count()} procesos)...")
+    with open(input_file, encoding='utf-8') as f:
+        codigo = f.read()
+    module, errores, advertencias = compilar_paralelo(codigo, workers)
+
+    if errores:
+        print("\n[ERRORES SEMÁNTICOS DETECTADOS]")
+        for error in errores:
+            print("  -", error)
+        return None
+
+    if advertencias:
+        print("\n[ADVERTENCIAS]")
+        for warning in advertencias:
+            print("  -", warning)
+
+    return module
+
+def generar_llvm_en_flujo(input_file):
+    from streaming_compiler import compilar_en_flujo
+    print("[INFO] Validando y generando código LLVM en flujo, función por función...")
+    module, errores, advertencias = compilar_en_flujo(input_file)
+
+    if errores:
+        print("\n[ERRORES SEMÁNTICOS DETECTADOS]")
+        for error in errores:
+            print("  -", error)
+        return None
+
+    if advertencias:
+        print("\n[ADVERTENCIAS]")
+        for warning in advertencias:
+            print("  -", warning)
+
+    return module
+
 def guardar_llvm(module, path):
     with open(path, "w") as f:
         f.write(str(module))
     print(f"[INFO] Código LLVM guardado en {path}")
 
-def ejecutar_con_lli(output_ll):
-    print(f"[INFO] Ejecutando {output_ll} con lli...")
+def guardar_bitcode(module, path):
+    """Bitcode para lli/opt/llc: más chico y rápido de leer que el .ll; retorna el módulo binario"""
+    from module_io import guardar_bitcode as escribir_bitcode
+    module = escribir_bitcode(module, path)
+    print(f"[INFO] Bitcode LLVM guardado en {path}")
+    return module
+
+def optimizar_bitcode(entrada, nivel, salida):
+    """opt de bitcode a bitcode: ninguna de las dos puntas pasa por texto"""
+    subprocess.run(["opt", nivel, *argumentos_destino(), entrada, "-o", salida])
+
+def argumentos_destino(target=None):
+    """-mtriple/-mcpu/-mattr del destino (host por defecto) para opt, llc y lli"""
+    from target_config import configuracion_por_defecto
+    return (target or configuracion_por_defecto()).argumentos_herramientas()
+
+def ejecutar_con_lli(archivo):
+    print(f"[INFO] Ejecutando {archivo} con lli...")
     exec_start = time.time()
-    subprocess.run(["lli", output_ll])
+    subprocess.run(["lli", *argumentos_destino(), archivo])
     exec_end = time.time()
     duration = exec_end - exec_start
     print(f"[INFO] Tiempo de ejecución con lli: {duration:.2f} segundos")
@@ -102,23 +203,23 @@ def ejecutar_opcion_6():
         return
 
     base = os.path.splitext(input_file)[0]
-    output_ll = f"{base}.ll"
-    guardar_llvm(module, output_ll)
+    output_bc = f"{base}.bc"
+    guardar_bitcode(module, output_bc)
 
     tiempos = {}
 
     for nivel in ["-O1", "-O2", "-O3"]:
-        opt_file = f"{base}_opt{nivel}.ll"
+        opt_file = f"{base}_opt{nivel}.bc"
         print(f"\n[{nivel}] Aplicando optimización y ejecutando...")
-        subprocess.run(["opt", nivel, output_ll, "-o", opt_file])
+        optimizar_bitcode(output_bc, nivel, opt_file)
         tiempos[nivel] = ejecutar_con_lli(opt_file)
 
     print("\n[SIN OPTIMIZACIÓN] Ejecutando...")
-    tiempos["sin_opt"] = ejecutar_con_lli(output_ll)
+    tiempos["sin_opt"] = ejecutar_con_lli(output_bc)
 
-    print("\n[MANUAL] Ejecutando .ll optimizado manualmente...")
-    manual_file = input("Ingrese archivo .ll optimizado manualmente (opcional): ").strip()
-    if manual_file and not manual_file.endswith('.ll'):
+    print("\n[MANUAL] Ejecutando .ll/.bc optimizado manualmente...")
+    manual_file = input("Ingrese archivo .ll o .bc optimizado manualmente (opcional): ").strip()
+    if manual_file and not manual_file.endswith(('.ll', '.bc')):
         manual_file += '.ll'
     if manual_file and os.path.exists(manual_file):
         tiempos["manual"] = ejecutar_con_lli(manual_file)
@@ -153,8 +254,8 @@ def ejecutar_opcion_1():
         return
 
     base = os.path.splitext(input_file)[0]
-    output_ll = f"{base}.ll"
-    guardar_llvm(module, output_ll)
+    output_bc = f"{base}.bc"
+    guardar_bitcode(module, output_bc)
 
     print("\nSeleccione nivel de optimización:")
     print("1. -O1\n2. -O2\n3. -O3")
@@ -165,8 +266,8 @@ def ejecutar_opcion_1():
     elif opt_opcion == "3":
         nivel = "-O3"
 
-    opt_output = f"{base}_opt{nivel}.ll"
-    subprocess.run(["opt", nivel, output_ll, "-o", opt_output])
+    opt_output = f"{base}_opt{nivel}.bc"
+    optimizar_bitcode(output_bc, nivel, opt_output)
     ejecutar_con_lli(opt_output)
 
 def ejecutar_opcion_2():
@@ -188,9 +289,9 @@ def ejecutar_opcion_2():
     if not module:
         return
 
-    output_ll = os.path.splitext(input_file)[0] + ".ll"
-    guardar_llvm(module, output_ll)
-    ejecutar_con_lli(output_ll)
+    output_bc = os.path.splitext(input_file)[0] + ".bc"
+    guardar_bitcode(module, output_bc)
+    ejecutar_con_lli(output_bc)
 
 def ejecutar_opcion_3():
     input_file = input("Ingrese el archivo fuente (.txt): ").strip()
@@ -215,8 +316,8 @@ def ejecutar_opcion_3():
     guardar_llvm(module, output_ll)
 
 def ejecutar_opcion_4():
-    input_ll = input("Ingrese el archivo .ll optimizado manualmente: ").strip()
-    if not input_ll.endswith('.ll'):
+    input_ll = input("Ingrese el archivo .ll (o .bc) optimizado manualmente: ").strip()
+    if not input_ll.endswith(('.ll', '.bc')):
         input_ll += '.ll'
     if not os.path.exists(input_ll):
         print("[ERROR] Archivo no encontrado.")
@@ -225,46 +326,51 @@ def ejecutar_opcion_4():
 
 
 def ejecutar_opcion_5():
-    input_ll = input("Ingrese el archivo LLVM (.ll) a compilar para Windows: ").strip()
-    if not input_ll.endswith('.ll'):
+    from ir_generator import WINDOWS_TRIPLE
+    from target_config import TargetConfig
+    input_ll = input("Ingrese el archivo LLVM (.ll o .bc) a compilar para Windows: ").strip()
+    if not input_ll.endswith(('.ll', '.bc')):
         input_ll += '.ll'
 
-    if not os.path.exists(input_ll):
-        print("[ERROR] Archivo .ll no encontrado.")
-        return
-
-    # Primero generamos el código LLVM con la pausa habilitada
-    input_file = input_ll.replace('.ll', '.txt')  # Asumiendo que el fuente es .txt
-    if os.path.exists(input_file):
-        print("[INFO] Regenerando código LLVM con pausa para Windows...")
-        module = generar_llvm(input_file, for_windows_exe=True)  # <-- Aquí el cambio
-        if module:
-            guardar_llvm(module, input_ll)  # Sobreescribimos el .ll con la versión con pausa
-    else:
-        print("[INFO] No se encontró el archivo fuente .txt, usando .ll directamente")
-
-    # Resto del código de compilación a .exe (se mantiene igual)
     output_base = os.path.splitext(input_ll)[0]
+    input_file = output_base + ".txt"  # Asumiendo que el fuente es .txt
     output_obj = output_base + ".o"
     output_exe = output_base + ".exe"
+    destino = TargetConfig(WINDOWS_TRIPLE)
 
-    print("[INFO] Generando archivo objeto en formato Windows con llc...")
-    result_llc = subprocess.run(
-        [
-            "llc",
-            "-mtriple=x86_64-pc-windows-gnu",  # Especifica el triplete objetivo
-            "-filetype=obj",
-            input_ll,
-            "-o", output_obj
-        ],
-        capture_output=True,
-        text=True
-    )
-    
-    if result_llc.returncode != 0:
-        print("[ERROR] Falló la compilación con llc:")
-        print(result_llc.stderr)
+    if not os.path.exists(input_ll) and not os.path.exists(input_file):
+        print("[ERROR] Archivo .ll no encontrado.")
         return
+
+    if os.path.exists(input_file):
+        # Con el fuente se genera el código con la pausa y se emite el objeto desde
+        # el módulo en memoria: ni se sobreescribe el .ll ni se vuelve a leer con llc
+        from module_io import emitir_objeto
+        print("[INFO] Generando código LLVM con pausa para Windows...")
+        module = generar_llvm(input_file, for_windows_exe=True)
+        if not module:
+            return
+        print("[INFO] Generando archivo objeto en formato Windows...")
+        with open(output_obj, "wb") as f:
+            f.write(emitir_objeto(module, destino))
+    else:
+        print("[INFO] No se encontró el archivo fuente .txt, compilando el archivo con llc")
+        result_llc = subprocess.run(
+            [
+                "llc",
+                *argumentos_destino(destino),  # Triple, CPU y features del destino
+                "-filetype=obj",
+                input_ll,
+                "-o", output_obj
+            ],
+            capture_output=True,
+            text=True
+        )
+
+        if result_llc.returncode != 0:
+            print("[ERROR] Falló la compilación con llc:")
+            print(result_llc.stderr)
+            return
     if not os.path.exists(output_obj):
         print("[ERROR] El archivo objeto no se generó.")
         return
@@ -294,6 +400,123 @@ def ejecutar_opcion_5():
 
 
 
+def ejecutar_opcion_7():
+    input_file = input("Ingrese el archivo fuente (.txt): ").strip()
+    if not input_file.endswith('.txt'):
+        input_file += '.txt'
+    if not os.path.exists(input_file):
+        print("[ERROR] Archivo no encontrado.")
+        return
+
+    workers = input("Número de procesos (Enter = todos los núcleos): ").strip()
+    inicio = time.time()
+    module = generar_llvm_paralelo(input_file, int(workers) if workers.isdigit() else None)
+    if not module:
+        return
+    print(f"[INFO] Compilación paralela completada en {time.time() - inicio:.2f} segundos")
+
+    output_ll = os.path.splitext(input_file)[0] + ".ll"
+    guardar_llvm(module, output_ll)
+
+def ejecutar_opcion_8():
+    input_file = input("Ingrese el archivo fuente (.txt): ").strip()
+    if not input_file.endswith('.txt'):
+        input_file += '.txt'
+    if not os.path.exists(input_file):
+        print("[ERROR] Archivo no encontrado.")
+        return
+
+    workers = input("Número de hilos (Enter = todos los núcleos): ").strip()
+    workers = int(workers) if workers.isdigit() else None
+    module = generar_llvm_paralelo(input_file, workers)
+    if not module:
+        return
+
+    from parallel_backend import compilar_objetos, enlazar_ejecutable
+    print("[INFO] Optimizando y emitiendo objetos por partición...")
+    objetos, segundos = compilar_objetos(module, workers)
+    print(f"[INFO] {len(objetos)} objetos generados en {segundos:.2f} segundos")
+
+    output_bin = os.path.splitext(input_file)[0]
+    try:
+        enlazar_ejecutable(objetos, output_bin)
+    except RuntimeError as e:
+        print(f"[ERROR] {e}")
+        return
+    print(f"[ÉXITO] Ejecutable generado: {output_bin}")
+    subprocess.run([os.path.abspath(output_bin)])
+
+
+def ejecutar_opcion_9():
+    input_file = input("Ingrese el archivo fuente (.txt): ").strip()
+    if not input_file.endswith('.txt'):
+        input_file += '.txt'
+    if not os.path.exists(input_file):
+        print("[ERROR] Archivo no encontrado.")
+        return
+
+    perfil = os.path.abspath(ruta_perfil(input_file))
+    module = generar_llvm(input_file, profile_path=perfil)
+    if not module:
+        return
+
+    output_bc = os.path.splitext(input_file)[0] + "_perfil.bc"
+    guardar_bitcode(module, output_bc)
+    ejecutar_con_lli(output_bc)
+    if not os.path.exists(perfil):
+        print("[ERROR] El programa no escribió el archivo de perfil.")
+        return
+
+    print(f"\n[PERFIL] Puntos calientes ({perfil}):")
+    with open(input_file, encoding='utf-8') as f:
+        reporte(leer_perfil(perfil), f.read())
+
+
+def ejecutar_opcion_10():
+    input_file = input("Ingrese el archivo fuente (.txt): ").strip()
+    if not input_file.endswith('.txt'):
+        input_file += '.txt'
+    if not os.path.exists(input_file):
+        print("[ERROR] Archivo no encontrado.")
+        return
+
+    perfil = ruta_perfil(input_file)
+    if not os.path.exists(perfil):
+        print(f"[ERROR] No existe {perfil}: ejecute primero la opción 9.")
+        return
+
+    print(f"[INFO] Aplicando el perfil {perfil}...")
+    module = generar_llvm(input_file, pgo_profile=leer_perfil(perfil))
+    if not module:
+        return
+
+    base = os.path.splitext(input_file)[0]
+    output_bc = f"{base}_pgo.bc"
+    guardar_bitcode(module, output_bc)
+    opt_output = f"{base}_pgo_opt-O2.bc"
+    optimizar_bitcode(output_bc, "-O2", opt_output)
+    ejecutar_con_lli(opt_output)
+
+def ejecutar_opcion_11():
+    input_file = input("Ingrese el archivo fuente (.txt): ").strip()
+    if not input_file.endswith('.txt'):
+        input_file += '.txt'
+    if not os.path.exists(input_file):
+        print("[ERROR] Archivo no encontrado.")
+        return
+
+    inicio = time.time()
+    module = generar_llvm_en_flujo(input_file)
+    if not module:
+        return
+    print(f"[INFO] Compilación en flujo completada en {time.time() - inicio:.2f} segundos")
+
+    # Bitcode y no .ll: el texto de un módulo enorme sería otra copia en memoria
+    output_bc = os.path.splitext(input_file)[0] + ".bc"
+    guardar_bitcode(module, output_bc)
+    ejecutar_con_lli(output_bc)
+
+
 def main():
     while True:
         mostrar_menu()
@@ -312,6 +535,16 @@ def main():
         elif opcion == "6":
             ejecutar_opcion_6()
         elif opcion == "7":
+            ejecutar_opcion_7()
+        elif opcion == "8":
+            ejecutar_opcion_8()
+        elif opcion == "9":
+            ejecutar_opcion_9()
+        elif opcion == "10":
+            ejecutar_opcion_10()
+        elif opcion == "11":
+            ejecutar_opcion_11()
+        elif opcion == "12":
             print("Saliendo del compilador.")
             break
         else:
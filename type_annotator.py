@@ -0,0 +1,207 @@
+#PASADA DE ANOTACION DE TIPOS SOBRE EL AST
+#Recorre el AST una sola vez y guarda en cada expresión su tipo ('entero',
+#'decimal', 'bool', 'cadena') en el atributo 'type'. Las operaciones binarias
+#guardan además 'operand_type': el tipo al que se convierten ambos operandos.
+#Las declaraciones inferidas ('var') quedan tipadas en DeclarationNode.type,
+#así LLVMGenerator elige instrucciones, conversiones y formatos sin volver a
+#deducirlos de los tipos LLVM.
+from ast_builder import (
+    DeclarationNode,
+    BlockNode,
+    IfNode,
+    ForNode,
+    WhileNode,
+    DoWhileNode,
+    ReturnNode,
+    PrintNode,
+    BinaryOpNode,
+    UnaryOpNode,
+    NumberNode,
+    BooleanNode,
+    StringNode,
+    VariableNode,
+    AssignmentNode,
+    FunctionCallNode,
+)
+from symbol_table import SymbolTable
+
+ARITHMETIC_OPS = ('+', '-', '*', '/', '%')
+COMPARISON_OPS = ('<', '>', '<=', '>=', '==', '!=')
+LOGICAL_OPS = ('&&', '||')
+
+
+def promote(left_type, right_type, op=None):
+    """Tipo común de dos operandos numéricos; la aritmética entre bool se hace en entero"""
+    if 'decimal' in (left_type, right_type):
+        return 'decimal'
+    if left_type == right_type and not (left_type == 'bool' and op in ARITHMETIC_OPS):
+        return left_type
+    return 'entero'
+
+
+class TypeAnnotator:
+    def annotate(self, program_node):
+        """Anota el programa completo y lo retorna"""
+        self.symbols = SymbolTable()
+        self.functions = {func.name: func.return_type for func in program_node.functions}
+
+        for decl in program_node.globals:
+            self._statement(decl)
+
+        for func in program_node.functions:
+            self._function(func)
+
+        self._statement(program_node.block)
+        program_node.type = 'void'
+        return program_node
+
+    def annotate_function(self, func_node, functions, global_types):
+        """
+        Anota una función aislada (compilación por partes).
+        'functions' mapea nombre -> tipo de retorno y 'global_types' nombre -> tipo.
+        """
+        self.symbols = SymbolTable()
+        self.functions = functions
+        for name, var_type in global_types.items():
+            self.symbols.declare(name, var_type)
+        self._function(func_node)
+        return func_node
+
+    def _function(self, func):
+        self.symbols.enter_scope()
+        for param in func.parameters:
+            self.symbols.declare(param.identifier, param.var_type)
+        self._statement(func.block)
+        self.symbols.exit_scope()
+
+    # ========================
+    # SENTENCIAS
+    # ========================
+
+    def _statement(self, node):
+        if node is None:
+            return
+        handler = self._statement_handlers.get(type(node))
+        if handler:
+            handler(self, node)
+        else:
+            self._expression(node)  # sentencia de expresión
+
+    def _declaration(self, node):
+        expr_type = self._expression(node.expr) if node.expr else None
+        node.type = expr_type if node.var_type in ("inferido", "auto") else node.var_type
+        self.symbols.declare(node.identifier, node.type)
+
+    def _block(self, node):
+        self.symbols.enter_scope()
+        for stmt in node.statements:
+            self._statement(stmt)
+        self.symbols.exit_scope()
+
+    def _if(self, node):
+        self._expression(node.condition)
+        self._statement(node.then_stmt)
+        self._statement(node.else_stmt)
+
+    def _for(self, node):
+        self._statement(node.init)
+        self._expression(node.condition)
+        self._expression(node.update)
+        self._statement(node.body)
+
+    def _while(self, node):
+        self._expression(node.condition)
+        self._statement(node.body)
+
+    def _return(self, node):
+        self._expression(node.expr)
+
+    def _print(self, node):
+        for arg in node.args:
+            self._expression(arg)
+
+    _statement_handlers = {
+        DeclarationNode: _declaration,
+        BlockNode: _block,
+        IfNode: _if,
+        ForNode: _for,
+        WhileNode: _while,
+        DoWhileNode: _while,
+        ReturnNode: _return,
+        PrintNode: _print,
+    }
+
+    # ========================
+    # EXPRESIONES
+    # ========================
+
+    def _expression(self, node):
+        if node is None:
+            return None
+        node.type = self._expression_handlers[type(node)](self, node)
+        return node.type
+
+    def _number(self, node):
+        return 'entero' if isinstance(node.value, int) else 'decimal'
+
+    def _boolean(self, node):
+        return 'bool'
+
+    def _string(self, node):
+        return 'cadena'
+
+    def _variable(self, node):
+        return self._lookup(node.name)
+
+    def _assignment(self, node):
+        self._expression(node.expr)
+        # El valor de la asignación es el ya convertido al tipo de la variable
+        return self._lookup(node.name)
+
+    def _binary(self, node):
+        left = self._expression(node.left)
+        right = self._expression(node.right)
+        op = node.op
+
+        if op == '+' and left == 'cadena' and right == 'cadena':
+            node.operand_type = 'cadena'
+            return 'cadena'
+        if op in LOGICAL_OPS:
+            node.operand_type = 'bool'
+            return 'bool'
+        if op == '^':
+            node.operand_type = 'decimal'
+            return 'decimal'
+
+        node.operand_type = promote(left, right, op)
+        if op in COMPARISON_OPS:
+            return 'bool'
+        return node.operand_type
+
+    def _unary(self, node):
+        operand = self._expression(node.operand)
+        return 'bool' if node.op == '!' else operand
+
+    def _call(self, node):
+        for arg in node.args:
+            self._expression(arg)
+        if node.name not in self.functions:
+            raise RuntimeError(f"Función '{node.name}' no definida")
+        return self.functions[node.name]
+
+    def _lookup(self, name):
+        var_type = self.symbols.lookup(name)
+        if var_type is None:
+            raise RuntimeError(f"Variable '{name}' no definida")
+        return var_type
+
+    _expression_handlers = {
+        NumberNode: _number,
+        BooleanNode: _boolean,
+        StringNode: _string,
+        VariableNode: _variable,
+        AssignmentNode: _assignment,
+        BinaryOpNode: _binary,
+        UnaryOpNode: _unary,
+        FunctionCallNode: _call,
+    }